@@ -0,0 +1,106 @@
+"""
+CV Analysis Worker
+Processes CVs queued by /api/analyze-cv (text extraction, OCR, ML recommendations)
+outside the gunicorn web workers, so browsing is never starved by slow analyses.
+When no analysis is waiting it builds admin CV exports (/api/admin/cvs/export),
+which can run longer than a web request may, and deletes expired export files.
+Several workers can run side by side.
+
+Usage:
+    python analysis_worker.py
+"""
+import logging
+import signal
+import time
+from app import create_app, db
+from app.utils.cv_analysis_queue import claim_next_analysis, process_analysis
+from app.utils.cv_export import claim_next_export, expire_exports, process_export
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('analysis_worker.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+running = True
+
+EXPORT_CLEANUP_INTERVAL = 3600  # seconds between expired export sweeps
+
+
+def stop(signum, frame):
+    """Finish the current analysis, then exit"""
+    global running
+    logger.info("🛑 Stop requested, finishing current analysis...")
+    running = False
+
+
+def run_next_export() -> bool:
+    """Build one queued CV export, if any; returns whether there was one"""
+    try:
+        export = claim_next_export()
+    except Exception as e:
+        logger.error(f"❌ Could not claim CV export: {str(e)}", exc_info=True)
+        db.session.rollback()
+        return False
+    if export is None:
+        return False
+    
+    started = time.monotonic()
+    logger.info(f"▶️  CV export {export.id} claimed ({len(export.cv_ids)} CVs, attempt {export.attempts})")
+    process_export(export)
+    logger.info(f"✅ CV export {export.id} {export.status} in {time.monotonic() - started:.1f}s")
+    return True
+
+
+def main():
+    app = create_app()
+    poll_interval = app.config.get('ANALYSIS_POLL_INTERVAL', 2)
+    
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    
+    logger.info("🚀 CV analysis worker started")
+    
+    next_cleanup = 0
+    with app.app_context():
+        while running:
+            if time.monotonic() >= next_cleanup:
+                next_cleanup = time.monotonic() + EXPORT_CLEANUP_INTERVAL
+                try:
+                    expired = expire_exports()
+                    if expired:
+                        logger.info(f"🧹 Deleted {expired} expired CV export(s)")
+                except Exception as e:
+                    logger.error(f"❌ Could not expire CV exports: {str(e)}", exc_info=True)
+                    db.session.rollback()
+            
+            try:
+                analysis = claim_next_analysis()
+            except Exception as e:
+                logger.error(f"❌ Could not claim analysis: {str(e)}", exc_info=True)
+                db.session.rollback()
+                time.sleep(poll_interval)
+                continue
+            
+            if analysis is None:
+                # Analyses first: users wait on them, exports are fetched later
+                if run_next_export():
+                    continue
+                time.sleep(poll_interval)
+                continue
+            
+            started = time.monotonic()
+            logger.info(f"▶️  Analysis {analysis.id} claimed (attempt {analysis.attempts})")
+            process_analysis(analysis)
+            logger.info(f"✅ Analysis {analysis.id} {analysis.status} in {time.monotonic() - started:.1f}s")
+    
+    logger.info("👋 CV analysis worker stopped")
+
+
+if __name__ == "__main__":
+    main()
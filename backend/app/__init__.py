@@ -59,7 +59,7 @@ def create_app(config_name=None):
     # Upload folder
     upload_folder = app.config.get('UPLOAD_FOLDER', os.path.join(os.getcwd(), 'uploads'))
     os.makedirs(upload_folder, exist_ok=True)
-    for sub in ['cvs', 'profiles', 'logos']:
+    for sub in ['cvs', 'profiles', 'logos', 'analyses']:
         os.makedirs(os.path.join(upload_folder, sub), exist_ok=True)
     
     # Register blueprints
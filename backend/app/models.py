@@ -324,3 +324,190 @@ class JobNotification(db.Model):
             'is_read': self.is_read,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+
+class CVAnalysis(db.Model):
+    __tablename__ = 'cv_analyses'
+    
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = db.Column(UUID(as_uuid=True), db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    filename = db.Column(db.String(255), nullable=False)  # Original (secured) upload name
+    file_path = db.Column(db.String(500), nullable=True)  # Upload waiting to be analyzed, removed once processed
+    content_type = db.Column(db.String(100), nullable=True)
+    status = db.Column(db.String(20), default='queued', nullable=False, index=True)  # 'queued', 'processing', 'completed', 'failed'
+    stage = db.Column(db.String(50), default='queued', nullable=False)  # Progress: 'queued', 'extracting', 'recommending', 'saving', 'done'
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    result = db.Column(db.JSON, nullable=True)  # Same payload the synchronous endpoint used to return
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    def to_dict(self):
+        return {
+            'analysis_id': str(self.id),
+            'status': self.status,
+            'stage': self.stage,
+            'filename': self.filename,
+            'result': self.result if self.status in ('completed', 'failed') else None,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+
+class CVExport(db.Model):
+    """Admin bulk CV export, built into a ZIP by analysis_worker.py and downloaded once finished"""
+    __tablename__ = 'cv_exports'
+    
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = db.Column(UUID(as_uuid=True), db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)  # Requesting admin
+    cv_ids = db.Column(db.JSON, nullable=False)  # Selected CV ids, in archive order
+    status = db.Column(db.String(20), default='queued', nullable=False, index=True)  # 'queued', 'processing', 'completed', 'failed', 'expired'
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    file_path = db.Column(db.String(500), nullable=True)  # Finished ZIP, removed after CV_EXPORT_KEEP_HOURS
+    file_size = db.Column(db.BigInteger, nullable=True)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    
+    def to_dict(self):
+        return {
+            'export_id': str(self.id),
+            'status': self.status,
+            'cv_count': len(self.cv_ids or []),
+            'file_size': self.file_size,
+            'error': self.error,
+            'download_url': f'/api/admin/cvs/exports/{self.id}/download' if self.status == 'completed' else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+class ScrapeState(db.Model):
+    """Crawl frontier: job detail pages already scraped, so later runs can skip them"""
+    __tablename__ = 'scrape_state'
+    __table_args__ = (db.UniqueConstraint('source', 'url', name='uq_scrape_state_source_url'),)
+    
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    source = db.Column(db.String(50), nullable=False)  # e.g. 'bongthom'
+    url = db.Column(db.String(500), nullable=False)  # Job detail page
+    content_hash = db.Column(db.String(64), nullable=True)  # sha256 of the parsed page, to detect edits on re-fetch
+    positions = db.Column(db.Integer, default=0, nullable=False)  # Positions found on the page
+    first_seen_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    last_seen_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # Last time it was on a listing page
+    last_fetched_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # Last time the page itself was downloaded
+    
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'source': self.source,
+            'url': self.url,
+            'content_hash': self.content_hash,
+            'positions': self.positions,
+            'first_seen_at': self.first_seen_at.isoformat() if self.first_seen_at else None,
+            'last_seen_at': self.last_seen_at.isoformat() if self.last_seen_at else None,
+            'last_fetched_at': self.last_fetched_at.isoformat() if self.last_fetched_at else None
+        }
+
+
+class ScrapeRun(db.Model):
+    """One scraper run of one source: where the time went, and what came of it"""
+    __tablename__ = 'scrape_runs'
+    
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    source = db.Column(db.String(50), nullable=False, index=True)  # e.g. 'bongthom'
+    status = db.Column(db.String(20), default='running', nullable=False)  # 'running', 'completed', 'failed'
+    started_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    duration_seconds = db.Column(db.Float, nullable=True)  # Wall clock, start to finish
+    # Seconds spent per stage; import and notification run alongside the crawl, so they can add up to more than the duration
+    fetch_seconds = db.Column(db.Float, default=0, nullable=False)  # Page loads (HTTP and Chrome)
+    parse_seconds = db.Column(db.Float, default=0, nullable=False)  # Listing/detail parsing
+    db_check_seconds = db.Column(db.Float, default=0, nullable=False)  # scrape_state lookups of known pages
+    import_seconds = db.Column(db.Float, default=0, nullable=False)  # Cleaning, duplicate check and insert
+    notify_seconds = db.Column(db.Float, default=0, nullable=False)  # Matching new jobs against CVs and alerts
+    first_notification_seconds = db.Column(db.Float, nullable=True)  # From start to the first notifications
+    pages = db.Column(db.Integer, default=0, nullable=False)  # Listing pages walked
+    details_fetched = db.Column(db.Integer, default=0, nullable=False)  # Detail pages downloaded
+    known_pages = db.Column(db.Integer, default=0, nullable=False)  # Detail pages skipped or unchanged thanks to scrape_state
+    jobs_scraped = db.Column(db.Integer, default=0, nullable=False)
+    duplicates = db.Column(db.Integer, default=0, nullable=False)
+    imported = db.Column(db.Integer, default=0, nullable=False)
+    failed = db.Column(db.Integer, default=0, nullable=False)  # Jobs that could not be imported
+    notifications_created = db.Column(db.Integer, default=0, nullable=False)
+    errors = db.Column(db.Integer, default=0, nullable=False)  # Unavailable pages and failed batches
+    error = db.Column(db.Text, nullable=True)  # What stopped the crawl, if anything
+    
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'source': self.source,
+            'status': self.status,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'duration_seconds': self.duration_seconds,
+            'timings': {
+                'fetch': self.fetch_seconds,
+                'parse': self.parse_seconds,
+                'db_check': self.db_check_seconds,
+                'import': self.import_seconds,
+                'notify': self.notify_seconds,
+                'first_notification': self.first_notification_seconds
+            },
+            'counts': {
+                'pages': self.pages,
+                'details_fetched': self.details_fetched,
+                'known_pages': self.known_pages,
+                'jobs_scraped': self.jobs_scraped,
+                'duplicates': self.duplicates,
+                'imported': self.imported,
+                'failed': self.failed,
+                'notifications_created': self.notifications_created,
+                'errors': self.errors
+            },
+            'error': self.error
+        }
+
+
+class JobRun(db.Model):
+    """One execution of a scheduled job (scheduler.py), by whichever worker replica ran it"""
+    __tablename__ = 'job_runs'
+    
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_id = db.Column(db.String(100), nullable=False, index=True)  # APScheduler job id, e.g. 'job_scraper'
+    status = db.Column(db.String(20), default='running', nullable=False)  # 'running', 'completed', 'failed', 'skipped'
+    trigger = db.Column(db.String(20), default='schedule', nullable=False)  # 'schedule', or 'catch_up' after an election
+    worker = db.Column(db.String(255), nullable=False)  # host:pid of the replica
+    started_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)  # Refreshed by the leader while the job runs
+    finished_at = db.Column(db.DateTime, nullable=True)
+    result = db.Column(db.JSON, nullable=True)  # What the job returned, e.g. scraper summaries per source
+    error = db.Column(db.Text, nullable=True)
+    
+    def to_dict(self):
+        return {
+            'id': str(self.id),
+            'job_id': self.job_id,
+            'status': self.status,
+            'trigger': self.trigger,
+            'worker': self.worker,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'result': self.result,
+            'error': self.error
+        }
+
+
+class MLRecommendationCache(db.Model):
+    """ML API recommendations per CV text, shared by every API and worker process (app/utils/ml_client.py)"""
+    __tablename__ = 'ml_recommendation_cache'
+    
+    text_hash = db.Column(db.String(64), primary_key=True)  # sha256 of the normalized CV text
+    recommendations = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
@@ -1,14 +1,22 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, send_file
 from app import db
-from app.models import User, Job, Application
+from app.models import User, Job, Application, CV, CVExport, Profile, ScrapeRun
 from app.utils import admin_required
-from flask_jwt_extended import jwt_required
+from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy import func, extract
 from datetime import datetime, timedelta
 from werkzeug.utils import secure_filename
 import os
+import uuid
 from flask import current_app
 
+# Optional: the CV export renders PDFs with reportlab
+try:
+    from app.utils.cv_export import CV_EXPORT_MAX_CVS, enqueue_export  # type: ignore
+except Exception:  # pragma: no cover
+    CV_EXPORT_MAX_CVS = 0
+    enqueue_export = None
+
 bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
 
@@ -467,3 +475,160 @@ def upload_logo():
         
     except Exception as e:
         return jsonify({'success': False, 'message': f'An error occurred: {str(e)}'}), 500
+
+
+@bp.route('/scrape-runs', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_scrape_runs():
+    """Recent scraper runs with per-stage timings and counters, newest first"""
+    try:
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
+        source = request.args.get('source', '', type=str)
+        status = request.args.get('status', '', type=str)
+        
+        query = ScrapeRun.query
+        
+        if source:
+            query = query.filter_by(source=source)
+        
+        if status:
+            query = query.filter_by(status=status)
+        
+        pagination = query.order_by(ScrapeRun.started_at.desc()).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        
+        return jsonify({
+            'success': True,
+            'runs': [run.to_dict() for run in pagination.items],
+            'total': pagination.total,
+            'page': pagination.page,
+            'pages': pagination.pages
+        }), 200
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'An error occurred: {str(e)}'}), 500
+
+
+@bp.route('/cvs/export', methods=['POST'])
+@jwt_required()
+@admin_required
+def export_cvs():
+    """
+    Queue a ZIP of CVs, selected by id list or by filter
+
+    Body: {"cv_ids": [...]} or any of {"search", "status", "active_only",
+    "uploaded_from", "uploaded_to"}. Stored uploads are included as-is;
+    CVs without one are rendered to PDF. Returns 202; analysis_worker.py
+    builds the archive, poll GET /api/admin/cvs/exports/<export_id> and
+    download it from its download_url.
+    """
+    try:
+        if enqueue_export is None:
+            return jsonify({'success': False, 'message': 'CV export is not available (reportlab not installed)'}), 503
+        
+        data = request.get_json(silent=True) or {}
+        query = db.session.query(CV.id) \
+            .join(Profile, CV.profile_id == Profile.id) \
+            .join(User, Profile.user_id == User.id)
+        
+        cv_ids = data.get('cv_ids')
+        if cv_ids:
+            try:
+                cv_ids = [uuid.UUID(str(cv_id)) for cv_id in cv_ids]
+            except ValueError:
+                return jsonify({'success': False, 'message': 'Invalid CV id in cv_ids'}), 400
+            query = query.filter(CV.id.in_(cv_ids))
+        else:
+            search = (data.get('search') or '').strip()
+            if search:
+                query = query.filter(
+                    (User.fullname.ilike(f'%{search}%')) |
+                    (User.email.ilike(f'%{search}%')) |
+                    (CV.name.ilike(f'%{search}%'))
+                )
+            if data.get('status'):
+                query = query.filter(CV.status == data['status'])
+            if data.get('active_only'):
+                query = query.filter(CV.is_active.is_(True))
+            try:
+                if data.get('uploaded_from'):
+                    query = query.filter(CV.upload_date >= datetime.fromisoformat(data['uploaded_from']))
+                if data.get('uploaded_to'):
+                    query = query.filter(CV.upload_date <= datetime.fromisoformat(data['uploaded_to']))
+            except ValueError:
+                return jsonify({'success': False, 'message': 'Invalid date format, use YYYY-MM-DD'}), 400
+        
+        ids = [row[0] for row in query.order_by(CV.upload_date.desc()).limit(CV_EXPORT_MAX_CVS + 1)]
+        if not ids:
+            return jsonify({'success': False, 'message': 'No CVs match the selection'}), 404
+        if len(ids) > CV_EXPORT_MAX_CVS:
+            return jsonify({
+                'success': False,
+                'message': f'Selection has more than {CV_EXPORT_MAX_CVS} CVs, please narrow it down'
+            }), 400
+        
+        # Ordered as requested when ids were given
+        if cv_ids:
+            found = set(ids)
+            ids = [cv_id for cv_id in dict.fromkeys(cv_ids) if cv_id in found]
+        
+        export = enqueue_export(get_jwt_identity(), ids)
+        return jsonify({
+            'success': True,
+            'message': f'Export of {len(ids)} CVs queued',
+            'export': export.to_dict(),
+            'status_url': f'/api/admin/cvs/exports/{export.id}'
+        }), 202
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'An error occurred: {str(e)}'}), 500
+
+
+def _get_export(export_id):
+    try:
+        return db.session.get(CVExport, uuid.UUID(export_id))
+    except ValueError:
+        return None
+
+
+@bp.route('/cvs/exports/<export_id>', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_cv_export(export_id):
+    """Status of a queued CV export, with its download_url once built"""
+    try:
+        export = _get_export(export_id)
+        if not export:
+            return jsonify({'success': False, 'message': 'Export not found'}), 404
+        
+        return jsonify({'success': True, 'export': export.to_dict()}), 200
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'An error occurred: {str(e)}'}), 500
+
+
+@bp.route('/cvs/exports/<export_id>/download', methods=['GET'])
+@jwt_required()
+@admin_required
+def download_cv_export(export_id):
+    """The finished ZIP of a CV export"""
+    try:
+        export = _get_export(export_id)
+        if not export:
+            return jsonify({'success': False, 'message': 'Export not found'}), 404
+        if export.status == 'expired':
+            return jsonify({'success': False, 'message': 'Export has expired, please request it again'}), 410
+        if export.status != 'completed' or not export.file_path or not os.path.exists(export.file_path):
+            return jsonify({'success': False, 'message': f'Export is not ready (status: {export.status})'}), 409
+        
+        filename = f"cvs_{export.created_at.strftime('%Y%m%d_%H%M%S')}.zip"
+        response = send_file(export.file_path, mimetype='application/zip', as_attachment=True,
+                             download_name=filename, conditional=True)
+        response.headers['X-CV-Count'] = str(len(export.cv_ids))
+        return response
+        
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'An error occurred: {str(e)}'}), 500
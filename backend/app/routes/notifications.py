@@ -171,9 +171,11 @@ def get_unread_count():
 
 
 
-def check_job_alerts(job_id):
+def check_job_alerts(job_id, alerts=None, commit=True):
     """
     Check if a new job matches any user's JobAlert and create notifications.
+    Batch callers pass the active `alerts` once and commit themselves.
+    Returns the number of notifications created.
     """
     try:
         from app.models import JobAlert
@@ -185,7 +187,7 @@ def check_job_alerts(job_id):
         job = Job.query.get(job_id)
         if not job:
             print(f"INFO: Job {job_id} not found in database for alert check")
-            return
+            return 0
         
         # Prepare job text for matching
         job_title = job.title.lower()
@@ -194,7 +196,8 @@ def check_job_alerts(job_id):
         combined_text = f"{job_title} {job_desc} {job_reqs}"
         
         # Get all active job alerts
-        alerts = JobAlert.query.filter_by(is_active=True).all()
+        if alerts is None:
+            alerts = JobAlert.query.filter_by(is_active=True).all()
         print(f"INFO: Checking job alerts for job: '{job.title}' across {len(alerts)} active alerts")
         
         notifications_count = 0
@@ -273,13 +276,16 @@ def check_job_alerts(job_id):
             else:
                 print(f"DEBUG: Final match for alert '{alert.title}' is False")
         
-        db.session.commit()
+        if commit:
+            db.session.commit()
         if notifications_count > 0:
             print(f"[SUCCESS]: Created {notifications_count} job alert notifications for job: '{job.title}'")
+        return notifications_count
             
     except Exception as e:
         db.session.rollback()
         print(f"[ERROR]: Error checking job alerts: {str(e)}")
+        return 0
 
 
 def check_and_create_notifications(job_id):
@@ -389,3 +395,105 @@ def check_and_create_notifications(job_id):
 
         db.session.rollback()
         print(f"[ERROR]: Error creating notifications: {str(e)}")
+
+
+def check_and_create_notifications_batch(job_ids, chunk_size=500):
+    """
+    check_and_create_notifications for many new jobs (e.g. a bulk import):
+    CV keywords, keyword patterns and job alerts are loaded once instead of
+    once per job, and notifications are written per chunk of jobs.
+    Returns the number of notifications created.
+    """
+    from app.models import JobAlert
+
+    def is_khmer(text):
+        return any('\u1780' <= char <= '\u17FF' for char in text)
+
+    try:
+        job_ids = [UUID(job_id) if isinstance(job_id, str) else job_id for job_id in job_ids]
+        if not job_ids:
+            return 0
+
+        # (user_id, cv_id, notification_type, keywords) - same CV selection as the per-job check:
+        # each profile's active CV, plus all of its inactive CVs
+        rows = db.session.query(Profile.user_id, CV.id, CV.is_active, CVKeyword.keywords) \
+            .join(CV, CV.profile_id == Profile.id) \
+            .join(CVKeyword, CVKeyword.cv_id == CV.id) \
+            .all()
+        cv_sets = []
+        seen_active = set()
+        seen_cvs = set()
+        for user_id, cv_id, is_active, keywords in rows:
+            if not keywords or cv_id in seen_cvs:
+                continue
+            seen_cvs.add(cv_id)
+            if is_active:
+                if user_id in seen_active:
+                    continue
+                seen_active.add(user_id)
+            cv_sets.append((user_id, cv_id, 'active_cv' if is_active else 'past_cv', keywords))
+
+        patterns = {}
+        for _, _, _, keywords in cv_sets:
+            for keyword in keywords:
+                keyword_lower = keyword.lower()
+                if keyword_lower not in patterns:
+                    patterns[keyword_lower] = (re.compile(r'\b' + re.escape(keyword_lower) + r'\b'), is_khmer(keyword_lower))
+
+        alerts = JobAlert.query.filter_by(is_active=True).all()
+        print(f"INFO: Checking notifications for {len(job_ids)} jobs across {len(cv_sets)} CVs and {len(alerts)} alerts")
+
+        notifications_count = 0
+        alert_count = 0
+        for i in range(0, len(job_ids), chunk_size):
+            chunk = job_ids[i:i + chunk_size]
+            jobs = Job.query.filter(Job.id.in_(chunk)).all()
+            existing = {
+                (n.user_id, n.job_id, n.cv_id if n.notification_type == 'past_cv' else None, n.notification_type)
+                for n in JobNotification.query.filter(
+                    JobNotification.job_id.in_(chunk),
+                    JobNotification.notification_type.in_(['active_cv', 'past_cv'])
+                )
+            }
+
+            for job in jobs:
+                combined_text = f"{job.title.lower()} {(job.description or '').lower()} {(job.requirements or '').lower()}"
+                for user_id, cv_id, notification_type, keywords in cv_sets:
+                    matched_keywords = []
+                    for keyword in keywords:
+                        keyword_lower = keyword.lower()
+                        pattern, khmer = patterns[keyword_lower]
+                        if pattern.search(combined_text) or (khmer and keyword_lower in combined_text):
+                            matched_keywords.append(keyword)
+                    if not matched_keywords:
+                        continue
+
+                    key = (user_id, job.id, cv_id if notification_type == 'past_cv' else None, notification_type)
+                    if key in existing:
+                        continue
+                    existing.add(key)
+                    db.session.add(JobNotification(
+                        user_id=user_id,
+                        job_id=job.id,
+                        cv_id=cv_id,
+                        notification_type=notification_type,
+                        matched_keywords=matched_keywords,
+                        is_read=False
+                    ))
+                    notifications_count += 1
+
+            db.session.commit()
+
+            for job in jobs:
+                alert_count += check_job_alerts(job.id, alerts=alerts, commit=False)
+            db.session.commit()
+            # The commit expired the alerts: reload them with one query, not one per alert
+            alerts = JobAlert.query.filter_by(is_active=True).all()
+
+        print(f"[SUCCESS]: Created {notifications_count} CV notifications for {len(job_ids)} jobs")
+        return notifications_count + alert_count
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"[ERROR]: Error creating notifications: {str(e)}")
+        return 0
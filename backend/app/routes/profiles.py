@@ -2,12 +2,11 @@ from flask import Blueprint, request, jsonify, current_app, send_file
 from app import db
 from app.models import Profile, User, CV, CVKeyword
 from app.utils import user_required, allowed_file
+from app.utils.ml_client import MLServiceError, MLServiceTimeout, MLServiceUnavailable, get_ml_client
 from flask_jwt_extended import jwt_required, get_jwt_identity
 import os
 from werkzeug.utils import secure_filename
 import uuid
-import requests
-from io import BytesIO
 
 # Optional, heavy dependencies (docx/pdf/ocr + reportlab). These are only
 # needed for CV upload/parsing and PDF export. Make them optional so the API
@@ -18,22 +17,11 @@ except Exception:  # pragma: no cover
     extract_cv_text = None
 
 try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib import colors
+    from app.utils.cv_pdf import content_hash, render_cv_pdf, resolve_cv_content  # type: ignore
 except Exception:  # pragma: no cover
-    letter = None
-    getSampleStyleSheet = None
-    ParagraphStyle = None
-    inch = None
-    SimpleDocTemplate = None
-    Paragraph = None
-    Spacer = None
-    Table = None
-    TableStyle = None
-    colors = None
+    content_hash = None
+    render_cv_pdf = None
+    resolve_cv_content = None
 
 bp = Blueprint('profiles', __name__, url_prefix='/api')
 
@@ -316,71 +304,64 @@ def analyze_existing_cv(cv_id):
             }), 400
         
         # Send to ML API for analysis
-        ML_API_URL = 'http://138.197.13.244:8000/upload'
-        
         try:
-            # Create a text file from extracted data
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as tmp_file:
-                tmp_file.write(extracted_text)
-                temp_path = tmp_file.name
-            
-            # Send to ML API
-            with open(temp_path, 'rb') as f:
-                files = {'file': (f'{cv.name}.txt', f, 'text/plain')}
-                ml_response = requests.post(ML_API_URL, files=files, timeout=180)
-            
-            os.unlink(temp_path)
+            recommendations, recommendation_source, _ = get_ml_client().recommend_or_fallback(
+                extracted_text, f'{cv.name}.txt'
+            )
             
-            if ml_response.status_code == 200:
-                ml_data = ml_response.json()
-                recommendations = ml_data.get('recommendations', [])
+            if recommendations:
+                # Save or update keywords
+                keywords = [rec.get('job_title', '') for rec in recommendations]
                 
-                if recommendations:
-                    # Save or update keywords
-                    keywords = [rec.get('job_title', '') for rec in recommendations]
-                    
-                    existing_keywords = CVKeyword.query.filter_by(cv_id=cv.id).first()
-                    if existing_keywords:
-                        existing_keywords.keywords = keywords
-                        existing_keywords.extracted_text = extracted_text[:5000]
-                        existing_keywords.extraction_method = 'text'
-                    else:
-                        cv_keyword = CVKeyword(
-                            cv_id=cv.id,
-                            keywords=keywords,
-                            extracted_text=extracted_text[:5000],
-                            extraction_method='text'
-                        )
-                        db.session.add(cv_keyword)
-                    
-                    db.session.commit()
-                    
-                    return jsonify({
-                        'success': True,
-                        'keywords': keywords,
-                        'cv_id': str(cv.id),
-                        'cv_name': cv.name,
-                        'extraction_method': 'text',
-                        'recommendations': recommendations
-                    }), 200
+                existing_keywords = CVKeyword.query.filter_by(cv_id=cv.id).first()
+                if existing_keywords:
+                    existing_keywords.keywords = keywords
+                    existing_keywords.extracted_text = extracted_text[:5000]
+                    existing_keywords.extraction_method = 'text'
                 else:
-                    return jsonify({
-                        'success': False,
-                        'message': 'ML API returned no recommendations'
-                    }), 400
+                    cv_keyword = CVKeyword(
+                        cv_id=cv.id,
+                        keywords=keywords,
+                        extracted_text=extracted_text[:5000],
+                        extraction_method='text'
+                    )
+                    db.session.add(cv_keyword)
+                
+                db.session.commit()
+                
+                return jsonify({
+                    'success': True,
+                    'keywords': keywords,
+                    'cv_id': str(cv.id),
+                    'cv_name': cv.name,
+                    'extraction_method': 'text',
+                    'recommendations': recommendations,
+                    'recommendation_source': recommendation_source
+                }), 200
             else:
                 return jsonify({
                     'success': False,
-                    'message': f'ML API error: {ml_response.status_code}'
+                    'message': 'ML API returned no recommendations'
                 }), 400
                 
-        except requests.exceptions.Timeout:
+        except MLServiceTimeout:
             return jsonify({
                 'success': False,
                 'message': 'ML API timeout. Please try again.'
             }), 408
             
+        except MLServiceUnavailable as ml_error:
+            return jsonify({
+                'success': False,
+                'message': str(ml_error)
+            }), 503
+            
+        except MLServiceError as ml_error:
+            return jsonify({
+                'success': False,
+                'message': f'ML API error: {str(ml_error)}'
+            }), 400
+            
         except Exception as ml_error:
             return jsonify({
                 'success': False,
@@ -826,135 +807,41 @@ def download_cv(cv_id):
         
         # If CV has a file, send it
         if cv.file_path:
-            filepath = os.path.join(current_app.config['BASE_DIR'], cv.file_path.lstrip('/'))
+            filepath = os.path.join(current_app.root_path, '..', cv.file_path.lstrip('/'))
             if os.path.exists(filepath):
-                return send_file(filepath, as_attachment=True, download_name=f"{cv.name}.pdf")
-        
-        # Generate PDF from CV data (builder_data or extracted_data)
-        builder_data = cv.cv_builder_data or {}
-        extracted = cv.extracted_data or {}
-        
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
-                                topMargin=72, bottomMargin=18)
-        
-        # Container for the 'Flowable' objects
-        elements = []
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#FF8C42'),
-            spaceAfter=30,
-        )
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#FF8C42'),
-            spaceAfter=12,
-            spaceBefore=12,
-        )
-        
-        # Add name and contact info
-        fullname = builder_data.get('fullname') or extracted.get('name') or user.fullname
-        elements.append(Paragraph(fullname or 'Professional CV', title_style))
-        
-        email_val = builder_data.get('email') or extracted.get('email') or profile.email
-        phone_val = builder_data.get('phone') or extracted.get('phone') or profile.phone
-        location_val = builder_data.get('location') or extracted.get('location') or profile.location
-        
-        if email_val or phone_val or location_val:
-            contact_info = []
-            if email_val:
-                contact_info.append(f"Email: {email_val}")
-            if phone_val:
-                contact_info.append(f"Phone: {phone_val}")
-            if location_val:
-                contact_info.append(f"Location: {location_val}")
-            elements.append(Paragraph(" | ".join(contact_info), styles['Normal']))
-            elements.append(Spacer(1, 12))
-        
-        # Professional Summary
-        summary = builder_data.get('professional_summary') or extracted.get('summary') or profile.professional_summary
-        if summary:
-            elements.append(Paragraph("Professional Summary", heading_style))
-            elements.append(Paragraph(summary, styles['Normal']))
-            elements.append(Spacer(1, 12))
-        
-        # Education
-        educations = builder_data.get('educations') or extracted.get('education', [])
-        if educations:
-            elements.append(Paragraph("Education", heading_style))
-            for edu in educations:
-                degree = edu.get('degree', '')
-                institution = edu.get('institution', '')
-                year = edu.get('year', '')
-                description = edu.get('description', '')
-                elements.append(Paragraph(f"<b>{degree}</b> - {institution} ({year})", styles['Normal']))
-                if description:
-                    elements.append(Paragraph(description, styles['Normal']))
-                elements.append(Spacer(1, 6))
-        
-        # Experience
-        experiences = builder_data.get('experiences') or extracted.get('experience', [])
-        if experiences:
-            elements.append(Paragraph("Work Experience", heading_style))
-            for exp in experiences:
-                title = exp.get('title', '')
-                company = exp.get('company', '')
-                duration = exp.get('duration', '')
-                description = exp.get('description', '')
-                elements.append(Paragraph(f"<b>{title}</b> - {company} ({duration})", styles['Normal']))
-                if description:
-                    elements.append(Paragraph(description, styles['Normal']))
-                elements.append(Spacer(1, 6))
-        
-        # Skills
-        skills = builder_data.get('skills', [])
-        if not skills and extracted.get('skills'):
-            skills = [{'name': s, 'level': 'Intermediate'} for s in extracted.get('skills', [])]
-        if skills:
-            elements.append(Paragraph("Skills", heading_style))
-            skills_text = ", ".join([f"{skill.get('name', '')} ({skill.get('level', '')})" for skill in skills])
-            elements.append(Paragraph(skills_text, styles['Normal']))
-            elements.append(Spacer(1, 12))
-        
-        # Languages
-        languages = builder_data.get('languages') or extracted.get('languages', [])
-        if languages:
-            elements.append(Paragraph("Languages", heading_style))
-            lang_text = ", ".join([f"{lang.get('language', '')} ({lang.get('proficiency', '')})" for lang in languages])
-            elements.append(Paragraph(lang_text, styles['Normal']))
-            elements.append(Spacer(1, 12))
-        
-        # Certifications
-        certifications = builder_data.get('certifications') or extracted.get('certifications', [])
-        if certifications:
-            elements.append(Paragraph("Certifications", heading_style))
-            for cert in certifications:
-                name = cert.get('name', '')
-                organization = cert.get('organization', '')
-                year = cert.get('year', '')
-                description = cert.get('description', '')
-                elements.append(Paragraph(f"<b>{name}</b> - {organization} ({year})", styles['Normal']))
-                if description:
-                    elements.append(Paragraph(description, styles['Normal']))
-                elements.append(Spacer(1, 6))
-        
-        # Build PDF
-        doc.build(elements)
-        buffer.seek(0)
-        
-        return send_file(
-            buffer,
+                ext = os.path.splitext(filepath)[1] or '.pdf'
+                response = send_file(filepath, as_attachment=True, download_name=f"{cv.name}{ext}", conditional=True)
+                response.headers['Cache-Control'] = 'private, no-cache'
+                return response
+        
+        if render_cv_pdf is None:
+            return jsonify({'success': False, 'message': 'PDF export is not available (reportlab not installed)'}), 503
+        
+        # Generate PDF from CV data (builder_data or extracted_data). Rendered
+        # PDFs are cached by content hash, which is also the ETag: an unchanged
+        # CV is neither re-rendered nor re-downloaded (304).
+        content = resolve_cv_content(cv, user, profile)
+        etag = content_hash(content)
+        if request.if_none_match.contains(etag):
+            # The client has this version: don't render it (the cached file may have been pruned)
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        
+        pdf_path, etag = render_cv_pdf(content, current_app.config['CV_PDF_CACHE_DIR'])
+        
+        response = send_file(
+            pdf_path,
             mimetype='application/pdf',
             as_attachment=True,
-            download_name=f"{cv.name}.pdf"
+            download_name=f"{cv.name}.pdf",
+            etag=etag,
+            conditional=True
         )
+        # Revalidate every time: the same CV id serves new content after an edit
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
         
     except Exception as e:
         return jsonify({'success': False, 'message': f'An error occurred: {str(e)}'}), 500
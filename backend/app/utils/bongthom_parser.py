@@ -0,0 +1,243 @@
+"""
+BongThom Page Parser
+Pure functions from saved HTML to job fields: no browser, network or
+database. The scraper parses freshly fetched pages with them, and
+reparse_archive.py re-runs them over the raw HTML archive, so a parser fix
+can be applied to past crawls and checked against saved pages offline.
+"""
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+LISTING_LINK_SELECTOR = "a[href*='job_detail']"
+POSITION_SELECTOR = "h3[id^='position-']"
+
+
+def parse_posting_date(text: str, today: Optional[datetime] = None) -> str:
+    """Parse relative posting dates like '2 days ago' or '3 hours', relative to `today` (the fetch time)"""
+    text = text.lower()
+    today = today or datetime.today()
+
+    # Extract number from text
+    num_match = re.search(r"\d+", text)
+    if not num_match:
+        return ""
+
+    if "day" in text:
+        days = int(num_match.group())
+        return (today - timedelta(days=days)).strftime("%Y-%m-%d")
+    elif "hour" in text or "minute" in text:
+        return today.strftime("%Y-%m-%d")
+    else:
+        return ""
+
+
+def parse_listing(html: str, base_url: str, fetched_at: Optional[datetime] = None) -> List[Dict]:
+    """Job announcements on a listing page: url, title, company, deadline, posting date"""
+    soup = BeautifulSoup(html, "html.parser")
+    listings = []
+
+    for box in soup.select(LISTING_LINK_SELECTOR):
+        desc = box.select_one(".desc")
+        if not desc:
+            continue
+
+        # Job list fields
+        job_url = urljoin(base_url.rstrip("/") + "/", box["href"])
+
+        job_title = desc.select_one("h5 span")
+        job_title = job_title.text.strip() if job_title else ""
+
+        company = desc.select_one(".ellipsis-text span")
+        company_name = company.text.strip() if company else ""
+
+        # Extract deadline and posting date from listing
+        deadline = ""
+        posting_date = ""
+
+        for info in desc.select(".info div"):
+            text = info.get_text(strip=True)
+            # Check for deadline (format: DD-MMM-YYYY like "31-Jan-2026")
+            if re.match(r"\d{1,2}-[A-Za-z]{3}-\d{4}", text):
+                deadline = text
+            # Check for posting date (relative time)
+            elif "day" in text.lower() or "hour" in text.lower():
+                posting_date = parse_posting_date(text, fetched_at)
+
+        listings.append({
+            "url": job_url,
+            "job_title": job_title,
+            "company_name": company_name,
+            "deadline": deadline,
+            "posting_date": posting_date,
+        })
+
+    return listings
+
+
+def parse_detail(html: str) -> Dict:
+    """Announcement fields and one dict per position from a job detail page"""
+    detail = BeautifulSoup(html, "html.parser")
+
+    # Extract company logo from detail page
+    logo_elem = detail.select_one('img[src*="library"]')
+    logo_url = logo_elem["src"] if logo_elem else ""
+
+    # Announcement Description
+    ann_desc = detail.select_one("#announcemnt-description + .ql-editor")
+    announcement_description = ann_desc.get_text(" ", strip=True) if ann_desc else ""
+
+    # Contact Info
+    office_address = ""
+    contact_email = ""
+    phone = ""
+    website = ""
+
+    for li in detail.select("ul.no-list li"):
+        text = li.get_text(" ", strip=True)
+        if "@" in text:
+            contact_email = text
+        elif "http" in text:
+            website = text
+        elif re.search(r"\d{3,}", text):
+            phone = text
+        elif "Phnom Penh" in text or "Cambodia" in text:
+            office_address = text
+
+    # Deadline from the detail page, used when the listing has none
+    deadline = ""
+    # Look for explicit labels mentioning deadline
+    cand = detail.find(string=re.compile(r"deadline|application deadline|close date", re.I))
+    if cand:
+        parent_text = cand.parent.get_text(" ", strip=True) if cand.parent else cand
+        m = re.search(r"\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}|\d{4}-\d{2}-\d{2}", parent_text)
+        if m:
+            deadline = m.group()
+
+    # Fallback: search entire detail page for a date-like pattern
+    if not deadline:
+        page_text = detail.get_text(" ", strip=True)
+        m = re.search(r"\d{1,2}-[A-Za-z]{3}-\d{4}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}|\d{4}-\d{2}-\d{2}", page_text)
+        if m:
+            deadline = m.group()
+
+    # Positions loop
+    positions = []
+    for pos in detail.select(POSITION_SELECTOR):
+        pos_id = pos["id"].replace("position-", "")
+        pos_title = pos.get_text(strip=True)
+
+        pos_div = detail.find(id=f"job-detail-pos-{pos_id}")
+        if not pos_div:
+            continue
+
+        location = ""
+        languages = ""
+        career_category = ""
+        schedule = ""
+        salary = ""
+        position_summary = ""
+        duties = ""
+        qualifications = ""
+        skills = ""
+
+        # Key lists
+        for li in pos_div.select("li"):
+            strong = li.find("strong")
+            value = li.find("span", class_="value")
+            if not strong or not value:
+                continue
+
+            label = strong.get_text(strip=True).lower()
+            val = value.get_text(" ", strip=True)
+
+            if "location" in label:
+                location = val
+            elif "languages" in label:
+                languages = val
+            elif "career category" in label:
+                career_category = val
+            elif "schedule" in label:
+                schedule = val
+            elif "salary" in label:
+                salary = val
+
+        # Position Summary
+        summary_div = pos_div.select_one(".ql-editor")
+        if summary_div:
+            position_summary = summary_div.get_text(" ", strip=True)
+
+        # Duties
+        duties_ul = pos_div.find("strong", string=re.compile("Duties"))
+        if duties_ul:
+            ul = duties_ul.find_next("ul")
+            if ul:
+                duties = " | ".join(li.get_text(" ", strip=True) for li in ul.find_all("li"))
+
+        # Qualifications & Skills
+        for strong in pos_div.find_all("strong"):
+            if "Qualifications" in strong.get_text():
+                ul = strong.find_next("ul")
+                if ul:
+                    qualifications = " | ".join(li.get_text(" ", strip=True) for li in ul.find_all("li"))
+
+            if "Skills" in strong.get_text():
+                ul = strong.find_next("ul")
+                if ul:
+                    skills = " | ".join(li.get_text(" ", strip=True) for li in ul.find_all("li"))
+
+        positions.append({
+            "title": pos_title,
+            "location": location,
+            "languages": languages,
+            "career_category": career_category,
+            "schedule": schedule,
+            "salary": salary,
+            "position_summary": position_summary,
+            "duties": duties,
+            "qualifications": qualifications,
+            "skills": skills,
+        })
+
+    return {
+        "logo_url": logo_url,
+        "announcement_description": announcement_description,
+        "office_address": office_address,
+        "contact_email": contact_email,
+        "phone": phone,
+        "website": website,
+        "deadline": deadline,
+        "positions": positions,
+    }
+
+
+def build_job_rows(listing: Dict, detail: Dict, source: str = "BongThom") -> List[Dict]:
+    """One scraped row (the CSV / import columns) per position of an announcement"""
+    deadline = listing["deadline"] or detail["deadline"]
+    return [{
+        "Job Title": pos["title"],
+        "Announcement Job Title": listing["job_title"],
+        "Company Name": listing["company_name"],
+        "Company Logo": detail["logo_url"],
+        "Posting Date": listing["posting_date"],
+        "Deadline": deadline,
+        "Announcement Description": detail["announcement_description"],
+        "Office Address": detail["office_address"],
+        "Contact Email": detail["contact_email"],
+        "Phone": detail["phone"],
+        "Website": detail["website"],
+        "Location": pos["location"],
+        "Languages Required": pos["languages"],
+        "Career Category": pos["career_category"],
+        "Schedule": pos["schedule"],
+        "Salary": pos["salary"],
+        "Position Summary": pos["position_summary"],
+        "Duties & Responsibilities": pos["duties"],
+        "Qualifications": pos["qualifications"],
+        "Skills & Knowledge": pos["skills"],
+        "Source": source,
+        "Job URL": listing["url"]
+    } for pos in detail["positions"]]
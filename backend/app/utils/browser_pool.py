@@ -0,0 +1,182 @@
+"""
+Headless Chrome Pool
+Reusable, lightweight Selenium drivers for the pages the scraper cannot
+read over plain HTTP.
+
+- drivers are started lazily (none at all if no page needs JavaScript) and
+  reused for every page of the run, listing and detail alike
+- images, fonts and stylesheets are never downloaded: blocked through
+  Chrome preferences and the DevTools Network.setBlockedURLs command
+- the 'eager' page-load strategy returns at DOMContentLoaded; callers wait
+  explicitly for the element they need instead of for every subresource
+- up to SCRAPER_BROWSERS drivers render pages in parallel; a driver that
+  crashes is thrown away and replaced on next use
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterable, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridden by Config below)
+SCRAPER_BROWSERS = 2  # Chrome instances rendering in parallel
+SCRAPER_BLOCK_ASSETS = True  # skip images, fonts and stylesheets
+SCRAPER_RENDER_TIMEOUT = 10  # seconds to wait for the awaited element
+SCRAPER_PAGE_LOAD_TIMEOUT = 30  # seconds before a navigation is abandoned
+
+try:
+    from config import Config
+    SCRAPER_BROWSERS = getattr(Config, 'SCRAPER_BROWSERS', SCRAPER_BROWSERS)
+    SCRAPER_BLOCK_ASSETS = getattr(Config, 'SCRAPER_BLOCK_ASSETS', SCRAPER_BLOCK_ASSETS)
+    SCRAPER_RENDER_TIMEOUT = getattr(Config, 'SCRAPER_RENDER_TIMEOUT', SCRAPER_RENDER_TIMEOUT)
+    SCRAPER_PAGE_LOAD_TIMEOUT = getattr(Config, 'SCRAPER_PAGE_LOAD_TIMEOUT', SCRAPER_PAGE_LOAD_TIMEOUT)
+except Exception:
+    pass
+
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+    '*.mp4', '*.webm', '*.mp3',
+]
+
+
+def chrome_options(block_assets: bool = SCRAPER_BLOCK_ASSETS) -> Options:
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-extensions")
+    # Return at DOMContentLoaded; render() waits for the element it needs
+    options.page_load_strategy = 'eager'
+    if block_assets:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+        })
+    return options
+
+
+def new_driver(block_assets: bool = SCRAPER_BLOCK_ASSETS,
+               page_load_timeout: float = SCRAPER_PAGE_LOAD_TIMEOUT) -> webdriver.Chrome:
+    """One headless Chrome with asset blocking applied"""
+    driver = webdriver.Chrome(options=chrome_options(block_assets))
+    driver.set_page_load_timeout(page_load_timeout)
+    if block_assets:
+        # Preferences don't cover every font/CSS request; DevTools blocking does
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.warning(f"⚠️ Could not block assets through DevTools: {str(e)}")
+    return driver
+
+
+class BrowserPool:
+    """Up to `size` reusable drivers; render() borrows one per page"""
+
+    def __init__(self, size: int = SCRAPER_BROWSERS, render_timeout: float = SCRAPER_RENDER_TIMEOUT,
+                 block_assets: bool = SCRAPER_BLOCK_ASSETS):
+        self.size = max(1, size)
+        self.render_timeout = render_timeout
+        self.block_assets = block_assets
+        self._idle = queue.LifoQueue()  # most recently used first: keeps the fewest browsers warm
+        self._started = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._executor = None
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver, starting one if all started ones are busy; a driver that failed is replaced"""
+        with self._slots:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    self._started += 1
+                    number = self._started
+                logger.info(f"🌐 Starting Chrome #{number} for JavaScript-rendered pages")
+                driver = new_driver(self.block_assets)
+            failed = False
+            try:
+                yield driver
+            except WebDriverException:
+                failed = True
+                raise
+            finally:
+                if failed:
+                    self._quit(driver)
+                else:
+                    self._idle.put(driver)
+
+    def render(self, url: str, wait_selector: str) -> str:
+        """HTML of `url` once `wait_selector` is present (or after render_timeout)"""
+        with self.driver() as driver:
+            try:
+                driver.get(url)
+            except TimeoutException:
+                # eager load still timed out: keep whatever has been parsed so far
+                logger.warning(f"⚠️ Page load timed out for {url}, using the partial page")
+            try:
+                WebDriverWait(driver, self.render_timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+            except TimeoutException:
+                pass
+            return driver.page_source
+
+    def _render_or_none(self, url: str, wait_selector: str) -> Optional[str]:
+        try:
+            return self.render(url, wait_selector)
+        except WebDriverException as e:
+            logger.warning(f"⚠️ Chrome could not load {url}: {str(e)}")
+            return None
+
+    def render_many(self, urls: Iterable[str], wait_selector: str) -> List[Optional[str]]:
+        """HTML (or None on failure) for each url, in order, rendered in parallel"""
+        urls = list(urls)
+        if len(urls) <= 1 or self.size == 1:
+            return [self._render_or_none(url, wait_selector) for url in urls]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='render')
+        return list(self._executor.map(lambda url: self._render_or_none(url, wait_selector), urls))
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
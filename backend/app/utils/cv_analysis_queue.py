@@ -0,0 +1,222 @@
+"""
+CV Analysis Queue
+Background processing for /api/analyze-cv: the web request only stores the
+upload and queues a CVAnalysis row; analysis_worker.py claims rows and runs
+text extraction (with OCR), ML recommendations and CV/keyword saving.
+"""
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from flask import current_app
+from werkzeug.utils import secure_filename
+from app import db
+from app.models import CV, CVKeyword, CVAnalysis, Profile
+from app.utils.cv_text_extractor import CVTextExtractor
+from app.utils.ml_client import MLServiceError, get_ml_client
+
+
+def enqueue_analysis(user_id, file) -> CVAnalysis:
+    """Store an uploaded CV and queue it for analysis"""
+    filename = secure_filename(file.filename)
+    analysis_id = uuid.uuid4()
+
+    upload_folder = os.path.join(current_app.config['UPLOAD_FOLDER'], 'analyses')
+    os.makedirs(upload_folder, exist_ok=True)
+    file_path = os.path.join(upload_folder, f"{analysis_id}{os.path.splitext(filename)[1].lower()}")
+    file.save(file_path)
+
+    analysis = CVAnalysis(
+        id=analysis_id,
+        user_id=user_id,
+        filename=filename,
+        file_path=file_path,
+        content_type=file.content_type,
+        status='queued',
+        stage='queued'
+    )
+    db.session.add(analysis)
+    db.session.commit()
+    return analysis
+
+
+def claim_next_analysis() -> Optional[CVAnalysis]:
+    """
+    Claim the oldest queued analysis for this worker
+
+    Rows are locked with SKIP LOCKED so several workers never pick the same
+    analysis. Analyses stuck in 'processing' longer than ANALYSIS_STALE_AFTER
+    (worker crashed mid-way) are picked up again until ANALYSIS_MAX_ATTEMPTS.
+    """
+    stale_before = datetime.utcnow() - timedelta(seconds=current_app.config.get('ANALYSIS_STALE_AFTER', 900))
+    max_attempts = current_app.config.get('ANALYSIS_MAX_ATTEMPTS', 3)
+
+    analysis = CVAnalysis.query.filter(
+        db.or_(
+            CVAnalysis.status == 'queued',
+            db.and_(CVAnalysis.status == 'processing', CVAnalysis.started_at < stale_before)
+        )
+    ).order_by(CVAnalysis.created_at).with_for_update(skip_locked=True).first()
+
+    if not analysis:
+        db.session.rollback()
+        return None
+
+    if analysis.attempts >= max_attempts:
+        upload = _finish(analysis, 'failed', error='CV analysis failed repeatedly, please upload it again.')
+        db.session.commit()
+        _remove_upload(upload)
+        return None
+
+    analysis.status = 'processing'
+    analysis.stage = 'extracting'
+    analysis.attempts += 1
+    analysis.started_at = datetime.utcnow()
+    db.session.commit()
+    return analysis
+
+
+def process_analysis(analysis: CVAnalysis):
+    """
+    Run a claimed analysis
+    1. Extract text from CV (with OCR if needed)
+    2. Forward to ML API for job recommendations
+    3. Save CV to database with extracted info
+    4. Save keywords to cv_keywords table
+    5. Store the combined result on the analysis row
+    """
+    try:
+        print(f"📄 Processing CV: {analysis.filename} (analysis {analysis.id})")
+
+        # Extract text using our OCR-enabled extractor
+        extractor = CVTextExtractor()
+        result = extractor.extract_from_file(analysis.file_path)
+
+        extracted_text = result.get('full_text', '')
+        extraction_method = result.get('extraction_method', 'unknown')
+        parsed_fields = result.get('parsed_fields', {})
+
+        print(f"✅ Extracted {len(extracted_text)} characters using {extraction_method}")
+
+        if len(extracted_text) < 50:
+            upload = _finish(analysis, 'failed',
+                             error='Could not extract enough text from CV. Please ensure it\'s a valid document.',
+                             result={
+                                 'extracted_text': extracted_text,
+                                 'extracted_text_length': len(extracted_text)
+                             })
+            db.session.commit()
+            _remove_upload(upload)
+            return
+
+        analysis.stage = 'recommending'
+        db.session.commit()
+
+        # Forward to ML API for recommendations (offline recommender if it's down or slow)
+        recommendations = []
+        recommendation_source = None
+        ml_error = None
+
+        try:
+            print("🤖 Sending to ML API for recommendations...")
+
+            # Send the already extracted text instead of re-uploading the file
+            recommendations, recommendation_source, ml_error = get_ml_client().recommend_or_fallback(
+                extracted_text, analysis.filename
+            )
+            print(f"✅ Got {len(recommendations)} recommendations from {recommendation_source}")
+
+        except MLServiceError as e:
+            ml_error = str(e)
+            print(f"⚠️ ML API error: {ml_error}")
+
+        except Exception as e:
+            ml_error = str(e)
+            print(f"❌ ML API error: {ml_error}")
+
+        analysis.stage = 'saving'
+
+        # Get user's profile (create if doesn't exist)
+        profile = Profile.query.filter_by(user_id=analysis.user_id).first()
+        if not profile:
+            print(f"⚠️ Profile not found for user {analysis.user_id}, creating one...")
+            profile = Profile(user_id=analysis.user_id)
+            db.session.add(profile)
+            db.session.flush()
+
+        cv_name = f"{analysis.filename.rsplit('.', 1)[0]}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        # Mark all previous CVs as inactive
+        CV.query.filter_by(profile_id=profile.id, is_active=True).update({'is_active': False})
+
+        # Create new CV record (without file storage)
+        new_cv = CV(
+            profile_id=profile.id,
+            name=cv_name,
+            file_path='',  # No file storage
+            status='completed',
+            is_active=True,
+            extracted_fullname=parsed_fields.get('name', ''),
+            extracted_email=parsed_fields.get('email', ''),
+            extracted_phone=parsed_fields.get('phone', ''),
+            extracted_location=parsed_fields.get('location', ''),
+            extracted_summary=parsed_fields.get('summary', ''),
+            extracted_data=parsed_fields
+        )
+        db.session.add(new_cv)
+        db.session.flush()  # Get the CV ID
+
+        # Save keywords if we have recommendations
+        if recommendations:
+            keywords = [rec.get('job_title', '') for rec in recommendations]
+            cv_keyword = CVKeyword(
+                cv_id=new_cv.id,
+                keywords=keywords,
+                extracted_text=extracted_text[:5000],  # Store first 5000 chars
+                extraction_method=extraction_method
+            )
+            db.session.add(cv_keyword)
+
+        upload = _finish(analysis, 'completed', result={
+            'cv_id': str(new_cv.id),
+            'cv_name': cv_name,
+            'extracted_text': extracted_text,
+            'extracted_text_length': len(extracted_text),
+            'extraction_method': extraction_method,
+            'recommendations': recommendations,
+            'recommendation_source': recommendation_source,
+            'ocr_used': extraction_method in ('ocr', 'ocr_only') or extraction_method.endswith('+ocr'),
+            'ml_error': ml_error
+        })
+        db.session.commit()
+        _remove_upload(upload)
+        print(f"💾 Saved CV: {cv_name} (ID: {new_cv.id})")
+
+    except Exception as e:
+        print(f"❌ Error processing CV: {e}")
+        db.session.rollback()
+        upload = _finish(analysis, 'failed', error=f'Failed to process CV: {str(e)}')
+        db.session.commit()
+        _remove_upload(upload)
+
+
+def _finish(analysis: CVAnalysis, status: str, result: Optional[dict] = None,
+            error: Optional[str] = None) -> Optional[str]:
+    """
+    Mark an analysis as finished; returns its upload's path, which the caller
+    removes with _remove_upload once the commit has succeeded. Until then the
+    file stays, so a re-claimed analysis (failed commit, dead worker) can retry.
+    """
+    upload = analysis.file_path
+    analysis.file_path = None
+    analysis.status = status
+    analysis.stage = 'done'
+    analysis.result = result
+    analysis.error = error
+    analysis.finished_at = datetime.utcnow()
+    return upload
+
+
+def _remove_upload(path: Optional[str]):
+    if path and os.path.exists(path):
+        os.unlink(path)
@@ -0,0 +1,291 @@
+"""
+Bulk CV Export
+Builds one ZIP archive of many CVs without holding the archive (or all the
+CVs) in memory.
+
+Exports can take longer than a web request may, so POST /api/admin/cvs/export
+only queues a CVExport row; analysis_worker.py claims it, writes the archive
+to UPLOAD_FOLDER/exports and the admin downloads the finished file. Files are
+deleted CV_EXPORT_KEEP_HOURS after they are built.
+
+iter_cv_export yields the archive as byte chunks: zipfile writes into
+ZipStream, a non-seekable sink (zipfile emits data descriptors after each
+entry), which is drained after every write, and process_export appends the
+chunks to a temporary file that is renamed into place once complete. Stored
+uploads are copied in; CVs without a stored file are rendered to PDF in a
+process pool, at most `window` CVs ahead of the one being written.
+"""
+import csv
+import io
+import os
+import tempfile
+import uuid
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+from flask import current_app
+from werkzeug.utils import secure_filename
+
+from app import db
+from app.models import CV, CVExport, Profile, User
+from app.utils.cv_pdf import render_cv_pdf, resolve_cv_content
+
+# Defaults (overridden by Config below)
+CV_EXPORT_WORKERS = 2
+CV_EXPORT_MAX_CVS = 1000
+CV_EXPORT_STALE_AFTER = 3600  # seconds before a 'processing' export is picked up again
+CV_EXPORT_MAX_ATTEMPTS = 2
+CV_EXPORT_KEEP_HOURS = 24
+
+try:
+    from config import Config
+    CV_EXPORT_WORKERS = getattr(Config, 'CV_EXPORT_WORKERS', CV_EXPORT_WORKERS)
+    CV_EXPORT_MAX_CVS = getattr(Config, 'CV_EXPORT_MAX_CVS', CV_EXPORT_MAX_CVS)
+    CV_EXPORT_STALE_AFTER = getattr(Config, 'CV_EXPORT_STALE_AFTER', CV_EXPORT_STALE_AFTER)
+    CV_EXPORT_MAX_ATTEMPTS = getattr(Config, 'CV_EXPORT_MAX_ATTEMPTS', CV_EXPORT_MAX_ATTEMPTS)
+    CV_EXPORT_KEEP_HOURS = getattr(Config, 'CV_EXPORT_KEEP_HOURS', CV_EXPORT_KEEP_HOURS)
+except Exception:
+    pass
+
+COPY_CHUNK_SIZE = 64 * 1024
+
+
+class ZipStream(io.RawIOBase):
+    """Write-only, non-seekable sink that zipfile writes into; pop() drains it"""
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._buffer += b
+        return len(b)
+
+    def pop(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+# One render pool per process, created on first export
+_render_pool = None
+_render_pool_size = 0
+
+
+def _get_render_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _render_pool, _render_pool_size
+    if _render_pool is None or _render_pool_size != max_workers:
+        if _render_pool is not None:
+            _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = ProcessPoolExecutor(max_workers=max_workers)
+        _render_pool_size = max_workers
+    return _render_pool
+
+
+def iter_export_rows(cv_ids: List, batch_size: int = 50) -> Iterator:
+    """(cv, user, profile) for each id, in the given order, loaded a batch at a time"""
+    for i in range(0, len(cv_ids), batch_size):
+        chunk = cv_ids[i:i + batch_size]
+        rows = db.session.query(CV, User, Profile) \
+            .join(Profile, CV.profile_id == Profile.id) \
+            .join(User, Profile.user_id == User.id) \
+            .filter(CV.id.in_(chunk)).all()
+        by_id = {cv.id: (cv, user, profile) for cv, user, profile in rows}
+        for cv_id in chunk:
+            if cv_id in by_id:
+                yield by_id[cv_id]
+        # Don't let the identity map grow with the export
+        for row in rows:
+            for obj in row:
+                if obj in db.session:
+                    db.session.expunge(obj)
+
+
+def _entry_name(cv, user, used_names: set, ext: str) -> str:
+    """'<owner>_<user id prefix>/<cv name><ext>', unique within the archive"""
+    folder = f"{secure_filename(user.fullname or user.email or '') or 'user'}_{str(user.id)[:8]}"
+    base = secure_filename(cv.name or '') or str(cv.id)
+    name = f'{folder}/{base}{ext}'
+    n = 2
+    while name in used_names:
+        name = f'{folder}/{base}-{n}{ext}'
+        n += 1
+    used_names.add(name)
+    return name
+
+
+def iter_cv_export(cv_ids: List, base_dir: str, cache_dir: str,
+                   workers: int = CV_EXPORT_WORKERS, window: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of the given CVs as byte chunks
+
+    Each CV is its stored upload when the file exists, otherwise a PDF
+    rendered from its builder/extracted data. A manifest.csv at the end
+    lists every CV with its entry name, source, or the error that kept it
+    out of the archive.
+    """
+    window = window or max(1, workers) * 4
+    pool = _get_render_pool(max(1, workers))
+    sink = ZipStream()
+    archive = zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED)
+    used_names = set()
+    manifest = []
+    pending = deque()
+
+    def write_entry(cv, user, source, path_or_future):
+        row = {'cv_id': str(cv.id), 'owner': user.email, 'cv_name': cv.name, 'entry': '', 'source': source, 'error': ''}
+        manifest.append(row)
+        try:
+            # render_cv_pdf returns (path, etag)
+            path = path_or_future.result()[0] if source == 'generated' else path_or_future
+            ext = '.pdf' if source == 'generated' else os.path.splitext(path)[1].lower()
+            info = zipfile.ZipInfo(_entry_name(cv, user, used_names, ext), date_time=cv.upload_date.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, 'rb') as src, archive.open(info, 'w') as dest:
+                while True:
+                    chunk = src.read(COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+                    data = sink.pop()
+                    if data:
+                        yield data
+            row['entry'] = info.filename
+        except Exception as e:
+            row['error'] = str(e)
+            print(f"⚠️ CV export: skipped {cv.id}: {str(e)}")
+        data = sink.pop()
+        if data:
+            yield data
+
+    try:
+        for cv, user, profile in iter_export_rows(cv_ids):
+            stored = os.path.join(base_dir, cv.file_path.lstrip('/')) if cv.file_path else None
+            if stored and os.path.isfile(stored):
+                pending.append((cv, user, 'stored', stored))
+            else:
+                content = resolve_cv_content(cv, user, profile)
+                pending.append((cv, user, 'generated', pool.submit(render_cv_pdf, content, cache_dir)))
+
+            # Keep at most `window` CVs in flight: memory stays flat however many are exported
+            while len(pending) >= window:
+                yield from write_entry(*pending.popleft())
+
+        while pending:
+            yield from write_entry(*pending.popleft())
+
+        text = io.StringIO()
+        writer = csv.DictWriter(text, fieldnames=['cv_id', 'owner', 'cv_name', 'entry', 'source', 'error'])
+        writer.writeheader()
+        writer.writerows(manifest)
+        archive.writestr('manifest.csv', text.getvalue())
+        archive.close()
+        yield sink.pop()
+    finally:
+        # Build failed or was abandoned part-way (e.g. writing the file failed): cancel renders still queued
+        for _, _, source, item in pending:
+            if source == 'generated':
+                item.cancel()
+
+
+def export_dir() -> str:
+    return os.path.join(current_app.config['UPLOAD_FOLDER'], 'exports')
+
+
+def enqueue_export(user_id, cv_ids: List) -> CVExport:
+    """Queue an export of the given CVs (in archive order)"""
+    export = CVExport(user_id=user_id, cv_ids=[str(cv_id) for cv_id in cv_ids], status='queued')
+    db.session.add(export)
+    db.session.commit()
+    return export
+
+
+def claim_next_export() -> Optional[CVExport]:
+    """
+    Claim the oldest queued export for this worker
+
+    Same scheme as claim_next_analysis: SKIP LOCKED, and exports stuck in
+    'processing' longer than CV_EXPORT_STALE_AFTER are retried until
+    CV_EXPORT_MAX_ATTEMPTS.
+    """
+    stale_before = datetime.utcnow() - timedelta(seconds=CV_EXPORT_STALE_AFTER)
+
+    export = CVExport.query.filter(
+        db.or_(
+            CVExport.status == 'queued',
+            db.and_(CVExport.status == 'processing', CVExport.started_at < stale_before)
+        )
+    ).order_by(CVExport.created_at).with_for_update(skip_locked=True).first()
+
+    if not export:
+        db.session.rollback()
+        return None
+
+    if export.attempts >= CV_EXPORT_MAX_ATTEMPTS:
+        export.status = 'failed'
+        export.error = 'CV export failed repeatedly, please request it again.'
+        export.finished_at = datetime.utcnow()
+        db.session.commit()
+        return None
+
+    export.status = 'processing'
+    export.attempts += 1
+    export.started_at = datetime.utcnow()
+    db.session.commit()
+    return export
+
+
+def process_export(export: CVExport):
+    """Build a claimed export's ZIP under UPLOAD_FOLDER/exports"""
+    export_id = export.id
+    folder = export_dir()
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        archive = iter_cv_export(
+            [uuid.UUID(cv_id) for cv_id in export.cv_ids],
+            base_dir=os.path.join(current_app.root_path, '..'),
+            cache_dir=current_app.config['CV_PDF_CACHE_DIR'],
+            workers=current_app.config.get('CV_EXPORT_WORKERS', CV_EXPORT_WORKERS)
+        )
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in archive:
+                f.write(chunk)
+        path = os.path.join(folder, f'{export_id}.zip')
+        os.replace(tmp_path, path)
+
+        export = db.session.get(CVExport, export_id)
+        export.status = 'completed'
+        export.file_path = path
+        export.file_size = os.path.getsize(path)
+        export.finished_at = datetime.utcnow()
+        db.session.commit()
+    except Exception as e:
+        print(f"❌ CV export {export_id} failed: {e}")
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        db.session.rollback()
+        export = db.session.get(CVExport, export_id)
+        export.status = 'failed'
+        export.error = f'Failed to build the export: {str(e)}'
+        export.finished_at = datetime.utcnow()
+        db.session.commit()
+
+
+def expire_exports() -> int:
+    """Delete archives built more than CV_EXPORT_KEEP_HOURS ago; returns how many"""
+    cutoff = datetime.utcnow() - timedelta(hours=CV_EXPORT_KEEP_HOURS)
+    expired = CVExport.query.filter(CVExport.status == 'completed', CVExport.finished_at < cutoff).all()
+    for export in expired:
+        if export.file_path and os.path.exists(export.file_path):
+            os.unlink(export.file_path)
+        export.status = 'expired'
+        export.file_path = None
+    db.session.commit()
+    return len(expired)
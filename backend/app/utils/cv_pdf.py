@@ -0,0 +1,270 @@
+"""
+CV PDF Rendering
+Renders a CV's builder/extracted data to PDF with a reportlab template that
+is built once per process, and caches rendered PDFs on disk.
+
+The cache key is a hash of the resolved CV content and TEMPLATE_VERSION, so
+a PDF is only rendered again when what it shows (or the layout) changes.
+The same hash doubles as the HTTP ETag.
+
+Cached files live under a folder per template version (v<N>/ab/<hash>.pdf);
+prune_pdf_cache() deletes other versions' folders and applies an age and size
+cap, and scheduler.py runs it daily.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from io import BytesIO
+from typing import Dict, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+# Bump whenever CVPdfTemplate's output changes, to invalidate cached PDFs
+TEMPLATE_VERSION = 1
+
+
+def resolve_cv_content(cv, user, profile) -> Dict:
+    """Everything the PDF shows: builder data, falling back to extracted data, then the profile"""
+    builder_data = cv.cv_builder_data or {}
+    extracted = cv.extracted_data or {}
+
+    skills = builder_data.get('skills', [])
+    if not skills and extracted.get('skills'):
+        skills = [{'name': s, 'level': 'Intermediate'} for s in extracted.get('skills', [])]
+
+    return {
+        'fullname': builder_data.get('fullname') or extracted.get('name') or (user.fullname if user else None),
+        'email': builder_data.get('email') or extracted.get('email') or profile.email,
+        'phone': builder_data.get('phone') or extracted.get('phone') or profile.phone,
+        'location': builder_data.get('location') or extracted.get('location') or profile.location,
+        'summary': builder_data.get('professional_summary') or extracted.get('summary') or profile.professional_summary,
+        'educations': builder_data.get('educations') or extracted.get('education', []),
+        'experiences': builder_data.get('experiences') or extracted.get('experience', []),
+        'skills': skills,
+        'languages': builder_data.get('languages') or extracted.get('languages', []),
+        'certifications': builder_data.get('certifications') or extracted.get('certifications', []),
+    }
+
+
+def content_hash(content: Dict) -> str:
+    """Stable hash of resolved content + template version (cache key and ETag)"""
+    payload = json.dumps({'template': TEMPLATE_VERSION, 'content': content}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CVPdfTemplate:
+    """Page setup and paragraph styles, built once and reused for every render"""
+
+    def __init__(self):
+        self.styles = getSampleStyleSheet()
+        self.normal = self.styles['Normal']
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=self.styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#FF8C42'),
+            spaceAfter=30,
+        )
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=self.styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#FF8C42'),
+            spaceAfter=12,
+            spaceBefore=12,
+        )
+
+    def render(self, content: Dict) -> bytes:
+        """Render resolved CV content (see resolve_cv_content) to PDF bytes"""
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
+                                topMargin=72, bottomMargin=18)
+        doc.build(self._elements(content))
+        return buffer.getvalue()
+
+    def _elements(self, content: Dict) -> list:
+        # Container for the 'Flowable' objects
+        elements = []
+
+        # Add name and contact info
+        elements.append(Paragraph(content['fullname'] or 'Professional CV', self.title_style))
+
+        contact_info = []
+        if content['email']:
+            contact_info.append(f"Email: {content['email']}")
+        if content['phone']:
+            contact_info.append(f"Phone: {content['phone']}")
+        if content['location']:
+            contact_info.append(f"Location: {content['location']}")
+        if contact_info:
+            elements.append(Paragraph(" | ".join(contact_info), self.normal))
+            elements.append(Spacer(1, 12))
+
+        # Professional Summary
+        if content['summary']:
+            elements.append(Paragraph("Professional Summary", self.heading_style))
+            elements.append(Paragraph(content['summary'], self.normal))
+            elements.append(Spacer(1, 12))
+
+        # Education
+        if content['educations']:
+            elements.append(Paragraph("Education", self.heading_style))
+            for edu in content['educations']:
+                elements.append(Paragraph(
+                    f"<b>{edu.get('degree', '')}</b> - {edu.get('institution', '')} ({edu.get('year', '')})", self.normal
+                ))
+                if edu.get('description'):
+                    elements.append(Paragraph(edu['description'], self.normal))
+                elements.append(Spacer(1, 6))
+
+        # Experience
+        if content['experiences']:
+            elements.append(Paragraph("Work Experience", self.heading_style))
+            for exp in content['experiences']:
+                elements.append(Paragraph(
+                    f"<b>{exp.get('title', '')}</b> - {exp.get('company', '')} ({exp.get('duration', '')})", self.normal
+                ))
+                if exp.get('description'):
+                    elements.append(Paragraph(exp['description'], self.normal))
+                elements.append(Spacer(1, 6))
+
+        # Skills
+        if content['skills']:
+            elements.append(Paragraph("Skills", self.heading_style))
+            skills_text = ", ".join([f"{skill.get('name', '')} ({skill.get('level', '')})" for skill in content['skills']])
+            elements.append(Paragraph(skills_text, self.normal))
+            elements.append(Spacer(1, 12))
+
+        # Languages
+        if content['languages']:
+            elements.append(Paragraph("Languages", self.heading_style))
+            lang_text = ", ".join([f"{lang.get('language', '')} ({lang.get('proficiency', '')})" for lang in content['languages']])
+            elements.append(Paragraph(lang_text, self.normal))
+            elements.append(Spacer(1, 12))
+
+        # Certifications
+        if content['certifications']:
+            elements.append(Paragraph("Certifications", self.heading_style))
+            for cert in content['certifications']:
+                elements.append(Paragraph(
+                    f"<b>{cert.get('name', '')}</b> - {cert.get('organization', '')} ({cert.get('year', '')})", self.normal
+                ))
+                if cert.get('description'):
+                    elements.append(Paragraph(cert['description'], self.normal))
+                elements.append(Spacer(1, 6))
+
+        return elements
+
+
+_template = None
+_template_lock = threading.Lock()
+
+
+def get_cv_pdf_template() -> CVPdfTemplate:
+    """The per-process template, created on first use"""
+    global _template
+    with _template_lock:
+        if _template is None:
+            _template = CVPdfTemplate()
+        return _template
+
+
+def render_cv_pdf(content: Dict, cache_dir: str) -> Tuple[str, str]:
+    """
+    Path of the rendered PDF for this content, rendering it only on a cache miss
+
+    Returns:
+        Tuple of (pdf path, content hash usable as ETag)
+    """
+    key = content_hash(content)
+    path = os.path.join(cache_dir, f'v{TEMPLATE_VERSION}', key[:2], f'{key}.pdf')
+    if os.path.exists(path):
+        try:
+            os.utime(path)  # last use, for prune_pdf_cache's age cap
+        except OSError:
+            pass
+        return path, key
+
+    pdf = get_cv_pdf_template().render(content)
+
+    # Write then rename, so concurrent requests never serve a half-written file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pdf)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path, key
+
+
+def prune_pdf_cache(cache_dir: str, max_age_days: int = 30, max_mb: int = 500) -> Dict[str, int]:
+    """
+    Delete cached PDFs of other template versions, PDFs not used for
+    `max_age_days`, then the least recently used ones until the cache is
+    under `max_mb` (0 turns either cap off). Returns files and bytes removed.
+    """
+    removed = {'files': 0, 'bytes': 0}
+    if not os.path.isdir(cache_dir):
+        return removed
+
+    def remove(path, size):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return
+        removed['files'] += 1
+        removed['bytes'] += size
+
+    # Older template versions (and the flat layout from before versioned folders) can never be hit again
+    current = f'v{TEMPLATE_VERSION}'
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name == current or not os.path.isdir(path):
+            continue
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                removed['files'] += 1
+                removed['bytes'] += os.path.getsize(os.path.join(dirpath, filename))
+        shutil.rmtree(path, ignore_errors=True)
+
+    files = []
+    for dirpath, _, filenames in os.walk(os.path.join(cache_dir, current)):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+    files.sort()  # least recently used first
+
+    now = time.time()
+    # Never delete a file used in the last minute: a request may be about to send it
+    recent = now - 60
+    first_kept = 0  # files[:first_kept] are removed
+    if max_age_days:
+        cutoff = now - max_age_days * 86400
+        while first_kept < len(files) and files[first_kept][0] < cutoff:
+            _, size, path = files[first_kept]
+            remove(path, size)
+            first_kept += 1
+
+    if max_mb:
+        total = sum(size for _, size, _ in files[first_kept:])
+        while first_kept < len(files) and total > max_mb * 1024 * 1024 and files[first_kept][0] < recent:
+            _, size, path = files[first_kept]
+            remove(path, size)
+            total -= size
+            first_kept += 1
+    return removed
@@ -0,0 +1,139 @@
+"""
+CV Section Segmenter
+Finds every section header of a CV in one scan per header style, using
+patterns compiled once at import, and slices out the text of each section
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Headers that open each parsed section, in order of preference
+SECTION_KEYWORDS = {
+    'skills': ['skills', 'technical skills', 'core competencies', 'key skills', 'competencies', 'hard skills', 'soft skills'],
+    'education': ['education', 'academic background', 'qualifications'],
+    'experience': ['experience', 'work experience', 'employment history', 'professional experience', 'volunteer experience'],
+    'summary': ['summary', 'profile', 'objective', 'about me', 'professional summary'],
+    'languages': ['languages', 'language skills', 'language proficiency', 'language'],
+    'certifications': ['certifications', 'certificates', 'licenses', 'professional certifications'],
+}
+
+# Headers that close the section before them
+BOUNDARY_KEYWORDS = [
+    'education', 'experience', 'work experience', 'employment',
+    'skills', 'technical skills', 'core competencies', 'competencies',
+    'certifications', 'certificates', 'certification',
+    'language', 'languages',
+    'projects', 'project',
+    'references', 'volunteer', 'volunteering',
+    'achievements', 'achievement', 'awards', 'award',
+    'soft skills', 'hard skills', 'technical', 'professional',
+    'summary', 'profile', 'objective',
+    'contact', 'personal information'
+]
+
+# A section with no header after it runs to the end of the text, up to this many chars
+MAX_OPEN_SECTION_LENGTH = 2000
+
+_BOUNDARY_SET = frozenset(BOUNDARY_KEYWORDS)
+
+# Longest first so "technical skills" wins over "technical" at the same position
+_ALL_HEADERS = sorted(set(BOUNDARY_KEYWORDS).union(*SECTION_KEYWORDS.values()), key=len, reverse=True)
+_TITLE_TO_KEYWORD = {keyword.title(): keyword for keyword in _ALL_HEADERS}
+
+# Both patterns are lookaheads, so one finditer pass also reports overlapping
+# headers (e.g. "Skills" inside "Technical Skills")
+
+# Header on its own line ("\nSkills:", "\nEDUCATION\n") - matched on lowercased text
+_NEWLINE_HEADER_RE = re.compile(
+    r'(?=(\n\s*(' + '|'.join(re.escape(kw) for kw in _ALL_HEADERS) + r')\s*[:|\n]))'
+)
+
+# Title-case header inside jumbled text ("... Skills: Python ...") - matched on original text
+_TITLE_HEADER_RE = re.compile(
+    r'(?=(\b(' + '|'.join(re.escape(kw.title()) for kw in _ALL_HEADERS) + r')(?:\s*[:|\s])))'
+)
+
+
+class CVSections:
+    """Section boundaries of one CV text, located in a single pass"""
+
+    def __init__(self, text: str):
+        self.text = text
+        text_lower = text.lower()
+
+        # (start, end, keyword) for every header occurrence, in text order
+        newline_headers = self._dedupe([
+            (m.start(1), m.end(1), m.group(2)) for m in _NEWLINE_HEADER_RE.finditer(text_lower)
+        ])
+        title_headers = [
+            (m.start(1), m.end(1), _TITLE_TO_KEYWORD[m.group(2)]) for m in _TITLE_HEADER_RE.finditer(text)
+        ]
+
+        # First occurrence of each keyword, per header style
+        self._first_newline = {}
+        for start, end, keyword in newline_headers:
+            self._first_newline.setdefault(keyword, (start, end))
+        self._first_title = {}
+        for start, end, keyword in title_headers:
+            self._first_title.setdefault(keyword, (start, end))
+
+        # Where a section can end. "Professional Experience" in jumbled text
+        # ends a section because "Professional" on its own would.
+        self._newline_boundaries = [start for start, _, keyword in newline_headers if keyword in _BOUNDARY_SET]
+        self._title_boundaries = [
+            start for start, _, keyword in title_headers
+            if keyword in _BOUNDARY_SET or keyword.split()[0] in _BOUNDARY_SET
+        ]
+
+        self._sections = {}
+
+    @staticmethod
+    def _dedupe(headers: List[Tuple[int, int, str]]) -> List[Tuple[int, int, str]]:
+        """A header after blank lines is found from every newline; keep the earliest start per header end"""
+        seen_ends = set()
+        unique = []
+        for header in headers:
+            if header[1] not in seen_ends:
+                seen_ends.add(header[1])
+                unique.append(header)
+        return unique
+
+    def get(self, section: str) -> Optional[str]:
+        """Text of a section from SECTION_KEYWORDS, or None if the CV doesn't have it"""
+        if section not in self._sections:
+            self._sections[section] = self._find(SECTION_KEYWORDS[section])
+        return self._sections[section]
+
+    def all(self) -> Dict[str, Optional[str]]:
+        """Text of every known section"""
+        return {section: self.get(section) for section in SECTION_KEYWORDS}
+
+    def _find(self, keywords: List[str]) -> Optional[str]:
+        for keyword in keywords:
+            # Properly formatted header wins over one found in jumbled text
+            header = self._first_newline.get(keyword) or self._first_title.get(keyword)
+            if not header:
+                continue
+
+            start_idx = header[1]
+            end_idx = self._next_boundary(self._newline_boundaries, start_idx) or \
+                self._next_boundary(self._title_boundaries, start_idx)
+
+            if end_idx:
+                section_text = self.text[start_idx:end_idx].strip()
+                next_section_name = self.text[end_idx:end_idx + 30].strip().lower()
+                print(f"Section '{keyword}' found: {len(section_text)} chars, ends before '{next_section_name[:20]}'")
+            else:
+                # Rest of document (limited to avoid including unrelated content)
+                section_text = self.text[start_idx:start_idx + MAX_OPEN_SECTION_LENGTH].strip()
+                print(f"Section '{keyword}' found: {len(section_text)} chars (limited from rest)")
+
+            return section_text
+
+        return None
+
+    @staticmethod
+    def _next_boundary(boundaries: List[int], start_idx: int) -> Optional[int]:
+        """First boundary at or after start_idx (boundaries are sorted)"""
+        i = bisect_left(boundaries, start_idx)
+        return boundaries[i] if i < len(boundaries) else None
@@ -4,27 +4,42 @@ Extracts text from PDF, DOC, and DOCX files with OCR fallback for scanned docume
 """
 import os
 import re
+import time
 from typing import Dict, Optional, List
 from io import BytesIO
 import tempfile
+import multiprocessing
+from multiprocessing.pool import Pool
 
 # Document processing
 from docx import Document
 import subprocess
 
 # PDF processing
-from pdfminer.high_level import extract_text as pdf_extract_text
-from pdfminer.pdfpage import PDFPage
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 import pytesseract
 from PIL import Image, ImageEnhance, ImageFilter
 
+from app.utils.cv_sections import CVSections
+from app.utils.keyword_matcher import KeywordMatcher, load_vocabulary
+from app.utils.pdf_text_engines import get_pdf_text_engines
+from app.utils.doc_converter import ConversionError, convert_with_soffice, get_doc_converter
+
+# OCR pool defaults (overridden by Config below)
+OCR_MAX_WORKERS = 0  # 0 = one worker per available CPU core
+OCR_PAGE_TIMEOUT = 60  # seconds per page
+OCR_MAX_PAGES = 20  # hard cap on pages rasterized per document
+OCR_DPI = 300
+
 # Configure Tesseract path
 try:
     from config import Config
     if hasattr(Config, 'TESSERACT_CMD') and os.path.exists(Config.TESSERACT_CMD):
         pytesseract.pytesseract.tesseract_cmd = Config.TESSERACT_CMD
     POPPLER_PATH = getattr(Config, 'POPPLER_PATH', None)
+    OCR_MAX_WORKERS = getattr(Config, 'OCR_MAX_WORKERS', OCR_MAX_WORKERS)
+    OCR_PAGE_TIMEOUT = getattr(Config, 'OCR_PAGE_TIMEOUT', OCR_PAGE_TIMEOUT)
+    OCR_MAX_PAGES = getattr(Config, 'OCR_MAX_PAGES', OCR_MAX_PAGES)
 except:
     # Fallback: try common locations
     if os.path.exists(r'C:\Program Files\Tesseract-OCR\tesseract.exe'):
@@ -32,12 +47,159 @@ except:
     POPPLER_PATH = r'C:\poppler\poppler-24.02.0\Library\bin' if os.path.exists(r'C:\poppler\poppler-24.02.0\Library\bin') else None
 
 
+# Skill, language and proficiency vocabularies (app/utils/data), compiled once
+SKILLS_BY_CATEGORY = load_vocabulary('skills')
+SKILL_MATCHER = KeywordMatcher([skill for skills in SKILLS_BY_CATEGORY.values() for skill in skills])
+
+_language_vocabulary = load_vocabulary('languages')
+LANGUAGE_MATCHER = KeywordMatcher(_language_vocabulary['languages'])
+LANGUAGE_DISPLAY_NAMES = _language_vocabulary.get('display_names', {})
+
+# Ordered: earlier terms win when a line mentions several
+PROFICIENCY_LEVELS = load_vocabulary('proficiency')
+PROFICIENCY_MATCHER = KeywordMatcher(list(PROFICIENCY_LEVELS))
+
+_BULLET_PREFIX_RE = re.compile(r'^[\d\.\)\-\*•·\s]+')
+_LANGUAGE_COLON_RE = re.compile(r'^\s*([a-z\s]+)\s*[:|-]\s*(.+)$')
+
+
+def _available_cores() -> int:
+    """Number of CPU cores this process is allowed to run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_ocr_worker():
+    """Pool initializer: keep each Tesseract process single-threaded so
+    parallel pages don't oversubscribe the cores"""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+# One OCR pool per process (e.g. per gunicorn worker), created on first use
+_ocr_pool = None
+_ocr_pool_size = 0
+
+
+def _get_ocr_pool(max_workers: int) -> Pool:
+    """Return the shared OCR process pool, (re)creating it if needed"""
+    global _ocr_pool, _ocr_pool_size
+    if _ocr_pool is None or _ocr_pool_size != max_workers:
+        _reset_ocr_pool()
+        _ocr_pool = multiprocessing.Pool(processes=max_workers, initializer=_init_ocr_worker)
+        _ocr_pool_size = max_workers
+    return _ocr_pool
+
+
+def _reset_ocr_pool():
+    """
+    Kill the OCR pool's workers, so the next extraction starts a fresh pool
+
+    multiprocessing.Pool rather than ProcessPoolExecutor because terminate()
+    also stops a worker stuck on a page (a hung Tesseract would otherwise
+    keep its CPU and memory until the page is done).
+    """
+    global _ocr_pool, _ocr_pool_size
+    if _ocr_pool is not None:
+        _ocr_pool.terminate()
+    _ocr_pool = None
+    _ocr_pool_size = 0
+
+
+def _reset_peak_rss():
+    """Reset this process's peak RSS high-water mark (Linux only, best effort)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+
+def _read_peak_rss_kb() -> int:
+    """Peak resident set size of this process in KB"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return 0
+
+
+def _ocr_page_image(image, timeout: int) -> str:
+    """Preprocess one page image and run Tesseract on it (runs inside a pool worker)"""
+    # Convert to grayscale
+    image = image.convert('L')
+    
+    # Enhance contrast
+    enhancer = ImageEnhance.Contrast(image)
+    image = enhancer.enhance(2.0)
+    
+    # Sharpen image
+    image = image.filter(ImageFilter.SHARPEN)
+    
+    # PSM 3 = Fully automatic page segmentation, but no OSD (default)
+    # PSM 6 = Assume a single uniform block of text
+    custom_config = r'--oem 3 --psm 3'
+    # Tesseract is killed after `timeout` seconds (pytesseract raises RuntimeError)
+    return pytesseract.image_to_string(image, lang='eng', config=custom_config, timeout=timeout)
+
+
+def _ocr_pdf_page(filepath: str, page_number: int, timeout: int, measure_rss: bool = True):
+    """
+    Rasterize a single PDF page and OCR it (runs inside a pool worker)
+    
+    Only this one page image is ever held in memory; it is closed as soon
+    as Tesseract is done with it.
+    
+    Returns:
+        Tuple of (text, peak RSS in KB while handling this page,
+        {'rasterize': seconds, 'ocr': seconds})
+    """
+    if measure_rss:
+        _reset_peak_rss()
+    
+    started = time.perf_counter()
+    kwargs = {'poppler_path': POPPLER_PATH} if POPPLER_PATH else {}
+    images = convert_from_path(filepath, dpi=OCR_DPI, fmt='png', first_page=page_number,
+                               last_page=page_number, timeout=timeout, **kwargs)
+    rasterized = time.perf_counter()
+    try:
+        text = ''.join(_ocr_page_image(image, timeout) for image in images)
+    finally:
+        for image in images:
+            image.close()
+        del images
+    
+    timings = {'rasterize': rasterized - started, 'ocr': time.perf_counter() - rasterized}
+    return text, (_read_peak_rss_kb() if measure_rss else 0), timings
+
+
 class CVTextExtractor:
     """Extract and parse text from CV documents"""
     
-    def __init__(self):
+    def __init__(self, ocr_workers: Optional[int] = None, ocr_page_timeout: Optional[int] = None):
         self.min_text_length = 50  # Minimum characters for valid extraction
-        
+        # OCR pool size: explicit value > Config.OCR_MAX_WORKERS > available cores
+        self.ocr_workers = ocr_workers if ocr_workers is not None else (OCR_MAX_WORKERS or _available_cores())
+        self.ocr_page_timeout = ocr_page_timeout or OCR_PAGE_TIMEOUT
+        self.max_ocr_pages = OCR_MAX_PAGES
+        # Text-layer engines in the order they are tried (Config.PDF_TEXT_ENGINE)
+        self.pdf_text_engines = get_pdf_text_engines()
+        # Per-extraction metrics, reset by extract_from_file
+        self.metrics = {}
+    
+    def _add_stage_time(self, stage: str, seconds: float):
+        """Accumulate time spent in a pipeline stage into metrics['stage_seconds']"""
+        stage_seconds = self.metrics.setdefault('stage_seconds', {})
+        stage_seconds[stage] = stage_seconds.get(stage, 0.0) + seconds
+
     def extract_from_file(self, filepath: str) -> Dict:
         """
         Main entry point for CV text extraction
@@ -50,18 +212,27 @@ class CVTextExtractor:
         """
         ext = os.path.splitext(filepath)[1].lower()
         
+        self.metrics = {}
+        _reset_peak_rss()
+        
         if ext == '.pdf':
-            return self._extract_from_pdf(filepath)
+            result = self._extract_from_pdf(filepath)
         elif ext == '.docx':
-            return self._extract_from_docx(filepath)
+            result = self._extract_from_docx(filepath)
         elif ext == '.doc':
-            return self._extract_from_doc(filepath)
+            result = self._extract_from_doc(filepath)
         else:
             raise ValueError(f"Unsupported file format: {ext}")
+        
+        self.metrics['peak_rss_kb'] = _read_peak_rss_kb()
+        print(f"Extraction peak RSS: {self.metrics['peak_rss_kb']} KB")
+        result['metrics'] = self.metrics
+        return result
     
     def _extract_from_docx(self, filepath: str) -> Dict:
         """Extract text from DOCX file"""
         try:
+            started = time.perf_counter()
             doc = Document(filepath)
             
             # Extract all paragraphs
@@ -75,6 +246,7 @@ class CVTextExtractor:
                             paragraphs.append(cell.text.strip())
             
             full_text = '\n'.join(paragraphs)
+            self._add_stage_time('docx', time.perf_counter() - started)
             
             # Count pages approximately (assuming ~500 chars per page)
             approx_pages = max(1, len(full_text) // 500)
@@ -94,27 +266,26 @@ class CVTextExtractor:
     def _extract_from_doc(self, filepath: str) -> Dict:
         """Convert DOC to DOCX then extract"""
         try:
-            # Convert DOC to DOCX using LibreOffice (requires LibreOffice installed)
-            # Alternative: use subprocess to call 'antiword' or similar tool
-            output_dir = tempfile.mkdtemp()
-            output_file = os.path.join(output_dir, 'converted.docx')
+            started = time.perf_counter()
             
-            # Try using LibreOffice for conversion
+            # Preferred: the long-lived LibreOffice listener (no cold start per file)
             try:
-                subprocess.run([
-                    'soffice',
-                    '--headless',
-                    '--convert-to', 'docx',
-                    '--outdir', output_dir,
-                    filepath
-                ], check=True, timeout=30)
-                
-                # Find the converted file
-                converted_files = [f for f in os.listdir(output_dir) if f.endswith('.docx')]
-                if converted_files:
-                    converted_path = os.path.join(output_dir, converted_files[0])
-                    return self._extract_from_docx(converted_path)
-            except (subprocess.CalledProcessError, FileNotFoundError):
+                converted = get_doc_converter().convert(filepath, 'docx')
+                self._add_stage_time('doc_convert', time.perf_counter() - started)
+                result = self._extract_from_docx(BytesIO(converted))
+                result['extraction_method'] = 'unoserver+docx'
+                return result
+            except ConversionError as e:
+                print(f"Document converter failed ({str(e)}), trying other converters")
+            
+            # Fallback: one-off LibreOffice run, in a directory that is always removed
+            try:
+                with tempfile.TemporaryDirectory(prefix='cv-doc-') as output_dir:
+                    converted_path = convert_with_soffice(filepath, output_dir)
+                    if converted_path:
+                        self._add_stage_time('doc_convert', time.perf_counter() - started)
+                        return self._extract_from_docx(converted_path)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
                 # LibreOffice not available, try alternative method
                 pass
             
@@ -128,6 +299,7 @@ class CVTextExtractor:
                 )
                 if result.returncode == 0:
                     full_text = result.stdout
+                    self._add_stage_time('doc_convert', time.perf_counter() - started)
                     return {
                         'full_text': full_text,
                         'parsed_fields': self._parse_cv_text(full_text),
@@ -142,50 +314,12 @@ class CVTextExtractor:
             raise Exception(f"Error extracting DOC: {str(e)}")
     
     def _extract_from_pdf(self, filepath: str) -> Dict:
-        """Extract text from PDF with OCR fallback"""
+        """Extract text from PDF page by page, OCR-ing only pages without a usable text layer"""
         try:
-            # Try normal text extraction first - extract_text processes ALL pages by default
-            full_text = pdf_extract_text(filepath)
-            
-            # Clean up extracted text
-            full_text = full_text.strip()
-            
-            print(f"PDF text extraction: {len(full_text)} characters extracted")
-            
-            # Check if extraction was successful
-            # Lower threshold - even 20 chars might indicate text-based PDF
-            if len(full_text) >= 20:
-                # Check if the text has meaningful content (not just spaces/special chars)
-                meaningful_chars = sum(1 for c in full_text if c.isalnum())
-                
-                if meaningful_chars >= 15:  # At least 15 alphanumeric characters
-                    print(f"PDF has extractable text ({meaningful_chars} meaningful chars)")
-                    return {
-                        'full_text': full_text,
-                        'parsed_fields': self._parse_cv_text(full_text),
-                        'extraction_method': 'pdfminer'
-                    }
-            
-            # Insufficient text - likely a scanned PDF, apply OCR
-            print(f"Extracted text insufficient ({len(full_text)} chars), applying OCR...")
-            ocr_text = self._ocr_pdf(filepath)
-            
-            # Use OCR text if it's more substantial than extracted text
-            if len(ocr_text.strip()) > len(full_text):
-                final_text = ocr_text
-            else:
-                # Merge both if extracted text has some content
-                final_text = (full_text + '\n' + ocr_text).strip()
-            
-            return {
-                'full_text': final_text,
-                'parsed_fields': self._parse_cv_text(final_text),
-                'extraction_method': 'ocr' if not full_text else 'pdfminer+ocr'
-            }
-            
+            page_texts = self._extract_pdf_page_texts(filepath)
         except Exception as e:
-            # If pdfminer fails, try OCR directly
-            print(f"PDFMiner error: {str(e)}, falling back to OCR")
+            # If no text engine can read the PDF, try OCR directly
+            print(f"PDF text extraction error: {str(e)}, falling back to OCR")
             try:
                 ocr_text = self._ocr_pdf(filepath)
                 return {
@@ -195,42 +329,120 @@ class CVTextExtractor:
                 }
             except Exception as ocr_error:
                 raise Exception(f"Error extracting PDF: {str(e)}. OCR also failed: {str(ocr_error)}")
+        
+        print(f"PDF text extraction: {sum(len(t) for t in page_texts)} characters extracted from {len(page_texts)} pages")
+        
+        # Pages whose text layer is empty or garbage (scanned pages, certificates, ...)
+        ocr_pages = [i + 1 for i, text in enumerate(page_texts) if not self._has_text_layer(text)]
+        if len(ocr_pages) > self.max_ocr_pages:
+            print(f"{len(ocr_pages)} pages need OCR, only the first {self.max_ocr_pages} will be OCR'd")
+            ocr_pages = ocr_pages[:self.max_ocr_pages]
+        
+        ocr_used = False
+        if ocr_pages:
+            print(f"Pages without a usable text layer: {ocr_pages}, applying OCR...")
+            try:
+                ocr_texts = self._ocr_pages(filepath, ocr_pages)
+            except Exception as e:
+                print(f"OCR Error details: {str(e)}")
+                ocr_texts = []
+                if not any(self._has_text_layer(text) for text in page_texts):
+                    raise Exception(f"Error during OCR: {str(e)}. Make sure Tesseract is installed and in PATH.")
+            
+            for page_number, ocr_text in zip(ocr_pages, ocr_texts):
+                # Use OCR text if it's more substantial than the extracted text
+                if len(ocr_text.strip()) > len(page_texts[page_number - 1].strip()):
+                    page_texts[page_number - 1] = ocr_text
+                    ocr_used = True
+        
+        # Merge pages back in document order
+        full_text = '\n\n'.join(text.strip() for text in page_texts if text.strip())
+        
+        text_engine = self.metrics.get('pdf_text_engine', 'pdfminer')
+        if not ocr_used:
+            extraction_method = text_engine
+        elif len(ocr_pages) == len(page_texts):
+            extraction_method = 'ocr'
+        else:
+            extraction_method = f'{text_engine}+ocr'
+        
+        return {
+            'full_text': full_text,
+            'parsed_fields': self._parse_cv_text(full_text),
+            'extraction_method': extraction_method
+        }
+    
+    def _extract_pdf_page_texts(self, filepath: str) -> List[str]:
+        """
+        Extract the text layer of every PDF page, one string per page
+        
+        Engines are tried in order (fast pdftotext first by default). An
+        engine's output is accepted unless some page has text that fails
+        the text-layer check (e.g. undecodable fonts), in which case the
+        next engine gets a go and the output with most usable pages wins.
+        Empty pages don't count against an engine: they are scans, which
+        no engine can read and OCR handles.
+        """
+        if not self.pdf_text_engines:
+            raise Exception("No PDF text engine available")
+        
+        best = None
+        last_error = None
+        for engine in self.pdf_text_engines:
+            started = time.perf_counter()
+            try:
+                page_texts = engine.extract_pages(filepath)
+            except Exception as e:
+                print(f"PDF text engine {engine.name} failed: {str(e)}")
+                last_error = e
+                continue
+            finally:
+                self._add_stage_time(engine.name, time.perf_counter() - started)
+            
+            usable = sum(1 for text in page_texts if self._has_text_layer(text))
+            garbled = sum(1 for text in page_texts if text.strip() and not self._has_text_layer(text))
+            print(f"PDF text engine {engine.name}: {usable}/{len(page_texts)} pages with a usable text layer")
+            
+            if best is None or usable > best[1]:
+                best = (engine.name, usable, page_texts)
+            if not garbled:
+                break
+        
+        if best is None:
+            raise last_error
+        
+        self.metrics['pdf_text_engine'] = best[0]
+        return best[2]
+    
+    def _has_text_layer(self, text: str) -> bool:
+        """Check whether a page's extracted text is real content rather than empty or garbage"""
+        # Fonts without a ToUnicode map come out as "(cid:123)" runs
+        text = re.sub(r'\(cid:\d+\)', '', text)
+        visible = [c for c in text if not c.isspace()]
+        meaningful_chars = sum(1 for c in visible if c.isalnum())
+        
+        if meaningful_chars < 15:  # At least 15 alphanumeric characters
+            return False
+        
+        # Mostly symbols/replacement characters means a broken encoding
+        return meaningful_chars / len(visible) >= 0.4
     
     def _ocr_pdf(self, filepath: str) -> str:
         """Apply OCR to PDF pages with image preprocessing"""
         try:
-            # Convert PDF pages to images at high DPI for better OCR accuracy
-            print(f"Converting PDF to images for OCR...")
+            kwargs = {'poppler_path': POPPLER_PATH} if POPPLER_PATH else {}
+            page_count = int(pdfinfo_from_path(filepath, **kwargs).get('Pages', 0))
             
-            # Use poppler path if available
-            if POPPLER_PATH:
-                images = convert_from_path(filepath, dpi=300, fmt='png', poppler_path=POPPLER_PATH)
-            else:
-                images = convert_from_path(filepath, dpi=300, fmt='png')
+            if page_count > self.max_ocr_pages:
+                print(f"PDF has {page_count} pages, only the first {self.max_ocr_pages} will be OCR'd")
+                page_count = self.max_ocr_pages
             
-            print(f"OCR processing {len(images)} pages from PDF...")
+            print(f"OCR processing {page_count} pages from PDF...")
+            
+            page_texts = self._ocr_pages(filepath, list(range(1, page_count + 1)))
             
             ocr_texts = []
-            for i, image in enumerate(images):
-                # Preprocess image for better OCR
-                # Convert to grayscale
-                image = image.convert('L')
-                
-                # Enhance contrast
-                enhancer = ImageEnhance.Contrast(image)
-                image = enhancer.enhance(2.0)
-                
-                # Sharpen image
-                image = image.filter(ImageFilter.SHARPEN)
-                
-                # Apply OCR to each page with custom config
-                # PSM 3 = Fully automatic page segmentation, but no OSD (default)
-                # PSM 6 = Assume a single uniform block of text
-                custom_config = r'--oem 3 --psm 3'
-                text = pytesseract.image_to_string(image, lang='eng', config=custom_config)
-                
-                print(f"Page {i+1}: {len(text)} characters extracted via OCR")
-                
+            for i, text in enumerate(page_texts):
                 # Only include pages with meaningful text
                 if len(text.strip()) > 10:  # Lower threshold - even 10 chars could be useful
                     ocr_texts.append(text)
@@ -249,6 +461,82 @@ class CVTextExtractor:
             print(f"OCR Error details: {str(e)}")
             raise Exception(f"Error during OCR: {str(e)}. Make sure Tesseract is installed and in PATH.")
     
+    def _ocr_pages(self, filepath: str, page_numbers: List[int]) -> List[str]:
+        """
+        Rasterize and OCR the given (1-based) PDF pages on the shared process pool
+        
+        Each pool worker renders and OCRs one page at a time, so at most
+        `ocr_workers` page images exist at once. Returns one text per page,
+        in the order of `page_numbers`. Pages that time out or fail come
+        back as empty strings; the other pages are kept.
+        
+        A page that misses its deadline is still being worked on by its
+        pool worker (or its worker died and the page was lost), so the pool
+        is replaced (its workers killed) and the pages not collected yet are
+        submitted again to the new one.
+        """
+        timeout = self.ocr_page_timeout
+        workers = min(self.ocr_workers, len(page_numbers))
+        texts = []
+        
+        # Single page or pool disabled: no point paying for IPC
+        if workers <= 1:
+            for page_number in page_numbers:
+                try:
+                    text, _, timings = _ocr_pdf_page(filepath, page_number, timeout, measure_rss=False)
+                    for stage, seconds in timings.items():
+                        self._add_stage_time(stage, seconds)
+                except Exception as e:
+                    # Tesseract timeouts/missing binary, poppler timeouts, unreadable pages
+                    print(f"Page {page_number}: OCR failed ({str(e)})")
+                    text = ''
+                print(f"Page {page_number}: {len(text)} characters extracted via OCR")
+                texts.append(text)
+            self.metrics['ocr_pages'] = len(page_numbers)
+            return texts
+        
+        pool = _get_ocr_pool(self.ocr_workers)
+        pending = list(enumerate(page_numbers))
+        texts = [''] * len(page_numbers)
+        worker_peak_kb = 0
+        while pending:
+            started = time.monotonic()
+            results = [pool.apply_async(_ocr_pdf_page, (filepath, page_number, timeout)) for _, page_number in pending]
+            timed_out = None
+            for i, ((index, page_number), result) in enumerate(zip(pending, results)):
+                try:
+                    # Page i may sit queued behind i // workers earlier rounds of pages
+                    # (rasterizing and OCR each get `timeout` seconds)
+                    deadline = started + 2 * timeout * (i // workers + 1) + 5
+                    text, peak_kb, timings = result.get(timeout=max(0, deadline - time.monotonic()))
+                    worker_peak_kb = max(worker_peak_kb, peak_kb)
+                    # Summed over pages, so with several workers this is CPU time, not wall time
+                    for stage, seconds in timings.items():
+                        self._add_stage_time(stage, seconds)
+                except multiprocessing.TimeoutError:
+                    print(f"Page {page_number}: OCR timed out after {timeout}s")
+                    text = ''
+                    timed_out = i
+                except Exception as e:
+                    # Tesseract timeouts/missing binary, poppler timeouts, unreadable pages
+                    print(f"Page {page_number}: OCR failed ({str(e)})")
+                    text = ''
+                print(f"Page {page_number}: {len(text)} characters extracted via OCR")
+                texts[index] = text
+                if timed_out is not None:
+                    break
+            if timed_out is None:
+                break
+            # The hung page still holds its worker: replace the pool and
+            # resubmit the pages that were not collected yet
+            _reset_ocr_pool()
+            pool = _get_ocr_pool(self.ocr_workers)
+            pending = pending[timed_out + 1:]
+        
+        self.metrics['ocr_pages'] = len(page_numbers)
+        self.metrics['ocr_worker_peak_rss_kb'] = worker_peak_kb
+        return texts
+    
     def _parse_cv_text(self, text: str) -> Dict:
         """
         Parse CV text into structured fields
@@ -256,19 +544,25 @@ class CVTextExtractor:
         Returns:
             Dict with extracted fields: name, email, phone, skills, education, experience, languages, certifications
         """
+        started = time.perf_counter()
+        
+        # Locate every section once, then hand each extractor its slice
+        sections = CVSections(text)
+        
         parsed = {
             'name': self._extract_name(text),
             'email': self._extract_email(text),
             'phone': self._extract_phone(text),
             'location': self._extract_location(text),
-            'skills': self._extract_skills(text),
-            'education': self._extract_education(text),
-            'experience': self._extract_experience(text),
-            'summary': self._extract_summary(text),
-            'languages': self._extract_languages(text),
-            'certifications': self._extract_certifications(text)
+            'skills': self._extract_skills(sections.get('skills')),
+            'education': self._extract_education(sections.get('education')),
+            'experience': self._extract_experience(sections.get('experience')),
+            'summary': self._extract_summary(sections.get('summary')),
+            'languages': self._extract_languages(sections.get('languages')),
+            'certifications': self._extract_certifications(sections.get('certifications'))
         }
         
+        self._add_stage_time('parse', time.perf_counter() - started)
         return parsed
     
     def _extract_name(self, text: str) -> Optional[str]:
@@ -379,41 +673,13 @@ class CVTextExtractor:
         
         return None
     
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract skills section - handles both formatted and jumbled text"""
+    def _extract_skills(self, skills_section: Optional[str]) -> List[str]:
+        """Extract skills from the skills section - handles both formatted and jumbled text"""
         skills = []
         
-        # Look for skills section
-        skills_section = self._extract_section(text, ['skills', 'technical skills', 'core competencies', 'key skills', 'competencies', 'hard skills', 'soft skills'])
-        
         if skills_section:
             print(f"Skills section found: {len(skills_section)} characters")
             
-            # Common technical skills to look for
-            common_skills = [
-                # Programming Languages
-                'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 
-                'kotlin', 'go', 'rust', 'r', 'matlab', 'scala', 'perl', 'sql',
-                # Web Technologies
-                'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-                'spring', 'asp.net', 'laravel', 'jquery', 'bootstrap', 'tailwind',
-                # Databases
-                'mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sqlite', 'cassandra',
-                'dynamodb', 'firebase',
-                # Cloud & DevOps
-                'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
-                'terraform', 'ansible', 'ci/cd',
-                # Data Science & ML
-                'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn',
-                'pandas', 'numpy', 'jupyter', 'data analysis', 'data visualization',
-                # Tools & Software
-                'excel', 'powerpoint', 'word', 'outlook', 'photoshop', 'illustrator',
-                'figma', 'sketch', 'jira', 'confluence', 'slack', 'trello',
-                # Soft Skills
-                'communication', 'leadership', 'teamwork', 'problem-solving', 'time management',
-                'critical thinking', 'analytical', 'creativity', 'adaptability', 'collaboration'
-            ]
-            
             # Filter out section headers that might be included
             section_headers = ['language', 'languages', 'soft skills', 'hard skills', 'technical skills', 
                              'certifications', 'education', 'experience', 'projects', 'achievements']
@@ -442,28 +708,23 @@ class CVTextExtractor:
                 if item and item not in skills:
                     skills.append(item)
             
-            # Method 2: Word-by-word matching for jumbled text
+            # Method 2: Vocabulary matching for jumbled text
             if len(skills) < 5:  # If we didn't find many skills, try harder
-                words_lower = skills_section.lower()
-                for skill in common_skills:
-                    # Look for the skill as a whole word
-                    if re.search(r'\b' + re.escape(skill) + r'\b', words_lower):
-                        # Capitalize properly
-                        skill_formatted = skill.upper() if skill.isupper() or len(skill) <= 3 else skill.title()
-                        if skill_formatted not in skills and skill not in skills:
-                            skills.append(skill_formatted)
-                            print(f"Found common skill: {skill_formatted}")
+                for skill in SKILL_MATCHER.find_keywords(skills_section):
+                    # Capitalize properly
+                    skill_formatted = skill.upper() if skill.isupper() or len(skill) <= 3 else skill.title()
+                    if skill_formatted not in skills and skill not in skills:
+                        skills.append(skill_formatted)
+                        print(f"Found common skill: {skill_formatted}")
         
         print(f"Extracted {len(skills)} skills")
         return skills[:100]  # Limit to 100 skills
     
-    def _extract_education(self, text: str) -> List[Dict]:
-        """Extract education history"""
+    def _extract_education(self, edu_section: Optional[str]) -> List[Dict]:
+        """Extract education history from the education section"""
         education = []
         seen_entries = set()
         
-        edu_section = self._extract_section(text, ['education', 'academic background', 'qualifications'])
-        
         if edu_section:
             print(f"Education section found: {len(edu_section)} characters")
             
@@ -562,13 +823,11 @@ class CVTextExtractor:
             'description': description[:300] if description else ''
         }
     
-    def _extract_experience(self, text: str) -> List[Dict]:
-        """Extract work experience"""
+    def _extract_experience(self, exp_section: Optional[str]) -> List[Dict]:
+        """Extract work experience from the experience section"""
         experience = []
         seen_entries = set()
         
-        exp_section = self._extract_section(text, ['experience', 'work experience', 'employment history', 'professional experience', 'volunteer experience'])
-        
         if exp_section:
             print(f"Experience section found: {len(exp_section)} characters")
             
@@ -660,163 +919,89 @@ class CVTextExtractor:
             'description': description[:500] if description else ''
         }
     
-    def _extract_summary(self, text: str) -> Optional[str]:
-        """Extract professional summary"""
-        summary_section = self._extract_section(text, ['summary', 'profile', 'objective', 'about me', 'professional summary'])
+    def _extract_summary(self, summary_section: Optional[str]) -> Optional[str]:
+        """Extract professional summary from the summary section"""
         return summary_section[:500] if summary_section else None
     
-    def _extract_languages(self, text: str) -> List[Dict]:
-        """Extract languages section - handles various formats"""
+    def _extract_languages(self, lang_section: Optional[str]) -> List[Dict]:
+        """Extract languages from the languages section - handles various formats"""
         languages = []
         seen_languages = set()
         
-        lang_section = self._extract_section(text, ['languages', 'language skills', 'language proficiency', 'language'])
-        
         if lang_section:
             print(f"Language section found: {len(lang_section)} characters")
             print(f"Language section content: {lang_section[:200]}...")
             
-            # Common languages to look for (expanded list)
-            common_langs = [
-                'english', 'spanish', 'french', 'german', 'chinese', 'mandarin', 'japanese', 'korean', 
-                'arabic', 'portuguese', 'russian', 'italian', 'dutch', 'hindi', 'khmer', 'cambodian',
-                'vietnamese', 'thai', 'indonesian', 'malay', 'tagalog', 'turkish', 'polish', 'ukrainian',
-                'greek', 'czech', 'swedish', 'finnish', 'danish', 'norwegian', 'hebrew', 'bengali',
-                'urdu', 'punjabi', 'tamil', 'telugu', 'burmese', 'lao', 'nepali'
-            ]
-            
-            # Proficiency levels
-            proficiency_map = {
-                'native': 'Native',
-                'mother tongue': 'Native',
-                'fluent': 'Native',
-                'advanced': 'Advanced',
-                'proficient': 'Advanced',
-                'upper intermediate': 'Advanced',
-                'intermediate': 'Intermediate',
-                'conversational': 'Intermediate',
-                'basic': 'Basic',
-                'beginner': 'Basic',
-                'elementary': 'Basic',
-                'limited': 'Basic',
-                'working proficiency': 'Intermediate'
-            }
+            # One pass of each matcher over the whole section; the methods
+            # below only look up the hits that fall inside an item or line
+            lang_hits = LANGUAGE_MATCHER.find_spans(lang_section)
+            proficiency_hits = PROFICIENCY_MATCHER.find_spans(lang_section)
             
-            # Method 1: Try comma-separated format (e.g., "English, Khmer, Chinese")
+            def add_language(start: int, end: int, method: str, proficiency_span=None, first_unseen=True) -> bool:
+                """
+                Add a language found in lang_section[start:end]: the first one
+                not seen yet or, with first_unseen=False (comma-separated items),
+                the first one in vocabulary order, skipped if already seen
+                """
+                found = [kw for s, e, kw in lang_hits if start <= s and e <= end]
+                if first_unseen:
+                    found = [kw for kw in found if kw not in seen_languages]
+                if not found:
+                    return False
+                lang = min(found, key=LANGUAGE_MATCHER.rank)
+                if lang in seen_languages:
+                    return False
+                
+                # Determine proficiency from the item (or the part after the colon)
+                p_start, p_end = proficiency_span or (start, end)
+                levels = [kw for s, e, kw in proficiency_hits if p_start <= s and e <= p_end]
+                proficiency = PROFICIENCY_LEVELS[min(levels, key=PROFICIENCY_MATCHER.rank)] if levels else 'Intermediate'
+                
+                display_name = LANGUAGE_DISPLAY_NAMES.get(lang, lang.capitalize())
+                languages.append({
+                    'language': display_name,
+                    'proficiency': proficiency
+                })
+                seen_languages.add(lang)
+                print(f"Parsed language ({method}): {display_name} - {proficiency}")
+                return True
+            
+            # Method 1: Comma-separated format (e.g., "English, Khmer, Chinese")
             if ',' in lang_section:
-                # Split by commas and process each item
-                items = re.split(r'[,;]', lang_section)
-                for item in items:
-                    item_lower = item.lower().strip()
-                    # Remove bullet points, numbers, dashes
-                    item_lower = re.sub(r'^[\d\.\)\-\*•·\s]+', '', item_lower).strip()
-                    
-                    if not item_lower or len(item_lower) > 50:
+                for item in re.finditer(r'[^,;]+', lang_section):
+                    item_text = _BULLET_PREFIX_RE.sub('', item.group().strip()).strip()
+                    if not item_text or len(item_text) > 50:
                         continue
-                    
-                    # Check if it contains a language name
-                    found_lang = None
-                    for lang in common_langs:
-                        if re.search(r'\b' + re.escape(lang) + r'\b', item_lower):
-                            found_lang = lang
-                            break
-                    
-                    if found_lang and found_lang not in seen_languages:
-                        # Determine proficiency from the item
-                        proficiency = 'Intermediate'  # Default
-                        for key, value in proficiency_map.items():
-                            if key in item_lower:
-                                proficiency = value
-                                break
-                        
-                        # Handle special language names
-                        display_name = found_lang.capitalize()
-                        if found_lang == 'mandarin':
-                            display_name = 'Chinese (Mandarin)'
-                        elif found_lang == 'cambodian':
-                            display_name = 'Khmer'
-                        
-                        languages.append({
-                            'language': display_name,
-                            'proficiency': proficiency
-                        })
-                        seen_languages.add(found_lang)
-                        print(f"Parsed language (comma-sep): {display_name} - {proficiency}")
+                    add_language(item.start(), item.end(), 'comma-sep', first_unseen=False)
             
             # Method 2: Line-by-line parsing
-            lines = lang_section.split('\n')
-            for line in lines:
-                line_lower = line.lower().strip()
-                if not line_lower or len(line_lower) > 100:
+            for line in re.finditer(r'[^\n]+', lang_section):
+                line_text = line.group()
+                if not line_text.strip() or len(line_text.strip()) > 100:
                     continue
                 
-                # Clean up line
-                line_lower = re.sub(r'^[\d\.\)\-\*•·\s]+', '', line_lower).strip()
+                # Skip bullet points, numbers, dashes
+                bullet = _BULLET_PREFIX_RE.match(line_text)
+                offset = line.start() + (bullet.end() if bullet else 0)
+                line_lower = line_text[bullet.end() if bullet else 0:].lower()
                 
-                # Try to parse "Language: Proficiency" format
-                colon_match = re.match(r'^\s*([a-z\s]+)\s*[:|-]\s*(.+)$', line_lower)
-                if colon_match:
-                    lang_name = colon_match.group(1).strip()
-                    proficiency_text = colon_match.group(2).strip()
-                    
-                    # Check if it's a valid language
-                    found = False
-                    for lang in common_langs:
-                        if lang in lang_name and lang not in seen_languages:
-                            # Determine proficiency level from the text
-                            proficiency = 'Intermediate'  # Default
-                            for key, value in proficiency_map.items():
-                                if key in proficiency_text:
-                                    proficiency = value
-                                    break
-                            
-                            display_name = lang.capitalize()
-                            if lang == 'cambodian':
-                                display_name = 'Khmer'
-                            
-                            languages.append({
-                                'language': display_name,
-                                'proficiency': proficiency
-                            })
-                            seen_languages.add(lang)
-                            print(f"Parsed language (colon format): {display_name} - {proficiency}")
-                            found = True
-                            break
-                    
-                    if found:
-                        continue
+                # "Language: Proficiency" format
+                colon_match = _LANGUAGE_COLON_RE.match(line_lower)
+                if colon_match and add_language(
+                        offset + colon_match.start(1), offset + colon_match.end(1), 'colon format',
+                        proficiency_span=(offset + colon_match.start(2), offset + colon_match.end(2))):
+                    continue
                 
                 # Method 3: Just check if line contains a common language
-                for lang in common_langs:
-                    if re.search(r'\b' + re.escape(lang) + r'\b', line_lower) and lang not in seen_languages:
-                        # Determine proficiency level
-                        proficiency = 'Intermediate'  # Default
-                        for key, value in proficiency_map.items():
-                            if key in line_lower:
-                                proficiency = value
-                                break
-                        
-                        display_name = lang.capitalize()
-                        if lang == 'cambodian':
-                            display_name = 'Khmer'
-                        
-                        languages.append({
-                            'language': display_name,
-                            'proficiency': proficiency
-                        })
-                        seen_languages.add(lang)
-                        print(f"Parsed language (inline): {display_name} - {proficiency}")
-                        break
+                add_language(line.start(), line.end(), 'inline')
         
         print(f"Extracted {len(languages)} languages")
         return languages  # No limit
     
-    def _extract_certifications(self, text: str) -> List[Dict]:
-        """Extract certifications section"""
+    def _extract_certifications(self, cert_section: Optional[str]) -> List[Dict]:
+        """Extract certifications from the certifications section"""
         certifications = []
         
-        cert_section = self._extract_section(text, ['certifications', 'certificates', 'licenses', 'professional certifications'])
-        
         if cert_section:
             # Split by lines
             lines = cert_section.split('\n')
@@ -846,80 +1031,6 @@ class CVTextExtractor:
         
         print(f"Extracted {len(certifications)} certifications")
         return certifications  # No limit
-    
-    def _extract_section(self, text: str, keywords: List[str]) -> Optional[str]:
-        """Extract a section of text based on keywords - handles both proper formatting and jumbled text"""
-        text_lower = text.lower()
-        
-        for keyword in keywords:
-            # Pattern 1: Properly formatted with newlines
-            pattern_newline = r'\n\s*' + re.escape(keyword) + r'\s*[:|\n]'
-            match = re.search(pattern_newline, text_lower)
-            
-            # Pattern 2: Jumbled text (keyword in uppercase or title case without newlines)
-            if not match:
-                # Look for keyword in uppercase (e.g., "SKILLS" or "EXPERIENCE")
-                pattern_upper = re.escape(keyword.upper()) + r'(?:\s*[:|\s])'
-                match = re.search(pattern_upper, text_lower)
-            
-            # Pattern 3: Title case in jumbled text (e.g., "Skills" or "Experience")  
-            if not match:
-                pattern_title = r'\b' + re.escape(keyword.title()) + r'(?:\s*[:|\s])'
-                match = re.search(pattern_title, text)
-            
-            if match:
-                start_idx = match.end()
-                
-                # Find next section - check for any common section headers
-                next_section_keywords = [
-                    'education', 'experience', 'work experience', 'employment',
-                    'skills', 'technical skills', 'core competencies', 'competencies',
-                    'certifications', 'certificates', 'certification',
-                    'language', 'languages',
-                    'projects', 'project',
-                    'references', 'volunteer', 'volunteering',
-                    'achievements', 'achievement', 'awards', 'award',
-                    'soft skills', 'hard skills', 'technical', 'professional',
-                    'summary', 'profile', 'objective',
-                    'contact', 'personal information'
-                ]
-                
-                # Try different patterns to find end of section
-                end_idx = None
-                
-                # Pattern 1: Newline + section header
-                next_pattern_newline = r'\n\s*(?:' + '|'.join([re.escape(kw) for kw in next_section_keywords]) + r')\s*[:|\n]'
-                next_match = re.search(next_pattern_newline, text_lower[start_idx:])
-                
-                if next_match:
-                    end_idx = start_idx + next_match.start()
-                
-                # Pattern 2: Uppercase section header in jumbled text
-                if not end_idx:
-                    next_pattern_upper = r'(?:' + '|'.join([re.escape(kw.upper()) for kw in next_section_keywords]) + r')(?:\s*[:|\s])'
-                    next_match = re.search(next_pattern_upper, text_lower[start_idx:])
-                    if next_match:
-                        end_idx = start_idx + next_match.start()
-                
-                # Pattern 3: Title case section header in jumbled text
-                if not end_idx:
-                    next_pattern_title = r'\b(?:' + '|'.join([re.escape(kw.title()) for kw in next_section_keywords]) + r')(?:\s*[:|\s])'
-                    next_match = re.search(next_pattern_title, text[start_idx:])
-                    if next_match:
-                        end_idx = start_idx + next_match.start()
-                
-                if end_idx:
-                    section_text = text[start_idx:end_idx].strip()
-                    next_section_name = text_lower[end_idx:end_idx + 30].strip()
-                    print(f"Section '{keyword}' found: {len(section_text)} chars, ends before '{next_section_name[:20]}'")
-                else:
-                    # Return rest of document (limit to reasonable length to avoid including unrelated content)
-                    section_text = text[start_idx:start_idx + 2000].strip()
-                    print(f"Section '{keyword}' found: {len(section_text)} chars (limited from rest)")
-                
-                return section_text
-        
-        return None
 
 
 # Singleton instance
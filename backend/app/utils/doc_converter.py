@@ -0,0 +1,349 @@
+"""
+DOC Converter
+Converts legacy .doc files to .docx through a long-lived LibreOffice
+listener (unoserver) instead of cold-starting `soffice` for every upload.
+
+The listener is started on first use (unless one is already listening on
+UNOSERVER_HOST:UNOSERVER_PORT, e.g. started by another gunicorn worker),
+health-checked before each conversion and restarted if it died or hung.
+Requests beyond DOC_CONVERT_MAX_PENDING are refused instead of piling up.
+
+Several processes (gunicorn workers, analysis workers, reextract_cvs.py)
+share one listener, but only one of them started it. Its pid is kept in
+DOC_CONVERTER_PID_FILE, and every process starts, kills or restarts the
+listener only while holding an flock on `<pid file>.lock`. So when a
+conversion fails in any process, that process can replace the listener,
+not just the process that owns it.
+"""
+import atexit
+import os
+import signal
+import shlex
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import xmlrpc.client
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: restarts are not coordinated across processes
+    fcntl = None
+
+# Defaults (overridden by Config below)
+UNOSERVER_HOST = '127.0.0.1'
+UNOSERVER_PORT = 2003
+UNOSERVER_CMD = 'unoserver'
+DOC_CONVERTER_MANAGED = True  # start/restart the listener from the app
+DOC_CONVERT_TIMEOUT = 30  # seconds per conversion
+DOC_CONVERT_MAX_PENDING = 8  # conversions waiting or running per process
+STARTUP_TIMEOUT = 30  # seconds for a fresh listener to accept connections
+DOC_CONVERTER_PID_FILE = None  # default: <temp dir>/unoserver-<port>.pid
+
+try:
+    from config import Config
+    UNOSERVER_HOST = getattr(Config, 'UNOSERVER_HOST', UNOSERVER_HOST)
+    UNOSERVER_PORT = getattr(Config, 'UNOSERVER_PORT', UNOSERVER_PORT)
+    UNOSERVER_CMD = getattr(Config, 'UNOSERVER_CMD', UNOSERVER_CMD)
+    DOC_CONVERTER_MANAGED = getattr(Config, 'DOC_CONVERTER_MANAGED', DOC_CONVERTER_MANAGED)
+    DOC_CONVERT_TIMEOUT = getattr(Config, 'DOC_CONVERT_TIMEOUT', DOC_CONVERT_TIMEOUT)
+    DOC_CONVERT_MAX_PENDING = getattr(Config, 'DOC_CONVERT_MAX_PENDING', DOC_CONVERT_MAX_PENDING)
+    DOC_CONVERTER_PID_FILE = getattr(Config, 'DOC_CONVERTER_PID_FILE', DOC_CONVERTER_PID_FILE)
+except Exception:
+    pass
+
+
+class ConversionError(Exception):
+    """A document could not be converted by the listener"""
+
+
+class ConverterBusy(ConversionError):
+    """Too many conversions already queued"""
+
+
+class ConverterUnavailable(ConversionError):
+    """The LibreOffice listener is not running and could not be started"""
+
+
+class _TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport with a socket timeout"""
+
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        return connection
+
+
+def _is_running(pid: int) -> bool:
+    """Whether pid is alive; a zombie (dead, waiting for its parent to reap it) counts as gone"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except OSError:
+        return True
+
+
+class DocConverter:
+    """Client for a (managed) unoserver listener"""
+
+    def __init__(self, host: str = UNOSERVER_HOST, port: int = UNOSERVER_PORT, command: str = UNOSERVER_CMD,
+                 managed: bool = DOC_CONVERTER_MANAGED, timeout: int = DOC_CONVERT_TIMEOUT,
+                 max_pending: int = DOC_CONVERT_MAX_PENDING, pid_file: Optional[str] = DOC_CONVERTER_PID_FILE):
+        self.host = host
+        self.port = int(port)
+        self.command = command
+        self.managed = managed
+        self.timeout = timeout
+        self.pid_file = pid_file or os.path.join(tempfile.gettempdir(), f'unoserver-{self.port}.pid')
+        self._process = None
+        self._listener_pid = None  # pid of the listener the last health check found, whoever started it
+        self._profile_dir = None
+        self._lock = threading.Lock()
+        # Bounded queue: waiting + running conversions
+        self._pending = threading.BoundedSemaphore(max_pending)
+        # LibreOffice converts one document at a time; don't pile requests onto it
+        self._active = threading.Lock()
+
+    def is_healthy(self) -> bool:
+        """Whether the listener accepts connections"""
+        if self._process is not None and self._process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((self.host, self.port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def ensure_running(self):
+        """Start (or restart) the listener if it isn't answering"""
+        with self._lock:
+            if self.is_healthy():
+                self._listener_pid = self._read_pid()
+                return
+            if not self.managed:
+                raise ConverterUnavailable(f"No document converter listening on {self.host}:{self.port}")
+            with self._listener_lock():
+                if self._process is not None and self._process.poll() is not None:
+                    self._stop()  # ours died, or another process replaced it: reap it, never kill the new one
+                # Another process may have restarted it while we waited for the lock
+                if self.is_healthy():
+                    self._listener_pid = self._read_pid()
+                    return
+                self._stop()
+                self._kill_listener(self._read_pid())  # not answering, but maybe still holding the port
+                self._start()
+                self._listener_pid = self._read_pid()
+
+    def replace_listener(self):
+        """
+        Kill the listener after a conversion failed, whichever process started
+        it; the next ensure_running starts a new one. Does nothing if it was
+        already replaced since this process last checked it.
+        """
+        with self._lock, self._listener_lock():
+            pid = self._read_pid()
+            if pid is None or pid != self._listener_pid:
+                return
+            if self._process is not None and self._process.pid == pid:
+                self._stop()
+            else:
+                self._kill_listener(pid)
+            self._listener_pid = None
+
+    @contextmanager
+    def _listener_lock(self):
+        """Across processes: one at a time starts or kills the listener"""
+        if fcntl is None:
+            yield
+            return
+        with open(f'{self.pid_file}.lock', 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read_pid(self) -> Optional[int]:
+        try:
+            with open(self.pid_file) as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _write_pid(self, pid: Optional[int]):
+        if pid is None:
+            if os.path.exists(self.pid_file):
+                os.unlink(self.pid_file)
+            return
+        with open(self.pid_file, 'w') as f:
+            f.write(str(pid))
+
+    def _kill_listener(self, pid: Optional[int]):
+        """Kill a listener another process started (its whole session: unoserver and soffice)"""
+        if pid is None or not hasattr(os, 'killpg'):
+            return  # on Windows only the process that started the listener can replace it
+        try:
+            # The pid may have been reused since the file was written
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                if b'unoserver' not in f.read():
+                    self._write_pid(None)
+                    return
+        except FileNotFoundError:
+            self._write_pid(None)
+            return
+        except OSError:
+            pass  # no /proc: trust the pid file
+
+        print(f"Killing unresponsive document converter (pid {pid})")
+        try:
+            os.killpg(pid, signal.SIGTERM)
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                if not _is_running(pid):
+                    break
+                time.sleep(0.2)
+            else:
+                os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # gone
+        except PermissionError as e:
+            raise ConverterUnavailable(f"Cannot stop the document converter (pid {pid}): {str(e)}")
+        self._write_pid(None)
+
+    def _start(self):
+        # Own LibreOffice profile, so a stale lock from a crashed run can't block startup
+        self._profile_dir = tempfile.mkdtemp(prefix='unoserver-profile-')
+        command = shlex.split(self.command) + [
+            '--interface', self.host,
+            '--port', str(self.port),
+            '--user-installation', f'file://{self._profile_dir}',
+        ]
+        print(f"Starting document converter: {' '.join(command)}")
+        try:
+            self._process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                             start_new_session=True)
+        except FileNotFoundError as e:
+            self._stop()
+            raise ConverterUnavailable(f"Document converter not installed: {str(e)}")
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                # Lost the race to another worker that bound the port first - use theirs
+                self._process = None
+                self._stop()  # only our unused profile is left to remove
+                if self.is_healthy():
+                    return
+                raise ConverterUnavailable("Document converter exited during startup")
+            if self.is_healthy():
+                self._write_pid(self._process.pid)
+                print(f"Document converter ready on {self.host}:{self.port}")
+                return
+            time.sleep(0.2)
+
+        self._stop()
+        raise ConverterUnavailable(f"Document converter did not start within {STARTUP_TIMEOUT}s")
+
+    def _stop(self):
+        """Terminate the listener this process started and remove its profile"""
+        if self._process is not None:
+            if self._read_pid() == self._process.pid:
+                self._write_pid(None)
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+    def shutdown(self):
+        with self._lock:
+            self._stop()
+
+    def convert(self, filepath: str, convert_to: str = 'docx') -> bytes:
+        """
+        Convert a document and return the converted file's bytes
+
+        Raises:
+            ConverterBusy: DOC_CONVERT_MAX_PENDING conversions already queued
+            ConverterUnavailable: listener can't be reached or started
+        """
+        if not self._pending.acquire(blocking=False):
+            raise ConverterBusy("Too many documents are being converted, please retry shortly")
+        try:
+            started = time.monotonic()
+            if not self._active.acquire(timeout=self.timeout):
+                raise ConverterBusy("Timed out waiting for the document converter")
+            try:
+                self.ensure_running()
+                with open(filepath, 'rb') as f:
+                    indata = xmlrpc.client.Binary(f.read())
+
+                remaining = max(1, self.timeout - (time.monotonic() - started))
+                proxy = xmlrpc.client.ServerProxy(f'http://{self.host}:{self.port}',
+                                                  transport=_TimeoutTransport(remaining), allow_none=True)
+                try:
+                    # unoserver API: convert(inpath, indata, outpath, convert_to, filtername,
+                    #                        filter_options, update_index, infiltername)
+                    result = proxy.convert(None, indata, None, convert_to, None, [], True, None)
+                except (OSError, xmlrpc.client.ProtocolError) as e:
+                    # A hung or crashed LibreOffice: replace it for the next request, even if another process started it
+                    if self.managed:
+                        self.replace_listener()
+                    raise ConverterUnavailable(f"Document conversion failed: {str(e)}")
+                except xmlrpc.client.Fault as e:
+                    # LibreOffice rejected the document itself (corrupt, password protected, ...)
+                    raise ConversionError(f"Document conversion failed: {e.faultString}")
+
+                data = result.data if isinstance(result, xmlrpc.client.Binary) else result
+                print(f"Converted {os.path.basename(filepath)} to {convert_to} in {time.monotonic() - started:.2f}s")
+                return data
+            finally:
+                self._active.release()
+        finally:
+            self._pending.release()
+
+
+def convert_with_soffice(filepath: str, output_dir: str, convert_to: str = 'docx', timeout: int = DOC_CONVERT_TIMEOUT) -> Optional[str]:
+    """One-off `soffice --headless` conversion (slow cold start); returns the converted path"""
+    subprocess.run([
+        'soffice',
+        '--headless',
+        f'-env:UserInstallation=file://{output_dir}/profile',
+        '--convert-to', convert_to,
+        '--outdir', output_dir,
+        filepath
+    ], check=True, timeout=timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    converted_files = [f for f in os.listdir(output_dir) if f.endswith(f'.{convert_to}')]
+    return os.path.join(output_dir, converted_files[0]) if converted_files else None
+
+
+# One converter per process, created on first use
+_converter = None
+_converter_lock = threading.Lock()
+
+
+def get_doc_converter() -> DocConverter:
+    global _converter
+    with _converter_lock:
+        if _converter is None:
+            _converter = DocConverter()
+            atexit.register(_converter.shutdown)
+        return _converter
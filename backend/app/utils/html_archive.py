@@ -0,0 +1,139 @@
+"""
+Raw HTML Archive
+Every page the scraper downloads is kept, gzipped, so pages can be parsed
+again later without re-crawling.
+
+Layout under SCRAPER_ARCHIVE_DIR:
+    objects/ab/<sha256>.html.gz     page bodies, content-addressed (an unchanged
+                                    page fetched again is stored once)
+    index/YYYY-MM-DD.jsonl          one line per fetch: url, kind, sha256, fetched_at
+
+prune() drops index days older than SCRAPER_ARCHIVE_RETENTION_DAYS and the
+pages no remaining index day refers to; scheduler.py runs it after each scrape.
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, Optional
+
+# Defaults (overridden by Config below)
+SCRAPER_ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                   'scrape_archive')
+SCRAPER_ARCHIVE_RETENTION_DAYS = 90  # index days kept by prune() (0 = keep everything)
+
+try:
+    from config import Config
+    SCRAPER_ARCHIVE_DIR = getattr(Config, 'SCRAPER_ARCHIVE_DIR', SCRAPER_ARCHIVE_DIR)
+    SCRAPER_ARCHIVE_RETENTION_DAYS = getattr(Config, 'SCRAPER_ARCHIVE_RETENTION_DAYS', SCRAPER_ARCHIVE_RETENTION_DAYS)
+except Exception:
+    pass
+
+
+class HtmlArchive:
+    """Content-addressed store of fetched pages plus a per-day fetch index"""
+
+    def __init__(self, root: str = SCRAPER_ARCHIVE_DIR):
+        self.root = root
+        self._index_lock = threading.Lock()
+
+    def _object_path(self, sha: str) -> str:
+        return os.path.join(self.root, 'objects', sha[:2], f'{sha}.html.gz')
+
+    def store(self, url: str, html: str, kind: str, source: str = 'bongthom',
+              fetched_at: Optional[datetime] = None) -> str:
+        """Archive one fetched page; returns its sha256"""
+        data = html.encode('utf-8')
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+        # Local time, like the live scrape: relative posting dates are read against it
+        fetched_at = fetched_at or datetime.now()
+        entry = {'url': url, 'kind': kind, 'source': source, 'sha256': sha, 'fetched_at': fetched_at.isoformat()}
+        index_dir = os.path.join(self.root, 'index')
+        with self._index_lock:
+            os.makedirs(index_dir, exist_ok=True)
+            with open(os.path.join(index_dir, f'{fetched_at:%Y-%m-%d}.jsonl'), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+        return sha
+
+    def load(self, sha: str) -> str:
+        with gzip.open(self._object_path(sha), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def iter_index(self, kind: Optional[str] = None, source: Optional[str] = None,
+                   since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Dict]:
+        """Fetch entries in time order, optionally filtered; since/until are YYYY-MM-DD"""
+        index_dir = os.path.join(self.root, 'index')
+        if not os.path.isdir(index_dir):
+            return
+        for name in sorted(os.listdir(index_dir)):
+            day = name[:-len('.jsonl')]
+            if not name.endswith('.jsonl') or (since and day < since) or (until and day > until):
+                continue
+            with open(os.path.join(index_dir, name), encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # line cut short by a crash
+                    if (kind and entry['kind'] != kind) or (source and entry['source'] != source):
+                        continue
+                    entry['fetched_at'] = datetime.fromisoformat(entry['fetched_at'])
+                    yield entry
+
+    def latest(self, **filters) -> Dict[str, Dict]:
+        """Most recent fetch entry per URL (filters as for iter_index)"""
+        latest = {}
+        for entry in self.iter_index(**filters):
+            latest[entry['url']] = entry
+        return latest
+
+    def prune(self, retention_days: int = SCRAPER_ARCHIVE_RETENTION_DAYS,
+              now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Delete index days older than `retention_days` and every page no
+        remaining index day refers to. Returns how many of each were removed.
+        """
+        removed = {'index_days': 0, 'objects': 0}
+        index_dir = os.path.join(self.root, 'index')
+        if not retention_days or not os.path.isdir(index_dir):
+            return removed
+
+        now = now or datetime.now()
+        cutoff = f'{now - timedelta(days=retention_days):%Y-%m-%d}'
+        with self._index_lock:
+            for name in sorted(os.listdir(index_dir)):
+                if name.endswith('.jsonl') and name[:-len('.jsonl')] < cutoff:
+                    os.unlink(os.path.join(index_dir, name))
+                    removed['index_days'] += 1
+        if not removed['index_days']:
+            return removed
+
+        referenced = {entry['sha256'] for entry in self.iter_index()}
+        # A page is written before its index line: leave recent files alone in case a scrape is running
+        grace = time.time() - 3600
+        for dirpath, _, filenames in os.walk(os.path.join(self.root, 'objects')):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                sha = name.split('.', 1)[0]
+                if sha in referenced or os.path.getmtime(path) > grace:
+                    continue
+                os.unlink(path)
+                removed['objects'] += 1
+        return removed
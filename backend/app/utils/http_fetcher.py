@@ -0,0 +1,137 @@
+"""
+HTTP Page Fetcher
+Concurrent, polite page fetching for the job scrapers.
+
+- one pooled requests.Session shared by a small thread pool
+- per-host limits: at most SCRAPER_CONCURRENCY requests in flight and
+  request starts spaced to SCRAPER_RATE_LIMIT per second
+- retries with backoff on connection errors, 429 and 5xx (Retry-After honoured)
+- failures are logged and returned as None, so one bad page never stops a run
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridden by Config below)
+SCRAPER_CONCURRENCY = 4  # requests in flight per host
+SCRAPER_RATE_LIMIT = 2.0  # request starts per second per host (0 = unlimited)
+SCRAPER_TIMEOUT = 20  # seconds
+SCRAPER_RETRIES = 2
+SCRAPER_USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+
+try:
+    from config import Config
+    SCRAPER_CONCURRENCY = getattr(Config, 'SCRAPER_CONCURRENCY', SCRAPER_CONCURRENCY)
+    SCRAPER_RATE_LIMIT = getattr(Config, 'SCRAPER_RATE_LIMIT', SCRAPER_RATE_LIMIT)
+    SCRAPER_TIMEOUT = getattr(Config, 'SCRAPER_TIMEOUT', SCRAPER_TIMEOUT)
+    SCRAPER_RETRIES = getattr(Config, 'SCRAPER_RETRIES', SCRAPER_RETRIES)
+    SCRAPER_USER_AGENT = getattr(Config, 'SCRAPER_USER_AGENT', SCRAPER_USER_AGENT)
+except Exception:
+    pass
+
+
+class HostLimiter:
+    """Caps concurrent requests to one host and spaces out their start times"""
+
+    def __init__(self, concurrency: int, rate: float):
+        self.slots = threading.BoundedSemaphore(max(1, concurrency))
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.slots.acquire()
+        if self.interval:
+            # Reserve the next start time under the lock, sleep outside it
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self.interval
+            if start > now:
+                time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc):
+        self.slots.release()
+        return False
+
+
+class HttpFetcher:
+    """Fetches pages concurrently while keeping each host within its limits"""
+
+    def __init__(self, concurrency: int = SCRAPER_CONCURRENCY, rate: float = SCRAPER_RATE_LIMIT,
+                 timeout: float = SCRAPER_TIMEOUT, retries: int = SCRAPER_RETRIES,
+                 user_agent: str = SCRAPER_USER_AGENT):
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.timeout = timeout
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='fetch')
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            backoff_factor=1,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.concurrency, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': user_agent, 'Accept-Language': 'en-US,en;q=0.9'})
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).netloc
+        with self._limiters_lock:
+            if host not in self._limiters:
+                self._limiters[host] = HostLimiter(self.concurrency, self.rate)
+            return self._limiters[host]
+
+    def fetch(self, url: str) -> Optional[str]:
+        """HTML of `url`, or None if it could not be fetched"""
+        try:
+            with self._limiter(url):
+                started = time.monotonic()
+                response = self.session.get(url, timeout=self.timeout)
+            if response.status_code != 200:
+                logger.warning(f"⚠️ GET {url} returned {response.status_code}")
+                return None
+            # Servers often omit the charset; requests then assumes ISO-8859-1
+            if response.encoding is None or response.encoding.lower() == 'iso-8859-1':
+                response.encoding = response.apparent_encoding
+            logger.debug(f"GET {url} ({time.monotonic() - started:.2f}s)")
+            return response.text
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"⚠️ GET {url} failed: {str(e)}")
+            return None
+
+    def fetch_many(self, urls: Iterable[str]) -> Iterator[Tuple[str, Optional[str]]]:
+        """(url, html or None) for each url, in the given order, fetched concurrently"""
+        urls = list(urls)
+        return zip(urls, self._executor.map(self.fetch, urls))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
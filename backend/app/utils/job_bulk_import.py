@@ -0,0 +1,148 @@
+"""
+Bulk Job Import
+Set-based import of many jobs at once, instead of one INSERT + COMMIT per row.
+
+Rows are COPYed into a temporary staging table and merged into `jobs` with
+a single INSERT ... SELECT that skips jobs already in the table (same
+title and company) and duplicates within the batch. Temp tables are never
+WAL-logged, so the staging step costs about as much as writing the CSV.
+
+The merge can't use ON CONFLICT: jobs has no unique constraint on
+(title, company), and existing data may contain such duplicates. Instead
+a transaction-scoped advisory lock serializes concurrent imports, which
+makes the NOT EXISTS check race-free.
+"""
+import csv
+import io
+import uuid
+from datetime import date, datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import String, text
+
+from app import db
+from app.models import Job
+
+# Columns filled from imported rows; everything else gets the model default
+IMPORT_COLUMNS = [
+    'title', 'company', 'location', 'salary', 'job_type', 'category', 'description', 'requirements',
+    'logo', 'contact_email', 'contact_phone', 'website', 'status', 'deadline', 'posted_date',
+]
+DATE_COLUMNS = {'deadline', 'posted_date'}
+# NOT NULL in jobs without a fallback here: one such row would fail the whole INSERT
+REQUIRED_COLUMNS = ['title', 'company', 'location', 'job_type', 'category', 'description']
+
+# Any constant works, it only has to be the same for every importer
+IMPORT_LOCK_KEY = 7246001
+
+
+def _column_sql(name: str) -> str:
+    """Staging value cast/truncated to fit the jobs column (too-long values used to fail the row)"""
+    column = Job.__table__.columns[name]
+    if isinstance(column.type, String) and column.type.length:
+        return f'LEFT(s.{name}, {column.type.length})'
+    return f's.{name}'
+
+
+def _csv_value(name: str, value):
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:  # NaN from pandas
+        return None
+    if name in DATE_COLUMNS:
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        # Anything that isn't a clean ISO date would make the whole COPY fail
+        try:
+            return datetime.fromisoformat(str(value).strip()).isoformat()
+        except ValueError:
+            return None
+    return str(value)
+
+
+def _copy(cursor, sql: str, data: str):
+    """COPY FROM STDIN with psycopg2 or psycopg 3, whichever the engine uses"""
+    if hasattr(cursor, 'copy_expert'):
+        cursor.copy_expert(sql, io.StringIO(data))
+    else:
+        with cursor.copy(sql) as copy:
+            copy.write(data)
+
+
+def bulk_import_jobs(jobs: Iterable[Dict], commit: bool = True) -> Dict:
+    """
+    Insert jobs (dicts keyed by IMPORT_COLUMNS) that don't exist yet
+
+    Rows missing one of REQUIRED_COLUMNS are skipped and counted as
+    invalid; status defaults to 'active' and posted_date to now. Must run
+    inside an app context.
+
+    Returns:
+        {'total', 'inserted', 'duplicates', 'invalid', 'job_ids'} - job_ids
+        are the new jobs, for notification matching
+    """
+    now = datetime.utcnow()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    total = 0
+    invalid = 0
+    for row_no, job in enumerate(jobs):
+        total += 1
+        values = [_csv_value(name, job.get(name)) for name in IMPORT_COLUMNS]
+        if any(not (values[IMPORT_COLUMNS.index(name)] or '').strip() for name in REQUIRED_COLUMNS):
+            invalid += 1
+            continue
+        values[IMPORT_COLUMNS.index('status')] = values[IMPORT_COLUMNS.index('status')] or 'active'
+        values[IMPORT_COLUMNS.index('posted_date')] = values[IMPORT_COLUMNS.index('posted_date')] or now.isoformat()
+        writer.writerow([row_no, str(uuid.uuid4())] + values)
+
+    if total == invalid:
+        return {'total': total, 'inserted': 0, 'duplicates': 0, 'invalid': invalid, 'job_ids': []}
+
+    columns_ddl = ', '.join(f'{name} {"TIMESTAMP" if name in DATE_COLUMNS else "TEXT"}' for name in IMPORT_COLUMNS)
+    insert_columns = ', '.join(['id'] + IMPORT_COLUMNS + ['created_at', 'updated_at'])
+    select_columns = ', '.join(['s.id'] + [_column_sql(name) for name in IMPORT_COLUMNS] +
+                               ['CAST(:now AS TIMESTAMP)', 'CAST(:now AS TIMESTAMP)'])
+    # Duplicates are judged on the values as stored, i.e. after truncation
+    title, company = _column_sql('title'), _column_sql('company')
+
+    try:
+        connection = db.session.connection()
+        connection.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': IMPORT_LOCK_KEY})
+        connection.execute(text(
+            f'CREATE TEMP TABLE IF NOT EXISTS jobs_staging (row_no INTEGER, id UUID, {columns_ddl}) ON COMMIT DROP'
+        ))
+        connection.execute(text('TRUNCATE jobs_staging'))
+
+        cursor = connection.connection.cursor()
+        try:
+            _copy(cursor, f'COPY jobs_staging (row_no, id, {", ".join(IMPORT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)',
+                  buffer.getvalue())
+        finally:
+            cursor.close()
+
+        # First occurrence of each (title, company) in the batch, if not in jobs yet
+        result = connection.execute(text(f'''
+            INSERT INTO jobs ({insert_columns})
+            SELECT {select_columns}
+            FROM (
+                SELECT DISTINCT ON ({title}, {company}) *
+                FROM jobs_staging s
+                ORDER BY {title}, {company}, s.row_no
+            ) s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM jobs j WHERE j.title = {title} AND j.company = {company}
+            )
+            ORDER BY s.row_no
+            RETURNING id
+        '''), {'now': now})
+        job_ids: List[uuid.UUID] = [uuid.UUID(str(row[0])) for row in result]
+
+        if commit:
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {'total': total, 'inserted': len(job_ids), 'duplicates': total - invalid - len(job_ids),
+            'invalid': invalid, 'job_ids': job_ids}
@@ -0,0 +1,181 @@
+"""
+Scraped Job Frame Cleaning
+Shared, vectorized cleaning and validation of scraped job DataFrames
+(BongThom column names), used by the scraper, import_jobs_from_csv.py and
+validate_jobs_csv.py.
+
+Everything works on whole columns: dates are parsed with pd.to_datetime
+one explicit format at a time, strings with the .str accessor, and
+validation builds boolean masks, so a 100k-row frame takes a fraction of a
+second instead of a Python call per cell (benchmarks/job_cleaning_benchmark.py).
+"""
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+# Tried in order; a value is only parsed by the first format that matches it whole
+DATE_FORMATS = ('%d-%b-%Y', '%d %b %Y', '%d %B %Y', '%Y-%m-%d')
+# Date-like part of a longer text such as 'Closing date: 15 Jan 2026'
+DATE_SUBSTRING = r'(\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4})'
+
+DUPLICATE_SUBSET = ['Job Title', 'Company Name']
+
+# Database required fields
+REQUIRED_DB_FIELDS = {
+    'title': 'Job Title (NOT NULL)',
+    'company': 'Company Name (NOT NULL)',
+    'location': 'Location (NOT NULL)',
+    'job_type': 'Schedule/Job Type (NOT NULL)',
+    'category': 'Career Category (NOT NULL)',
+    'description': 'Description/Summary (NOT NULL)',
+}
+
+# CSV to Database column mapping
+CSV_TO_DB_MAPPING = {
+    'Job Title': 'title',
+    'Announcement Job Title': 'title',  # Fallback
+    'Company Name': 'company',
+    'Location': 'location',
+    'Office Address': 'location',  # Fallback
+    'Salary': 'salary',
+    'Schedule': 'job_type',
+    'Career Category': 'category',
+    'Announcement Description': 'description',
+    'Position Summary': 'description',  # Will be combined
+    'Duties & Responsibilities': 'description',  # Will be combined
+    'Qualifications': 'requirements',
+    'Skills & Knowledge': 'requirements',  # Will be combined
+    'Languages Required': 'requirements',  # Will be combined
+    'Company Logo': 'logo',
+    'Posting Date': 'posted_date',
+    'Deadline': 'deadline',
+}
+
+# Fields whose empty values are reported; empty critical fields make a row unimportable
+KEY_FIELDS = ['Job Title', 'Announcement Job Title', 'Company Name', 'Location',
+              'Office Address', 'Career Category', 'Schedule']
+CRITICAL_FIELDS = ['Job Title', 'Company Name']
+DATE_FIELDS = ['Deadline', 'Posting Date']
+
+
+def _is_text(values: pd.Series) -> bool:
+    # object columns with pandas < 3, 'str' columns with pandas >= 3
+    return values.dtype == object or pd.api.types.is_string_dtype(values.dtype)
+
+
+def _parse_formats(text: pd.Series) -> pd.Series:
+    parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    for fmt in DATE_FORMATS:
+        todo = parsed.isna() & text.notna()
+        if not todo.any():
+            break
+        parsed[todo] = pd.to_datetime(text[todo], format=fmt, errors='coerce')
+    return parsed
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """datetime64 column from scraped date texts; NaT where no format matches"""
+    text = values.astype('string').str.strip()
+    parsed = _parse_formats(text)
+    retry = parsed.isna() & text.notna()
+    if retry.any():
+        parsed[retry] = _parse_formats(text[retry].str.extract(DATE_SUBSTRING, expand=False))
+    return parsed
+
+
+def normalize_dates(values: pd.Series) -> pd.Series:
+    """ISO date strings (YYYY-MM-DD), None where the value is missing or unparseable"""
+    iso = parse_dates(values).dt.strftime('%Y-%m-%d')
+    return iso.astype(object).where(iso.notna(), None)
+
+
+def blank_mask(values: pd.Series) -> pd.Series:
+    """True where a value is missing or only whitespace"""
+    return values.isna() | values.astype('string').str.strip().eq('').fillna(False).astype(bool)
+
+
+def clean_jobs(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Drop duplicate title+company rows, strip strings, turn empty strings into
+    None and normalize Deadline to YYYY-MM-DD
+
+    Returns the cleaned frame and counts of what was changed.
+    """
+    report = {'rows': len(df), 'duplicates_removed': 0, 'invalid_deadlines': 0}
+    if all(col in df.columns for col in DUPLICATE_SUBSET):
+        df = df.drop_duplicates(subset=DUPLICATE_SUBSET, keep='first')
+        report['duplicates_removed'] = report['rows'] - len(df)
+    else:
+        df = df.copy()
+
+    for col in df.columns:
+        if _is_text(df[col]):
+            stripped = df[col].astype('string').str.strip()
+            df[col] = stripped.astype(object).where(stripped.notna() & stripped.ne('').fillna(False), None)
+
+    if 'Deadline' in df.columns:
+        given = df['Deadline'].notna()
+        df['Deadline'] = normalize_dates(df['Deadline'])
+        report['invalid_deadlines'] = int((given & df['Deadline'].isna()).sum())
+    return df, report
+
+
+def to_records(df: pd.DataFrame) -> List[Dict]:
+    """Row dicts with every NaN/NaT replaced by None"""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def _blank_masks(df: pd.DataFrame) -> Dict[str, pd.Series]:
+    return {col: blank_mask(df[col]) for col in KEY_FIELDS + DATE_FIELDS if col in df.columns}
+
+
+def issue_masks(df: pd.DataFrame, blank: Dict[str, pd.Series] = None) -> pd.DataFrame:
+    """One boolean column per kind of problem, one row per job"""
+    blank = blank if blank is not None else _blank_masks(df)
+    masks = pd.DataFrame(index=df.index)
+    all_blank = pd.Series(True, index=df.index)
+
+    title = blank.get('Job Title', all_blank)
+    if 'Announcement Job Title' in blank:
+        title = title & blank['Announcement Job Title']
+    masks['missing_title'] = title
+    masks['missing_company'] = blank.get('Company Name', all_blank)
+    masks['duplicate'] = (df.duplicated(subset=DUPLICATE_SUBSET, keep=False)
+                          if all(col in df.columns for col in DUPLICATE_SUBSET) else False)
+    for col in DATE_FIELDS:
+        if col in df.columns:
+            masks[f"bad_{col.lower().replace(' ', '_')}"] = ~blank[col] & parse_dates(df[col]).isna()
+    return masks
+
+
+def validate_jobs(df: pd.DataFrame) -> Dict:
+    """
+    Validation report for a scraped job frame
+
+    Column mapping and required-field coverage, empty counts per key field,
+    duplicate rows, unparseable dates, and how many rows could not be
+    imported at all (no title or company).
+    """
+    mapped = {col: CSV_TO_DB_MAPPING[col] for col in df.columns if col in CSV_TO_DB_MAPPING}
+    covered, missing = {}, {}
+    for db_field, description in REQUIRED_DB_FIELDS.items():
+        available = [col for col, db in CSV_TO_DB_MAPPING.items() if db == db_field and col in df.columns]
+        if available:
+            covered[db_field] = available
+        else:
+            missing[db_field] = description
+
+    blank = _blank_masks(df)
+    masks = issue_masks(df, blank)
+    counts = {name: int(count) for name, count in masks.sum().items()}
+    return {
+        'rows': len(df),
+        'mapped_columns': mapped,
+        'unmapped_columns': [col for col in df.columns if col not in CSV_TO_DB_MAPPING],
+        'covered_required': covered,
+        'missing_required': missing,
+        'empty_counts': {col: int(blank[col].sum()) for col in KEY_FIELDS if col in blank},
+        'duplicates': counts.pop('duplicate'),
+        'unimportable_rows': int((masks['missing_title'] | masks['missing_company']).sum()),
+        'issues': counts,
+    }
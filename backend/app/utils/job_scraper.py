@@ -2,6 +2,7 @@ import re
 from datetime import datetime
 from app import db
 from app.models import Job
+from app.utils.job_bulk_import import bulk_import_jobs
 from typing import Dict, Optional, List
 
 class JobScraperImporter:
@@ -163,6 +164,32 @@ class JobScraperImporter:
         
         return '\n'.join(parts) if parts else 'No requirements specified'
     
+    @staticmethod
+    def has_logo(scraped_data: Dict) -> bool:
+        logo = scraped_data.get('Company Logo')
+        return bool(logo) and str(logo).strip() != '' and str(logo).lower() not in ['nan', 'none', 'null']
+    
+    @staticmethod
+    def to_job_record(scraped_data: Dict) -> Dict:
+        """Map scraped job data to Job columns"""
+        return {
+            'title': scraped_data.get('Job Title') or scraped_data.get('Announcement Job Title'),
+            'company': scraped_data.get('Company Name'),
+            'location': scraped_data.get('Location') or scraped_data.get('Office Address'),
+            'salary': JobScraperImporter.parse_salary(scraped_data.get('Salary')),
+            'job_type': JobScraperImporter.parse_job_type(scraped_data.get('Schedule')),
+            'category': JobScraperImporter.parse_category(scraped_data.get('Career Category')),
+            'description': JobScraperImporter.build_description(scraped_data),
+            'requirements': JobScraperImporter.build_requirements(scraped_data),
+            'logo': str(scraped_data.get('Company Logo')).strip(),
+            'contact_email': scraped_data.get('Contact Email'),
+            'contact_phone': scraped_data.get('Phone'),
+            'website': scraped_data.get('Website'),
+            'status': 'active',
+            'deadline': JobScraperImporter.parse_date(scraped_data.get('Deadline')),
+            'posted_date': JobScraperImporter.parse_date(scraped_data.get('Posting Date')) or datetime.utcnow(),
+        }
+    
     @staticmethod
     def import_job(scraped_data: Dict) -> Optional[Job]:
         """
@@ -171,8 +198,7 @@ class JobScraperImporter:
         """
         try:
             # Skip jobs without logo
-            logo = scraped_data.get('Company Logo')
-            if not logo or str(logo).strip() == '' or str(logo).lower() in ['nan', 'none', 'null']:
+            if not JobScraperImporter.has_logo(scraped_data):
                 print(f"⏭️  Skipping job (no logo): {scraped_data.get('Job Title')} at {scraped_data.get('Company Name')}")
                 return None
             
@@ -187,23 +213,7 @@ class JobScraperImporter:
                 return existing_job
             
             # Create new job
-            job = Job(
-                title=scraped_data.get('Job Title') or scraped_data.get('Announcement Job Title'),
-                company=scraped_data.get('Company Name'),
-                location=scraped_data.get('Location') or scraped_data.get('Office Address'),
-                salary=JobScraperImporter.parse_salary(scraped_data.get('Salary')),
-                job_type=JobScraperImporter.parse_job_type(scraped_data.get('Schedule')),
-                category=JobScraperImporter.parse_category(scraped_data.get('Career Category')),
-                description=JobScraperImporter.build_description(scraped_data),
-                requirements=JobScraperImporter.build_requirements(scraped_data),
-                logo=str(logo).strip(),
-                contact_email=scraped_data.get('Contact Email'),
-                contact_phone=scraped_data.get('Phone'),
-                website=scraped_data.get('Website'),
-                status='active',
-                deadline=JobScraperImporter.parse_date(scraped_data.get('Deadline')),
-                posted_date=JobScraperImporter.parse_date(scraped_data.get('Posting Date')) or datetime.utcnow(),
-            )
+            job = Job(**JobScraperImporter.to_job_record(scraped_data))
             
             db.session.add(job)
             db.session.commit()
@@ -221,8 +231,12 @@ class JobScraperImporter:
             return None
     
     @staticmethod
-    def import_jobs_batch(scraped_jobs: List[Dict]) -> Dict[str, int]:
-        """Import multiple jobs at once"""
+    def import_jobs_batch(scraped_jobs: List[Dict]) -> Dict:
+        """
+        Import multiple jobs at once
+        All jobs go in with one COPY + INSERT ... SELECT (see job_bulk_import),
+        then notifications are matched for the new jobs in one pass.
+        """
         stats = {
             'total': len(scraped_jobs),
             'imported': 0,
@@ -231,18 +245,34 @@ class JobScraperImporter:
             'failed': 0
         }
         
+        records = []
         for job_data in scraped_jobs:
-            result = JobScraperImporter.import_job(job_data)
-            
-            if result is None:
-                # Check if skipped due to no logo
-                logo = job_data.get('Company Logo')
-                if not logo or str(logo).strip() == '' or str(logo).lower() in ['nan', 'none', 'null']:
-                    stats['no_logo'] += 1
-                else:
-                    stats['failed'] += 1
-            elif result:
-                # New import or existing
-                stats['imported'] += 1
+            if not JobScraperImporter.has_logo(job_data):
+                stats['no_logo'] += 1
+                continue
+            try:
+                records.append(JobScraperImporter.to_job_record(job_data))
+            except Exception as e:
+                stats['failed'] += 1
+                print(f"❌ Error mapping job {job_data.get('Job Title')}: {str(e)}")
+        
+        try:
+            result = bulk_import_jobs(records)
+        except Exception as e:
+            stats['failed'] += len(records)
+            stats['error'] = str(e)  # the whole batch was rolled back
+            print(f"❌ Error importing {len(records)} jobs: {str(e)}")
+            return stats
+        
+        stats['imported'] = result['inserted']
+        stats['skipped'] = result['duplicates']
+        stats['failed'] += result['invalid']
+        
+        # Create notifications for matching CVs and job alerts
+        try:
+            from app.routes.notifications import check_and_create_notifications_batch
+            check_and_create_notifications_batch(result['job_ids'])
+        except Exception as e:
+            print(f"⚠️ Error creating notifications for {result['inserted']} new jobs: {str(e)}")
         
         return stats
@@ -0,0 +1,159 @@
+"""
+Job Board Sources
+What the scraper needs to know about one job board, behind one interface,
+plus the registry the scheduler picks sources from.
+
+The crawl itself (HTTP/Chrome fetching, scrape_state, archive, streaming
+import, notifications) is shared in auto_scraper.JobScraper; a source only
+says where its pages are and how to read them:
+
+    listing_url(base_url, page)          -> URL of listing page `page` (1-based)
+    parse_listing(html, base_url, ...)   -> [{'url', ...}] one per job announcement
+    parse_detail(html)                   -> JSON-serializable dict with a 'positions' list
+    build_job_rows(listing, detail)      -> scraped job rows, one per position
+    to_job(row)                          -> Job columns for one cleaned row
+
+Rows use the scraped-job column names ('Job Title', 'Company Name',
+'Deadline', ...) that job_cleaning.py and the CSV tools understand.
+
+To add a board: write its pure parser module next to bongthom_parser.py,
+subclass JobSource here and decorate it with @register_source. A source
+that leaves out one of the abstract methods is rejected when registered.
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Type
+
+from app.utils import bongthom_parser
+
+_SOURCES: Dict[str, Type['JobSource']] = {}
+
+
+def register_source(cls: Type['JobSource']) -> Type['JobSource']:
+    """Class decorator: make a source available by its `name`"""
+    if getattr(cls, '__abstractmethods__', None):
+        raise TypeError(f"Job source {cls.__name__} does not implement {', '.join(sorted(cls.__abstractmethods__))}")
+    if not cls.name:
+        raise TypeError(f"Job source {cls.__name__} has no name")
+    _SOURCES[cls.name] = cls
+    return cls
+
+
+def get_source(name: str) -> 'JobSource':
+    try:
+        return _SOURCES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown job source '{name}' (available: {', '.join(available_sources())})")
+
+
+def available_sources() -> List[str]:
+    return sorted(_SOURCES)
+
+
+class JobSource(ABC):
+    """One job board; subclasses implement the page-specific parts"""
+
+    name = None  # key in scrape_state, the archive and SCRAPER_SOURCES
+    label = None  # for log lines
+    default_base_url = None
+    base_url_setting = None  # Config key that overrides default_base_url, if any
+    listing_wait_selector = 'a'  # element Chrome waits for on a listing page
+    detail_wait_selector = 'body'  # ... and on a detail page
+
+    def base_url(self, config) -> str:
+        url = config.get(self.base_url_setting) if self.base_url_setting else None
+        return (url or self.default_base_url).rstrip('/')
+
+    @abstractmethod
+    def listing_url(self, base_url: str, page: int) -> str:
+        """URL of listing page `page` (1-based)"""
+
+    @abstractmethod
+    def parse_listing(self, html: str, base_url: str, fetched_at: Optional[datetime] = None) -> List[Dict]:
+        """One dict per job announcement, with at least its absolute 'url'"""
+
+    @abstractmethod
+    def parse_detail(self, html: str) -> Dict:
+        """JSON-serializable dict with a 'positions' list"""
+
+    @abstractmethod
+    def build_job_rows(self, listing: Dict, detail: Dict) -> List[Dict]:
+        """Scraped job rows, one per position"""
+
+    # Mapping of cleaned rows to the Job schema, shared by boards that fill the usual columns
+
+    @staticmethod
+    def build_description(row) -> str:
+        """Build job description from multiple fields"""
+        parts = []
+
+        if row.get('Announcement Description'):
+            parts.append(row['Announcement Description'])
+
+        if row.get('Position Summary'):
+            parts.append(f"\n\n**Position Summary:**\n{row['Position Summary']}")
+
+        if row.get('Duties & Responsibilities'):
+            parts.append(f"\n\n**Duties & Responsibilities:**\n{row['Duties & Responsibilities']}")
+
+        return '\n'.join(parts) if parts else 'No description available'
+
+    @staticmethod
+    def build_requirements(row) -> str:
+        """Build requirements from qualifications and skills"""
+        parts = []
+
+        if row.get('Qualifications'):
+            parts.append(f"**Qualifications:**\n{row['Qualifications']}")
+
+        if row.get('Skills & Knowledge'):
+            parts.append(f"\n**Skills & Knowledge:**\n{row['Skills & Knowledge']}")
+
+        if row.get('Languages Required'):
+            parts.append(f"\n**Languages Required:**\n{row['Languages Required']}")
+
+        return '\n'.join(parts) if parts else 'No specific requirements listed'
+
+    def to_job(self, row) -> Dict:
+        """Map one cleaned row to Job columns"""
+        return {
+            'title': row['Job Title'],
+            'company': row['Company Name'],
+            'location': row.get('Location') or 'Not specified',
+            'salary': row.get('Salary') or 'Negotiable',
+            'job_type': row.get('Schedule') or 'Full-time',
+            'category': row.get('Career Category') or 'Other',
+            'description': self.build_description(row),
+            'requirements': self.build_requirements(row),
+            'logo': row.get('Company Logo'),
+            'contact_email': row.get('Contact Email'),
+            'contact_phone': row.get('Phone'),
+            'website': row.get('Website'),
+            'status': 'active',
+            'deadline': row.get('Deadline'),
+            'posted_date': row.get('Posting Date') or datetime.now()
+        }
+
+
+@register_source
+class BongThomSource(JobSource):
+    """bongthom.com, parsed by app/utils/bongthom_parser.py"""
+
+    name = 'bongthom'
+    label = 'BongThom'
+    default_base_url = 'https://www.bongthom.com'
+    base_url_setting = 'SCRAPER_BASE_URL'
+    listing_wait_selector = bongthom_parser.LISTING_LINK_SELECTOR
+    detail_wait_selector = bongthom_parser.POSITION_SELECTOR
+
+    def listing_url(self, base_url, page):
+        return f"{base_url}/job_list.html?page={page}"
+
+    def parse_listing(self, html, base_url, fetched_at=None):
+        return bongthom_parser.parse_listing(html, base_url, fetched_at)
+
+    def parse_detail(self, html):
+        return bongthom_parser.parse_detail(html)
+
+    def build_job_rows(self, listing, detail):
+        return bongthom_parser.build_job_rows(listing, detail, source=self.label)
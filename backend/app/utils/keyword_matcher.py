@@ -0,0 +1,81 @@
+"""
+Keyword Matcher
+Finds any of a large vocabulary of keywords in a single pass over a text.
+The keywords are compiled once into one trie-shaped regex, so matching cost
+grows with the text, not with the number of keywords.
+"""
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Optional directory with replacement vocabulary files (same names as in DATA_DIR)
+try:
+    from config import Config
+    VOCABULARY_DIR = getattr(Config, 'CV_VOCABULARY_DIR', None)
+except Exception:
+    VOCABULARY_DIR = None
+
+
+def load_vocabulary(name: str):
+    """Load a vocabulary JSON file, preferring CV_VOCABULARY_DIR over the bundled copy"""
+    for directory in (VOCABULARY_DIR, DATA_DIR):
+        if directory:
+            path = os.path.join(directory, f'{name}.json')
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    return json.load(f)
+    raise FileNotFoundError(f"Vocabulary file not found: {name}.json")
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive whole-word matching of many keywords at once
+
+    "Whole word" means the match is not preceded or followed by a letter,
+    digit or underscore, so keywords ending in symbols such as "c++" or
+    "c#" match too. At any position the longest keyword wins.
+    """
+
+    def __init__(self, keywords: List[str]):
+        # Vocabulary order is kept: it decides priority between keywords
+        self.keywords = list(dict.fromkeys(kw.lower().strip() for kw in keywords if kw.strip()))
+        self._rank = {kw: i for i, kw in enumerate(self.keywords)}
+        self._pattern = re.compile(r'(?<!\w)(?:' + self._trie_regex(self.keywords) + r')(?!\w)', re.IGNORECASE)
+
+    @staticmethod
+    def _trie_regex(keywords: List[str]) -> str:
+        """Compile keywords into a regex shaped like their prefix trie"""
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}  # end of keyword
+
+        def build(node: Dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            ends_here = '' in node
+            if len(branches) == 1 and not ends_here:
+                return branches[0]
+            group = '(?:' + '|'.join(branches) + ')'
+            return group + '?' if ends_here else group
+
+        return build(trie) or '(?!)'
+
+    def rank(self, keyword: str) -> int:
+        """Position of a keyword in the vocabulary (lower = higher priority)"""
+        return self._rank[keyword]
+
+    def find_spans(self, text: str) -> List[Tuple[int, int, str]]:
+        """Every match as (start, end, keyword), in text order"""
+        return [(m.start(), m.end(), m.group().lower()) for m in self._pattern.finditer(text)]
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Distinct keywords found in text, in vocabulary order"""
+        found = {m.group().lower() for m in self._pattern.finditer(text)}
+        return sorted(found, key=self.rank)
@@ -0,0 +1,288 @@
+"""
+ML API Client
+Shared client for the job-recommendation ML service.
+
+- one pooled requests.Session per process (keep-alive, bounded connections)
+- separate connect/read timeouts and retries on connection errors / 502-504
+- circuit breaker: after ML_CIRCUIT_FAILURES consecutive failures, calls fail
+  immediately for ML_CIRCUIT_RESET seconds instead of waiting on a dead service
+- recommendations cached in the ml_recommendation_cache table by a hash of
+  the CV text, shared by every API and worker process, so re-analysing the
+  same CV doesn't call the service again
+- recommend_or_fallback answers from the offline recommender (built from our
+  jobs table) when the service fails or is slower than ML_LATENCY_BUDGET
+"""
+import hashlib
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import delete, insert, select
+from urllib3.util.retry import Retry
+
+from app import db
+from app.models import MLRecommendationCache
+from app.utils.offline_recommender import get_offline_recommender
+
+# Defaults (overridden by Config below)
+ML_API_URL = 'http://138.197.13.244:8000/upload'
+ML_API_CONNECT_TIMEOUT = 5  # seconds
+ML_API_READ_TIMEOUT = 60  # seconds
+ML_API_RETRIES = 2
+ML_API_POOL_SIZE = 10
+ML_CIRCUIT_FAILURES = 3
+ML_CIRCUIT_RESET = 60  # seconds
+ML_CACHE_TTL = 24 * 3600  # seconds (0 = no caching)
+ML_LATENCY_BUDGET = 20  # seconds to wait before using the offline fallback (0 = full read timeout)
+
+try:
+    from config import Config
+    ML_API_URL = getattr(Config, 'ML_API_URL', ML_API_URL)
+    ML_API_CONNECT_TIMEOUT = getattr(Config, 'ML_API_CONNECT_TIMEOUT', ML_API_CONNECT_TIMEOUT)
+    ML_API_READ_TIMEOUT = getattr(Config, 'ML_API_READ_TIMEOUT', ML_API_READ_TIMEOUT)
+    ML_API_RETRIES = getattr(Config, 'ML_API_RETRIES', ML_API_RETRIES)
+    ML_API_POOL_SIZE = getattr(Config, 'ML_API_POOL_SIZE', ML_API_POOL_SIZE)
+    ML_CIRCUIT_FAILURES = getattr(Config, 'ML_CIRCUIT_FAILURES', ML_CIRCUIT_FAILURES)
+    ML_CIRCUIT_RESET = getattr(Config, 'ML_CIRCUIT_RESET', ML_CIRCUIT_RESET)
+    ML_CACHE_TTL = getattr(Config, 'ML_CACHE_TTL', ML_CACHE_TTL)
+    ML_LATENCY_BUDGET = getattr(Config, 'ML_LATENCY_BUDGET', ML_LATENCY_BUDGET)
+except Exception:
+    pass
+
+
+class MLServiceError(Exception):
+    """The ML service returned an error or unusable response"""
+
+
+class MLServiceTimeout(MLServiceError):
+    """The ML service did not answer in time"""
+
+
+class MLServiceUnavailable(MLServiceError):
+    """The ML service can't be reached, or the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Closed: calls go through. Open (after `failure_threshold` consecutive
+    failures): calls are refused until `reset_timeout` has passed. Then one
+    trial call is let through (half-open); its outcome closes or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        return 'half-open' if time.monotonic() - self.opened_at >= self.reset_timeout else 'open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class RecommendationCache:
+    """
+    Recommendations per text hash in the ml_recommendation_cache table;
+    rows expire after `ttl` seconds. Runs on its own connection, so it never
+    commits the caller's session, and a cache that can't be read or written
+    only costs a call to the service.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.table = MLRecommendationCache.__table__
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        if self.ttl <= 0:
+            return None
+        try:
+            with db.engine.connect() as connection:
+                return connection.execute(
+                    select(self.table.c.recommendations)
+                    .where(self.table.c.text_hash == key, self.table.c.expires_at > datetime.utcnow())
+                ).scalar()
+        except Exception as e:
+            print(f"⚠️ ML recommendation cache unavailable: {str(e)}")
+            return None
+
+    def set(self, key: str, value: List[Dict]):
+        if self.ttl <= 0:
+            return
+        now = datetime.utcnow()
+        try:
+            with db.engine.begin() as connection:
+                # Replace this text's entry and drop expired ones (expires_at is indexed)
+                connection.execute(delete(self.table).where(
+                    (self.table.c.text_hash == key) | (self.table.c.expires_at <= now)
+                ))
+                connection.execute(insert(self.table).values(
+                    text_hash=key, recommendations=value, created_at=now,
+                    expires_at=now + timedelta(seconds=self.ttl)
+                ))
+        except Exception as e:
+            # Also reached when another process stored the same text first
+            print(f"⚠️ ML recommendations not cached: {str(e)}")
+
+
+class MLClient:
+    """Client for the ML recommendation endpoint"""
+
+    def __init__(self, url: str = ML_API_URL, connect_timeout: float = ML_API_CONNECT_TIMEOUT,
+                 read_timeout: float = ML_API_READ_TIMEOUT, retries: int = ML_API_RETRIES,
+                 pool_size: int = ML_API_POOL_SIZE, circuit_failures: int = ML_CIRCUIT_FAILURES,
+                 circuit_reset: float = ML_CIRCUIT_RESET, cache_ttl: float = ML_CACHE_TTL,
+                 latency_budget: float = ML_LATENCY_BUDGET):
+        self.url = url
+        self.latency_budget = latency_budget
+        self.timeout = (connect_timeout, read_timeout)
+        self.breaker = CircuitBreaker(circuit_failures, circuit_reset)
+        self.cache = RecommendationCache(cache_ttl)
+
+        # Retry connection failures and gateway errors, never a read timeout:
+        # the service may still be working on the first request
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['POST']),
+            backoff_factor=0.5,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        """Cache key: hash of the text with whitespace normalized"""
+        normalized = re.sub(r'\s+', ' ', text).strip().lower()
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def recommend(self, text: str, filename: str = 'cv.txt', read_timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Job recommendations for a CV's extracted text
+
+        The text is sent as a .txt upload, so the original document never
+        has to be re-read or re-uploaded.
+
+        Raises:
+            MLServiceUnavailable: connection failed or circuit breaker open
+            MLServiceTimeout: no answer within the read timeout
+            MLServiceError: error status or malformed response
+        """
+        key = self.text_key(text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"ML recommendations served from cache ({len(cached)} items)")
+            return cached
+
+        if not self.breaker.allow():
+            raise MLServiceUnavailable('ML API is unavailable (circuit open), skipping recommendations')
+
+        if not filename.lower().endswith('.txt'):
+            filename = f"{filename.rsplit('.', 1)[0]}.txt"
+
+        started = time.monotonic()
+        try:
+            response = self.session.post(
+                self.url,
+                files={'file': (filename, text.encode('utf-8'), 'text/plain')},
+                timeout=(self.timeout[0], read_timeout) if read_timeout else self.timeout
+            )
+        except requests.exceptions.Timeout as e:
+            self.breaker.record_failure()
+            if isinstance(e, requests.exceptions.ConnectTimeout):
+                raise MLServiceUnavailable(f'ML API unreachable: {str(e)}')
+            raise MLServiceTimeout('ML API timeout (may be starting up, please retry)')
+        except requests.exceptions.RequestException as e:
+            self.breaker.record_failure()
+            raise MLServiceUnavailable(f'ML API unreachable: {str(e)}')
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+            raise MLServiceError(f'ML API returned {response.status_code}')
+
+        # The service answered: a 4xx is about this request, not the service's health
+        self.breaker.record_success()
+        if response.status_code != 200:
+            raise MLServiceError(f'ML API returned {response.status_code}')
+
+        try:
+            recommendations = response.json().get('recommendations', [])
+        except ValueError:
+            raise MLServiceError('ML API returned invalid JSON')
+
+        print(f"ML API answered in {time.monotonic() - started:.2f}s with {len(recommendations)} recommendations")
+        self.cache.set(key, recommendations)
+        return recommendations
+
+    def recommend_or_fallback(self, text: str, filename: str = 'cv.txt') -> Tuple[List[Dict], str, Optional[str]]:
+        """
+        Remote recommendations, or offline ones when the service fails or
+        takes longer than the latency budget
+
+        Returns:
+            Tuple of (recommendations, source ('ml_api' or 'offline'), remote error if any)
+
+        Raises:
+            MLServiceError: remote call failed and the offline recommender has no answer
+        """
+        offline = get_offline_recommender()
+        # Only cut the remote call short when there is something to fall back to
+        read_timeout = self.latency_budget if offline and self.latency_budget else None
+        try:
+            return self.recommend(text, filename, read_timeout=read_timeout), 'ml_api', None
+        except MLServiceError as e:
+            recommendations = offline.recommend(text) if offline else []
+            if not recommendations:
+                raise
+            print(f"⚠️ {str(e)} - using {len(recommendations)} offline recommendations")
+            # Not cached: the next analysis should try the service again
+            return recommendations, 'offline', str(e)
+
+
+# One client (session pool, breaker) per process, created on first use
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_ml_client() -> MLClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = MLClient()
+        return _client
@@ -0,0 +1,192 @@
+"""
+Offline Job-Title Recommender
+In-process fallback for the ML API: maps CV text to job titles from our own
+jobs table using TF-IDF and cosine similarity (nearest titles).
+
+The model is built by build_offline_recommender.py into a gzipped JSON
+artifact (OFFLINE_RECOMMENDER_PATH) and loaded once per process; a rebuilt
+artifact is picked up automatically.
+"""
+import gzip
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+ARTIFACT_VERSION = 1
+
+# Defaults (overridden by Config below)
+OFFLINE_RECOMMENDER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                        'models', 'offline_recommender.json.gz')
+OFFLINE_MIN_SCORE = 0.05
+
+try:
+    from config import Config
+    OFFLINE_RECOMMENDER_PATH = getattr(Config, 'OFFLINE_RECOMMENDER_PATH', OFFLINE_RECOMMENDER_PATH)
+    OFFLINE_MIN_SCORE = getattr(Config, 'OFFLINE_MIN_SCORE', OFFLINE_MIN_SCORE)
+except Exception:
+    pass
+
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being below between both but by can could did do does
+doing during each few for from further had has have having he her here hers him his how i if in into is it its
+itself just me more most my no nor not of off on once only or other our ours out over own same she should so some
+such than that the their them then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your yours etc per via within without across
+job jobs work working position candidate candidates company apply application requirements required requirement
+responsibilities responsibility must least year years experience good strong ability able skills skill please
+""".split())
+
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens plus adjacent-word bigrams ("data analyst")"""
+    words = [w for w in _TOKEN_RE.findall((text or '').lower()) if len(w) > 1 and w not in STOPWORDS]
+    return words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+
+
+def _tfidf(counts: Counter, idf: Dict[str, float], max_terms: Optional[int] = None) -> Dict[str, float]:
+    """Sublinear TF x IDF, L2-normalized, optionally pruned to the strongest terms"""
+    weights = {term: (1 + math.log(count)) * idf[term] for term, count in counts.items() if term in idf}
+    if max_terms and len(weights) > max_terms:
+        weights = dict(sorted(weights.items(), key=lambda item: item[1], reverse=True)[:max_terms])
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    return {term: w / norm for term, w in weights.items()} if norm else {}
+
+
+def normalize_title(title: str) -> str:
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s+#/&-]', ' ', title or '')).strip().lower()
+
+
+def build_model(jobs: Iterable[Dict], max_terms: int = 60, title_weight: int = 3, min_jobs: int = 1) -> Dict:
+    """
+    Build the artifact from job dicts (title, category, description, requirements)
+
+    Jobs are grouped by normalized title; each title becomes one document
+    (its title repeated `title_weight` times, category, descriptions and
+    requirements), so titles are recommended by their whole vocabulary.
+    """
+    documents = defaultdict(Counter)
+    spellings = defaultdict(Counter)
+    categories = defaultdict(Counter)
+    job_counts = Counter()
+
+    for job in jobs:
+        key = normalize_title(job.get('title'))
+        if not key:
+            continue
+        spellings[key][job['title'].strip()] += 1
+        categories[key][job.get('category') or ''] += 1
+        job_counts[key] += 1
+        title_tokens = tokenize(job['title'])
+        for _ in range(title_weight):
+            documents[key].update(title_tokens)
+        documents[key].update(tokenize(' '.join(filter(None, [
+            job.get('category'), job.get('description'), job.get('requirements')
+        ]))))
+
+    keys = [key for key in documents if job_counts[key] >= min_jobs]
+    document_frequency = Counter()
+    for key in keys:
+        document_frequency.update(documents[key].keys())
+
+    # Smoothed IDF, so a term shared by every title still counts a little
+    total = len(keys)
+    idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    titles = []
+    for key in sorted(keys):
+        vector = _tfidf(documents[key], idf, max_terms)
+        if vector:
+            titles.append({
+                'title': spellings[key].most_common(1)[0][0],
+                'category': categories[key].most_common(1)[0][0],
+                'jobs': job_counts[key],
+                'vector': {term: round(weight, 5) for term, weight in vector.items()},
+            })
+
+    # Only terms used by some title vector are needed at query time
+    used_terms = {term for title in titles for term in title['vector']}
+    return {
+        'version': ARTIFACT_VERSION,
+        'built_at': datetime.utcnow().isoformat(),
+        'idf': {term: round(idf[term], 5) for term in sorted(used_terms)},
+        'titles': titles,
+    }
+
+
+def save_model(model: Dict, path: str):
+    """Write the artifact atomically"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump(model, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+class OfflineRecommender:
+    """Nearest job titles for a CV text, from a built artifact"""
+
+    def __init__(self, model: Dict):
+        if model.get('version') != ARTIFACT_VERSION:
+            raise ValueError(f"Unsupported recommender artifact version: {model.get('version')}")
+        self.idf = model['idf']
+        self.titles = model['titles']
+        self.built_at = model.get('built_at')
+        # Inverted index: term -> [(title index, weight)], so scoring touches only shared terms
+        self.index = defaultdict(list)
+        for i, title in enumerate(self.titles):
+            for term, weight in title['vector'].items():
+                self.index[term].append((i, weight))
+
+    @classmethod
+    def load(cls, path: str) -> 'OfflineRecommender':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def recommend(self, text: str, limit: int = 10, min_score: float = OFFLINE_MIN_SCORE) -> List[Dict]:
+        """Recommendations in the ML API's shape: [{'job_title', 'score', ...}]"""
+        query = _tfidf(Counter(tokenize(text)), self.idf)
+        scores = defaultdict(float)
+        for term, weight in query.items():
+            for i, title_weight in self.index.get(term, ()):
+                scores[i] += weight * title_weight
+
+        best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [{
+            'job_title': self.titles[i]['title'],
+            'category': self.titles[i]['category'],
+            'score': round(score, 4),
+            'source': 'offline'
+        } for i, score in best if score >= min_score]
+
+
+# Loaded once per process; reloaded when the artifact file changes
+_recommender = None
+_recommender_mtime = None
+_recommender_lock = threading.Lock()
+
+
+def get_offline_recommender(path: str = OFFLINE_RECOMMENDER_PATH) -> Optional[OfflineRecommender]:
+    """The shared recommender, or None if no artifact has been built"""
+    global _recommender, _recommender_mtime
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    with _recommender_lock:
+        if mtime != _recommender_mtime:
+            # Don't retry a broken artifact on every call, only once it changes
+            _recommender_mtime = mtime
+            try:
+                _recommender = OfflineRecommender.load(path)
+                print(f"Loaded offline recommender: {len(_recommender.titles)} titles (built {_recommender.built_at})")
+            except Exception as e:
+                print(f"⚠️ Could not load offline recommender {path}: {str(e)}")
+        return _recommender
@@ -0,0 +1,114 @@
+"""
+PDF Text Engines
+Pluggable ways of reading a PDF's text layer, one string per page.
+
+- pdftotext: poppler's C implementation (same package pdf2image uses), fast
+- pdfminer:  pure-Python layout analysis, slower but handles some fonts better
+
+PDF_TEXT_ENGINE selects the order they are tried in; see get_pdf_text_engines.
+"""
+import os
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LTTextContainer
+
+# Defaults (overridden by Config below)
+PDF_TEXT_ENGINE = 'auto'  # auto | pdftotext | pdfminer
+PDF_TEXT_TIMEOUT = 30  # seconds per document for pdftotext
+POPPLER_PATH = None
+
+try:
+    from config import Config
+    PDF_TEXT_ENGINE = getattr(Config, 'PDF_TEXT_ENGINE', PDF_TEXT_ENGINE)
+    PDF_TEXT_TIMEOUT = getattr(Config, 'PDF_TEXT_TIMEOUT', PDF_TEXT_TIMEOUT)
+    POPPLER_PATH = getattr(Config, 'POPPLER_PATH', None)
+except Exception:
+    pass
+
+
+class PdfTextEngine(ABC):
+    """Reads the text layer of a PDF"""
+    name = ''
+
+    def is_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def extract_pages(self, filepath: str) -> List[str]:
+        """Text of every page, in page order"""
+
+
+class PdftotextEngine(PdfTextEngine):
+    """poppler's pdftotext in a subprocess; pages come back separated by form feeds"""
+    name = 'pdftotext'
+
+    def __init__(self, timeout: int = PDF_TEXT_TIMEOUT):
+        self.timeout = timeout
+        self.command = self._find_command()
+
+    @staticmethod
+    def _find_command() -> Optional[str]:
+        if POPPLER_PATH:
+            for binary in ('pdftotext', 'pdftotext.exe'):
+                path = os.path.join(POPPLER_PATH, binary)
+                if os.path.exists(path):
+                    return path
+        return shutil.which('pdftotext')
+
+    def is_available(self) -> bool:
+        return self.command is not None
+
+    def extract_pages(self, filepath: str) -> List[str]:
+        result = subprocess.run(
+            [self.command, '-enc', 'UTF-8', filepath, '-'],
+            capture_output=True,
+            timeout=self.timeout
+        )
+        if result.returncode != 0:
+            raise Exception(f"pdftotext failed: {result.stderr.decode('utf-8', errors='replace').strip()}")
+
+        pages = result.stdout.decode('utf-8', errors='replace').split('\f')
+        # Every page ends with a form feed, leaving an empty piece at the end
+        if pages and pages[-1] == '':
+            pages.pop()
+        return pages
+
+
+class PdfminerEngine(PdfTextEngine):
+    """pdfminer.six layout analysis"""
+    name = 'pdfminer'
+
+    def extract_pages(self, filepath: str) -> List[str]:
+        page_texts = []
+        for page_layout in extract_pages(filepath):
+            page_texts.append(''.join(
+                element.get_text() for element in page_layout if isinstance(element, LTTextContainer)
+            ))
+        return page_texts
+
+
+ENGINES = {
+    'pdftotext': PdftotextEngine,
+    'pdfminer': PdfminerEngine,
+}
+
+
+def get_pdf_text_engines(preference: str = PDF_TEXT_ENGINE) -> List[PdfTextEngine]:
+    """
+    Engines to try, in order
+
+    'auto' (and 'pdftotext') try pdftotext first and fall back to pdfminer;
+    'pdfminer' uses pdfminer only. Engines that aren't installed are skipped.
+    """
+    preference = (preference or 'auto').lower()
+    if preference == 'pdfminer':
+        names = ['pdfminer']
+    else:
+        names = ['pdftotext', 'pdfminer']
+
+    engines = [ENGINES[name]() for name in names]
+    return [engine for engine in engines if engine.is_available()]
@@ -0,0 +1,221 @@
+"""
+Scheduler Leader Election
+Lets several scheduler.py replicas run side by side while each scheduled
+job is executed by only one of them.
+
+- Leader: the replica holding a session-level Postgres advisory lock on a
+  dedicated connection. Only the leader's scheduler fires jobs; the others
+  stay paused and retry the lock every heartbeat.
+- Heartbeat: every SCHEDULER_HEARTBEAT_SECONDS the leader uses that
+  connection (refreshing heartbeat_at of its running job_runs). If it
+  fails, the connection - and with it the lock - is gone, so the replica
+  steps down and another one takes over. A replica that crashes or loses
+  its connection releases the lock automatically.
+- Every execution also holds a per-job advisory lock and is recorded in
+  job_runs, so a job still running on a former leader is never started a
+  second time during a handover.
+"""
+import logging
+import os
+import socket
+import threading
+import zlib
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import text
+
+from app import db
+from app.models import JobRun
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridden by Config below)
+SCHEDULER_HEARTBEAT_SECONDS = 15  # leader liveness check / standby retry interval
+
+try:
+    from config import Config
+    SCHEDULER_HEARTBEAT_SECONDS = getattr(Config, 'SCHEDULER_HEARTBEAT_SECONDS', SCHEDULER_HEARTBEAT_SECONDS)
+except Exception:
+    pass
+
+LEADER_LOCK_KEY = 7246002  # pg_advisory_lock(bigint): the scheduler leader
+JOB_LOCK_CLASS = 7246003  # pg_advisory_lock(int, int): (JOB_LOCK_CLASS, crc32 of the job id) per running job
+
+# Container hostname + pid: unique per replica
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _job_lock_key(job_id: str) -> int:
+    """crc32 of the job id as a signed 32-bit int, as pg_advisory_lock(int, int) expects"""
+    key = zlib.crc32(job_id.encode('utf-8'))
+    return key - 2 ** 32 if key >= 2 ** 31 else key
+
+
+def _lock_connection(engine):
+    # Autocommit: the connection is held for a long time and must not sit idle in a transaction
+    return engine.connect().execution_options(isolation_level='AUTOCOMMIT')
+
+
+class LeaderElection:
+    """Background heartbeat thread that acquires, keeps or gives up scheduler leadership"""
+
+    def __init__(self, engine, on_elected: Optional[Callable] = None, on_demoted: Optional[Callable] = None,
+                 heartbeat_seconds: float = SCHEDULER_HEARTBEAT_SECONDS, worker: str = WORKER_ID):
+        self.engine = engine
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker = worker
+        self.is_leader = False
+        self._connection = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name='leader-election', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop heartbeating and release leadership, if held"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.heartbeat_seconds + 5)
+        if self.is_leader:
+            self._demote('shutting down')
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.tick()
+            self._stop.wait(self.heartbeat_seconds)
+
+    def tick(self):
+        """One election round: heartbeat as leader, or try to become one"""
+        if self.is_leader:
+            if not self._heartbeat():
+                self._demote('lost the database connection')
+        elif self._try_acquire():
+            self.is_leader = True
+            logger.info(f"👑 {self.worker} is now the scheduler leader")
+            self._notify(self.on_elected)
+
+    def _try_acquire(self) -> bool:
+        try:
+            connection = _lock_connection(self.engine)
+        except Exception as e:
+            logger.warning(f"⚠️ Leader election: database unavailable: {str(e)}")
+            return False
+        try:
+            if connection.execute(text('SELECT pg_try_advisory_lock(:key)'), {'key': LEADER_LOCK_KEY}).scalar():
+                self._connection = connection
+                return True
+        except Exception as e:
+            logger.warning(f"⚠️ Leader election failed: {str(e)}")
+        connection.close()
+        return False
+
+    def _heartbeat(self) -> bool:
+        """Use the lock connection; while it works the lock is still ours"""
+        try:
+            self._connection.execute(
+                text("UPDATE job_runs SET heartbeat_at = :now WHERE worker = :worker AND status = 'running'"),
+                {'now': datetime.utcnow(), 'worker': self.worker}
+            )
+            return True
+        except Exception as e:
+            logger.error(f"❌ Leader heartbeat failed: {str(e)}")
+            return False
+
+    def _demote(self, reason: str):
+        self.is_leader = False
+        logger.warning(f"⏸️  {self.worker} stepped down as scheduler leader ({reason})")
+        try:
+            # Discard the connection instead of pooling it: ending the session releases the lock
+            self._connection.invalidate()
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+        self._notify(self.on_demoted)
+
+    @staticmethod
+    def _notify(callback):
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"❌ Leader election callback failed: {str(e)}", exc_info=True)
+
+
+def last_run(job_id: str) -> Optional[JobRun]:
+    """Latest run of a job that is running or completed"""
+    return JobRun.query.filter(JobRun.job_id == job_id, JobRun.status.in_(['running', 'completed'])) \
+        .order_by(JobRun.started_at.desc()).first()
+
+
+def is_due(job_id: str, interval: timedelta) -> bool:
+    """Whether the job has not run (or started running) within `interval`"""
+    run = last_run(job_id)
+    return run is None or run.started_at < datetime.utcnow() - interval
+
+
+def run_exclusive(app, job_id: str, func: Callable, trigger: str = 'schedule', worker: str = WORKER_ID):
+    """
+    Run func() as `job_id` unless another worker is running that job;
+    recorded in job_runs. Returns what func returned (stored as the run's
+    result if it is JSON-serializable), or None if skipped or failed.
+    """
+    with app.app_context():
+        connection = _lock_connection(db.engine)
+        try:
+            key = {'cls': JOB_LOCK_CLASS, 'key': _job_lock_key(job_id)}
+            if not connection.execute(text('SELECT pg_try_advisory_lock(:cls, :key)'), key).scalar():
+                logger.info(f"⏭️  {job_id} is already running on another worker, skipped")
+                now = datetime.utcnow()
+                db.session.add(JobRun(job_id=job_id, status='skipped', worker=worker, trigger=trigger,
+                                      started_at=now, finished_at=now))
+                db.session.commit()
+                return None
+
+            # We hold the job lock, so any run still marked running belongs to a worker that died
+            stale = JobRun.query.filter_by(job_id=job_id, status='running').update(
+                {'status': 'failed', 'finished_at': datetime.utcnow(), 'error': 'Worker stopped before the job finished'},
+                synchronize_session=False
+            )
+            if stale:
+                logger.warning(f"⚠️ {job_id}: {stale} earlier run(s) never finished, marked as failed")
+            now = datetime.utcnow()
+            run = JobRun(job_id=job_id, status='running', worker=worker, trigger=trigger,
+                         started_at=now, heartbeat_at=now)
+            db.session.add(run)
+            db.session.commit()
+            run_id = run.id
+
+            result, error = None, None
+            try:
+                result = func()
+            except Exception as e:
+                error = str(e)
+                logger.error(f"❌ {job_id} failed: {error}", exc_info=True)
+
+            db.session.rollback()  # func may have left the session mid-transaction
+            run = db.session.get(JobRun, run_id)
+            run.status = 'failed' if error else 'completed'
+            run.finished_at = datetime.utcnow()
+            run.error = error
+            run.result = result if isinstance(result, (dict, list)) else None
+            db.session.commit()
+            return result
+        finally:
+            try:
+                connection.execute(text('SELECT pg_advisory_unlock(:cls, :key)'),
+                                   {'cls': JOB_LOCK_CLASS, 'key': _job_lock_key(job_id)})
+            except Exception:
+                # Never pool a connection that may still hold the job lock: ending the session releases it
+                try:
+                    connection.invalidate()
+                except Exception:
+                    pass
+            connection.close()
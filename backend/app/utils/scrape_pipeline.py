@@ -0,0 +1,128 @@
+"""
+Scrape Pipeline
+Streams scraped pages into the database while the crawl is still running.
+
+    crawl (caller) --pages--> import worker --new job ids--> notify worker
+
+Both queues are bounded, so a slow database holds the crawl back instead
+of letting parsed pages pile up in memory. Workers take what is queued in
+batches of up to `batch_size`, but never wait more than `flush_seconds`
+for a batch to fill: the first jobs reach users seconds after their page
+was crawled, not after the whole run.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridden by Config below)
+SCRAPER_PIPELINE_BATCH = 50  # pages per import batch (and id batches per notification batch)
+SCRAPER_PIPELINE_FLUSH_SECONDS = 5.0  # longest wait for a batch to fill
+SCRAPER_PIPELINE_QUEUE_SIZE = 20  # pages (or batches of new job ids) waiting per stage
+
+try:
+    from config import Config
+    SCRAPER_PIPELINE_BATCH = getattr(Config, 'SCRAPER_PIPELINE_BATCH', SCRAPER_PIPELINE_BATCH)
+    SCRAPER_PIPELINE_FLUSH_SECONDS = getattr(Config, 'SCRAPER_PIPELINE_FLUSH_SECONDS', SCRAPER_PIPELINE_FLUSH_SECONDS)
+    SCRAPER_PIPELINE_QUEUE_SIZE = getattr(Config, 'SCRAPER_PIPELINE_QUEUE_SIZE', SCRAPER_PIPELINE_QUEUE_SIZE)
+except Exception:
+    pass
+
+_DONE = object()
+
+
+class ScrapePipeline:
+    """
+    Two worker threads behind bounded queues
+
+    import_batch(pages) stores a batch of pages and returns the ids of the
+    jobs it created; notify_batch(job_ids) matches them against CVs and
+    alerts. Exceptions in either are logged and the batch dropped, so a
+    failing batch never stalls the crawl.
+    """
+
+    def __init__(self, import_batch: Callable[[List], Optional[List]], notify_batch: Callable[[List], None],
+                 batch_size: int = SCRAPER_PIPELINE_BATCH, flush_seconds: float = SCRAPER_PIPELINE_FLUSH_SECONDS,
+                 queue_size: int = SCRAPER_PIPELINE_QUEUE_SIZE):
+        self.import_batch = import_batch
+        self.notify_batch = notify_batch
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.pages = queue.Queue(maxsize=max(1, queue_size))
+        self.job_ids = queue.Queue(maxsize=max(1, queue_size))
+        self._threads = []
+        self.first_notified_at = None  # monotonic time the first notification batch finished
+        self.errors = 0  # batches that failed in either stage
+
+    def start(self):
+        self._threads = [
+            threading.Thread(target=self._run_stage, name='scrape-import', daemon=True,
+                             args=(self.pages, self._import, self.job_ids)),
+            threading.Thread(target=self._run_stage, name='scrape-notify', daemon=True,
+                             args=(self.job_ids, self._notify, None)),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def put(self, page):
+        """Queue one scraped page; blocks while the import stage is behind"""
+        self.pages.put(page)
+
+    def close(self):
+        """Flush everything still queued through both stages and wait for them"""
+        self.pages.put(_DONE)
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _import(self, pages):
+        return self.import_batch(pages) or []
+
+    def _notify(self, id_batches):
+        self.notify_batch([job_id for batch in id_batches for job_id in batch])
+        if self.first_notified_at is None:
+            self.first_notified_at = time.monotonic()
+
+    def _next_batch(self, source: queue.Queue):
+        """(items, done): up to batch_size items, waiting at most flush_seconds after the first"""
+        items = [source.get()]
+        if items[0] is _DONE:
+            return [], True
+        deadline = time.monotonic() + self.flush_seconds
+        while len(items) < self.batch_size:
+            try:
+                item = source.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return items, True
+            items.append(item)
+        return items, False
+
+    def _run_stage(self, source: queue.Queue, handle: Callable, target: Optional[queue.Queue]):
+        done = False
+        while not done:
+            items, done = self._next_batch(source)
+            if not items:
+                continue
+            try:
+                results = handle(items)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ {threading.current_thread().name}: batch of {len(items)} failed: {str(e)}",
+                             exc_info=True)
+                continue
+            if target is not None and results:
+                target.put(results)
+        if target is not None:
+            target.put(_DONE)
@@ -1,27 +1,39 @@
 """
-Automated Job Scraper for BongThom
-Runs daily to scrape new jobs, check duplicates, and import to database
+Automated Job Scraper
+Runs daily to scrape new jobs from every configured job board, check
+duplicates, and import to database
+
+What is specific to a board (URLs, parsing, mapping to Job) lives in its
+source in app/utils/job_sources.py; JobScraper runs the crawl for one
+source, and run_sources() runs several sources at once, one process each.
+
+Pages flow from the crawl straight into the database and notifications
+(app/utils/scrape_pipeline.py) while later pages are still being fetched.
 """
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+import multiprocessing
 import pandas as pd
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-import re
+import hashlib
+import json
 import logging
 from pathlib import Path
 from app import create_app, db
-from app.models import Job
-from sqlalchemy import and_
+from app.models import Job, ScrapeRun, ScrapeState
+from app.utils.browser_pool import BrowserPool
+from app.utils.html_archive import HtmlArchive
+from app.utils.job_bulk_import import bulk_import_jobs
+from app.utils.job_cleaning import clean_jobs
+from app.utils.job_sources import get_source
+from app.utils.scrape_pipeline import ScrapePipeline
+from app.utils.http_fetcher import HttpFetcher
 
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('scraper_logs.log'),
         logging.StreamHandler()
@@ -30,425 +42,517 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class BongThomScraper:
-    def __init__(self):
+class JobScraper:
+    """Incremental crawl of one job board (a source name or JobSource)"""
+
+    def __init__(self, source, base_url=None, use_selenium=True, dry_run=False, audit_csv=None):
         self.app = create_app()
-        self.all_jobs = []
+        self.source = get_source(source) if isinstance(source, str) else source
+        # Overridable so the scraper can run against scraper_fixture_server.py
+        self.base_url = (base_url or self.source.base_url(self.app.config)).rstrip('/')
+        self.use_selenium = use_selenium
+        self.dry_run = dry_run  # scrape only: no duplicate checks, CSV or import
+        # Every imported batch is also appended to a timestamped CSV, for auditing
+        self.audit_csv = self.app.config.get('SCRAPER_AUDIT_CSV', True) if audit_csv is None else audit_csv
+        self.csv_filename = f"{self.source.name}_scraped_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self.csv_columns = None
+        self.fetcher = HttpFetcher()
+        # Raw HTML of every fetched page, for reparse_archive.py
+        self.archive = HtmlArchive(self.app.config['SCRAPER_ARCHIVE_DIR']) if self.app.config.get('SCRAPER_ARCHIVE') else None
+        # Headless Chrome, started only if a page needs JavaScript, then reused for the whole run
+        self.browsers = BrowserPool(self.app.config.get('SCRAPER_BROWSERS', 2)) if use_selenium else None
+        self.rendered_listings = {}  # listing pages rendered ahead of the crawl: page -> listings
+        # Flipped once a page turns out to need JavaScript, so later pages skip the HTTP attempt
+        self.listing_needs_js = False
+        self.detail_needs_js = False
+        self.scraped_count = 0  # positions parsed from fetched pages
         self.new_jobs_count = 0
         self.duplicate_count = 0
+        self.failed_count = 0
+        self.known_count = 0  # detail pages skipped thanks to scrape_state
+        self.unchanged_count = 0  # re-fetched detail pages whose content had not changed
+        self.seen_urls = set()  # detail pages handled this run (a job can be listed on two pages)
+        # Telemetry for the scrape_runs table
+        self.page_count = 0  # listing pages walked
+        self.details_fetched = 0
+        self.notification_count = 0
+        self.error_count = 0  # unavailable pages and failed batches
+        self.error = None  # what stopped the crawl, if anything
+        self.timings = {'fetch': 0.0, 'parse': 0.0, 'db_check': 0.0, 'import': 0.0, 'notify': 0.0}  # seconds per stage
         
-    def parse_posting_date(self, text):
-        """Parse relative posting dates like '2 days ago' or '3 hours'"""
-        text = text.lower()
-        today = datetime.today()
-
-        # Extract number from text
-        num_match = re.search(r"\d+", text)
-        if not num_match:
-            return ""
-            
-        if "day" in text:
-            days = int(num_match.group())
-            return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-        elif "hour" in text or "minute" in text:
-            return today.strftime("%Y-%m-%d")
-        else:
-            return ""
-
-    def setup_driver(self):
-        """Setup Selenium Chrome driver"""
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        
-        driver = webdriver.Chrome(options=options)
-        return driver
+    @contextmanager
+    def timed(self, stage):
+        """Add the time spent in the block to self.timings[stage]"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[stage] += time.monotonic() - started
+
+    def timed_iter(self, stage, items):
+        """Yield from `items`, adding the time spent waiting for each one to self.timings[stage]"""
+        items = iter(items)
+        while True:
+            with self.timed(stage):
+                item = next(items, None)
+            if item is None:
+                return
+            yield item
+
+    def archive_page(self, url, html, kind, fetched_at=None):
+        """Keep the raw page for reparse_archive.py; archiving problems never stop a scrape"""
+        if self.archive is None or not html:
+            return
+        try:
+            self.archive.store(url, html, kind, self.source.name, fetched_at)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not archive {url}: {str(e)}")
+
+    def listing_url(self, page):
+        return self.source.listing_url(self.base_url, page)
+
+    def fetch_listing(self, page, last_page=None):
+        """Listings on one page: plain HTTP, or Chrome if the links are rendered by JavaScript"""
+        if page in self.rendered_listings:
+            return self.rendered_listings.pop(page)
+
+        url = self.listing_url(page)
+        if not self.listing_needs_js:
+            # One clock for the live parse and the archive, so relative posting dates
+            # ('2 days ago') come out the same when reparse_archive.py re-reads the page
+            fetched_at = datetime.now()
+            with self.timed('fetch'):
+                html = self.fetcher.fetch(url)
+            self.archive_page(url, html, "listing", fetched_at)
+            with self.timed('parse'):
+                listings = self.source.parse_listing(html, self.base_url, fetched_at) if html else []
+            if listings or not self.use_selenium:
+                return listings
+
+        # Once listings are known to need Chrome, render the next pages too, one per browser.
+        # Pages past the point where the crawl stops are wasted, so at most SCRAPER_BROWSERS - 1.
+        pages = [page]
+        if self.listing_needs_js:
+            pages = list(range(page, min(page + self.browsers.size - 1, last_page or page) + 1))
+        fetched_at = datetime.now()
+        with self.timed('fetch'):
+            rendered = self.browsers.render_many(map(self.listing_url, pages), self.source.listing_wait_selector)
+        for number, html in zip(pages, rendered):
+            self.archive_page(self.listing_url(number), html, "listing", fetched_at)
+            with self.timed('parse'):
+                self.rendered_listings[number] = (
+                    self.source.parse_listing(html, self.base_url, fetched_at) if html else []
+                )
 
-    def job_exists_in_db(self, title, company):
-        """Check if job already exists in database"""
+        listings = self.rendered_listings.pop(page)
+        if listings and not self.listing_needs_js:
+            logger.info("ℹ️  Listing pages need JavaScript, using Chrome for them from now on")
+            self.listing_needs_js = True
+        return listings
+
+    def fetch_details(self, urls):
+        """Parsed detail pages by URL: fetched concurrently over HTTP, Chrome only as fallback"""
+        details = {}
+        if not self.detail_needs_js:
+            # Pages are parsed as they arrive, while the next ones are still downloading
+            for url, html in self.timed_iter('fetch', self.fetcher.fetch_many(urls)):
+                self.archive_page(url, html, "detail")
+                with self.timed('parse'):
+                    details[url] = self.source.parse_detail(html) if html else None
+
+        if not self.use_selenium:
+            return details
+        # No positions in the static HTML: they may be rendered client-side
+        to_render = [url for url in urls if not (details.get(url) and details[url]["positions"])]
+        with self.timed('fetch'):
+            pages = self.browsers.render_many(to_render, self.source.detail_wait_selector)
+        for url, html in zip(to_render, pages):
+            if html is None:
+                continue
+            self.archive_page(url, html, "detail")
+            with self.timed('parse'):
+                rendered = self.source.parse_detail(html)
+            if rendered["positions"]:
+                if details.get(url) is not None and not self.detail_needs_js:
+                    logger.info("ℹ️  Detail pages need JavaScript, using Chrome for them from now on")
+                    self.detail_needs_js = True
+                details[url] = rendered
+        return details
+
+    @staticmethod
+    def detail_hash(detail):
+        """Hash of the parsed detail page (not the raw HTML, which changes with every ad and token)"""
+        return hashlib.sha256(json.dumps(detail, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def has_scrape_state(self):
+        """Whether any earlier run recorded pages for this source"""
+        if self.dry_run:
+            return False
         with self.app.app_context():
-            existing = Job.query.filter(
-                and_(
-                    Job.title == title,
-                    Job.company == company
-                )
-            ).first()
-            return existing is not None
+            return db.session.query(ScrapeState.id).filter_by(source=self.source.name).first() is not None
 
-    def scrape_bongthom(self, max_pages=3):
-        """Scrape jobs from BongThom"""
-        logger.info("🚀 Starting BongThom scraper...")
-        
-        driver = self.setup_driver()
-        wait = WebDriverWait(driver, 10)
+    def load_scrape_state(self, urls):
+        """Known pages among `urls`: url -> {content_hash, last_fetched_at}; marks them as seen"""
+        if self.dry_run or not urls:
+            return {}
+        with self.app.app_context():
+            rows = ScrapeState.query.filter(ScrapeState.source == self.source.name, ScrapeState.url.in_(urls)).all()
+            now = datetime.utcnow()
+            known = {}
+            for row in rows:
+                row.last_seen_at = now
+                known[row.url] = {"content_hash": row.content_hash, "last_fetched_at": row.last_fetched_at}
+            db.session.commit()
+            return known
+
+    def save_scrape_state(self, fetched):
+        """Record fetched pages ({url: detail}) once their jobs are imported"""
+        if self.dry_run or not fetched:
+            return
+        with self.app.app_context():
+            rows = {row.url: row for row in ScrapeState.query.filter(
+                ScrapeState.source == self.source.name, ScrapeState.url.in_(list(fetched))
+            )}
+            now = datetime.utcnow()
+            for url, detail in fetched.items():
+                row = rows.get(url)
+                if row is None:
+                    row = ScrapeState(source=self.source.name, url=url, first_seen_at=now)
+                    db.session.add(row)
+                row.content_hash = self.detail_hash(detail)
+                row.positions = len(detail["positions"])
+                row.last_seen_at = now
+                row.last_fetched_at = now
+            db.session.commit()
+
+    def scrape(self, max_pages=None, sink=None):
+        """
+        Scrape jobs from the source, incrementally
+
+        Detail pages recorded in scrape_state are not fetched again (until
+        they are older than SCRAPER_REFETCH_DAYS), and pagination stops at
+        the first listing page whose jobs are all known. max_pages is only a
+        safety cap; by default it is higher on the first run, which has no
+        state to stop on.
+
+        Each fetched detail page is handed to `sink` as soon as it is parsed,
+        as {'url', 'detail', 'jobs'}; without a sink the pages are returned.
+        """
+        pages = []
+        sink = sink or pages.append
+        with self.timed('db_check'):
+            first_run = not self.dry_run and not self.has_scrape_state()
+        if max_pages is None:
+            config = self.app.config
+            max_pages = config.get('SCRAPER_INITIAL_MAX_PAGES', 50) if first_run else config.get('SCRAPER_MAX_PAGES', 10)
+        refetch_days = self.app.config.get('SCRAPER_REFETCH_DAYS', 14)
+        refetch_before = datetime.utcnow() - timedelta(days=refetch_days) if refetch_days else None
+        logger.info(f"🚀 Starting {self.source.label} scraper ({self.base_url}, up to {max_pages} pages"
+                    f"{', first run' if first_run else ''})...")
         
         try:
             page = 1
             while page <= max_pages:
                 logger.info(f"📄 Scraping page {page}")
-                driver.get(f"https://www.bongthom.com/job_list.html?page={page}")
-
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='job_detail']")))
-                soup = BeautifulSoup(driver.page_source, "html.parser")
-
-                job_boxes = soup.select("a[href*='job_detail']")
+                listings = self.fetch_listing(page, last_page=max_pages)
 
-                if not job_boxes:
+                if not listings:
                     logger.info(f"No more jobs found on page {page}")
                     break
+                self.page_count += 1
+
+                # Visit job detail pages we don't know yet, or haven't fetched in a while
+                urls = list(dict.fromkeys(listing["url"] for listing in listings))
+                with self.timed('db_check'):
+                    known = self.load_scrape_state(urls)
+                due = [url for url in urls if url not in known or
+                       (refetch_before and known[url]["last_fetched_at"] < refetch_before)]
+                details = self.fetch_details(due) if due else {}
+                self.details_fetched += sum(1 for detail in details.values() if detail)
+
+                for listing in listings:
+                    url = listing["url"]
+                    if url in self.seen_urls:
+                        continue
+                    detail = details.get(url)
+                    if not detail:
+                        if url in known and url not in due:
+                            self.known_count += 1
+                        else:
+                            logger.warning(f"⚠️ Skipping {url}: detail page unavailable")
+                            self.error_count += 1
+                        continue
 
-                for box in job_boxes:
-                    desc = box.select_one(".desc")
-                    if not desc:
+                    # Pages without new jobs still go through, to be recorded in scrape_state
+                    self.seen_urls.add(url)
+                    if url in known and known[url]["content_hash"] == self.detail_hash(detail):
+                        self.unchanged_count += 1
+                        sink({"url": url, "detail": detail, "jobs": []})
                         continue
 
-                    # Job list fields
-                    job_url = box["href"]
-                    if not job_url.startswith("http"):
-                        job_url = "https://www.bongthom.com" + job_url
-
-                    job_title = desc.select_one("h5 span")
-                    job_title = job_title.text.strip() if job_title else ""
-
-                    company = desc.select_one(".ellipsis-text span")
-                    company_name = company.text.strip() if company else ""
-
-                    # Extract deadline and posting date from listing
-                    deadline = ""
-                    posting_date = ""
-
-                    for info in desc.select(".info div"):
-                        text = info.get_text(strip=True)
-                        # Check for deadline (format: DD-MMM-YYYY like "31-Jan-2026")
-                        if re.match(r"\d{1,2}-[A-Za-z]{3}-\d{4}", text):
-                            deadline = text
-                        # Check for posting date (relative time)
-                        elif "day" in text.lower() or "hour" in text.lower():
-                            posting_date = self.parse_posting_date(text)
-
-                    # Visit job detail page
-                    driver.get(job_url)
-                    time.sleep(1)
-                    detail = BeautifulSoup(driver.page_source, "html.parser")
-
-                    # Extract company logo from detail page
-                    logo_elem = detail.select_one('img[src*="library"]')
-                    logo_url = logo_elem["src"] if logo_elem else ""
-
-                    # Announcement Description
-                    ann_desc = detail.select_one("#announcemnt-description + .ql-editor")
-                    announcement_description = ann_desc.get_text(" ", strip=True) if ann_desc else ""
-
-                    # Contact Info
-                    office_address = ""
-                    contact_email = ""
-                    phone = ""
-                    website = ""
-
-                    for li in detail.select("ul.no-list li"):
-                        text = li.get_text(" ", strip=True)
-                        if "@" in text:
-                            contact_email = text
-                        elif "http" in text:
-                            website = text
-                        elif re.search(r"\d{3,}", text):
-                            phone = text
-                        elif "Phnom Penh" in text or "Cambodia" in text:
-                            office_address = text
-
-                    # Attempt to extract deadline from detail page if not found in listing
-                    if not deadline:
-                        # Look for explicit labels mentioning deadline
-                        cand = detail.find(string=re.compile(r"deadline|application deadline|close date", re.I))
-                        if cand:
-                            parent_text = cand.parent.get_text(" ", strip=True) if cand.parent else cand
-                            m = re.search(r"\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}|\d{4}-\d{2}-\d{2}", parent_text)
-                            if m:
-                                deadline = m.group()
-
-                        # Fallback: search entire detail page for a date-like pattern
-                        if not deadline:
-                            page_text = detail.get_text(" ", strip=True)
-                            m = re.search(r"\d{1,2}-[A-Za-z]{3}-\d{4}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}|\d{4}-\d{2}-\d{2}", page_text)
-                            if m:
-                                deadline = m.group()
-
-                    # Positions loop
-                    positions = detail.select("h3[id^='position-']")
-
-                    for pos in positions:
-                        pos_id = pos["id"].replace("position-", "")
-                        pos_title = pos.get_text(strip=True)
-
-                        pos_div = detail.find(id=f"job-detail-pos-{pos_id}")
-                        if not pos_div:
-                            continue
-
-                        location = ""
-                        languages = ""
-                        career_category = ""
-                        schedule = ""
-                        salary = ""
-                        position_summary = ""
-                        duties = ""
-                        qualifications = ""
-                        skills = ""
-
-                        # Key lists
-                        for li in pos_div.select("li"):
-                            strong = li.find("strong")
-                            value = li.find("span", class_="value")
-                            if not strong or not value:
-                                continue
-
-                            label = strong.get_text(strip=True).lower()
-                            val = value.get_text(" ", strip=True)
-
-                            if "location" in label:
-                                location = val
-                            elif "languages" in label:
-                                languages = val
-                            elif "career category" in label:
-                                career_category = val
-                            elif "schedule" in label:
-                                schedule = val
-                            elif "salary" in label:
-                                salary = val
-
-                        # Position Summary
-                        summary_div = pos_div.select_one(".ql-editor")
-                        if summary_div:
-                            position_summary = summary_div.get_text(" ", strip=True)
-
-                        # Duties
-                        duties_ul = pos_div.find("strong", string=re.compile("Duties"))
-                        if duties_ul:
-                            ul = duties_ul.find_next("ul")
-                            if ul:
-                                duties = " | ".join(li.get_text(" ", strip=True) for li in ul.find_all("li"))
-
-                        # Qualifications & Skills
-                        for strong in pos_div.find_all("strong"):
-                            if "Qualifications" in strong.get_text():
-                                ul = strong.find_next("ul")
-                                if ul:
-                                    qualifications = " | ".join(li.get_text(" ", strip=True) for li in ul.find_all("li"))
-
-                            if "Skills" in strong.get_text():
-                                ul = strong.find_next("ul")
-                                if ul:
-                                    skills = " | ".join(li.get_text(" ", strip=True) for li in ul.find_all("li"))
-
-                        # Check for duplicates
-                        if self.job_exists_in_db(pos_title, company_name):
-                            logger.info(f"⏭️  Duplicate found: {pos_title} at {company_name}")
-                            self.duplicate_count += 1
-                            continue
-
-                        # Add job data
-                        self.all_jobs.append({
-                            "Job Title": pos_title,
-                            "Announcement Job Title": job_title,
-                            "Company Name": company_name,
-                            "Company Logo": logo_url,
-                            "Posting Date": posting_date,
-                            "Deadline": deadline,
-                            "Announcement Description": announcement_description,
-                            "Office Address": office_address,
-                            "Contact Email": contact_email,
-                            "Phone": phone,
-                            "Website": website,
-                            "Location": location,
-                            "Languages Required": languages,
-                            "Career Category": career_category,
-                            "Schedule": schedule,
-                            "Salary": salary,
-                            "Position Summary": position_summary,
-                            "Duties & Responsibilities": duties,
-                            "Qualifications": qualifications,
-                            "Skills & Knowledge": skills,
-                            "Source": "BongThom"
-                        })
-                        self.new_jobs_count += 1
+                    # Duplicates of jobs already in the database are dropped by the import
+                    jobs = self.source.build_job_rows(listing, detail)
+                    self.scraped_count += len(jobs)
+                    sink({"url": url, "detail": detail, "jobs": jobs})
+
+                if all(url in known for url in urls):
+                    logger.info(f"⏹️  Every job on page {page} was already scraped, stopping")
+                    break
 
                 page += 1
 
         except Exception as e:
             logger.error(f"❌ Error during scraping: {str(e)}", exc_info=True)
+            self.error_count += 1
+            self.error = str(e)
         finally:
-            driver.quit()
+            self.fetcher.close()
+            if self.browsers is not None:
+                self.browsers.close()
 
-        return self.all_jobs
+        return pages
 
     def clean_data(self, df):
-        """Clean scraped data"""
+        """Clean scraped data (vectorized, see app/utils/job_cleaning.py)"""
         logger.info("🧹 Cleaning data...")
         
-        # Remove duplicates within scraped data
-        before_count = len(df)
-        df = df.drop_duplicates(subset=['Job Title', 'Company Name'], keep='first')
-        after_count = len(df)
+        # Drop in-batch duplicates, strip whitespace, '' -> None, Deadline -> YYYY-MM-DD
+        df, report = clean_jobs(df)
         
-        if before_count > after_count:
-            logger.info(f"🗑️  Removed {before_count - after_count} duplicate rows")
-        
-        # Clean whitespace
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].str.strip()
-        
-        # Replace empty strings with None
-        df = df.replace('', None)
-        
-        # Normalize Deadline column to ISO date (YYYY-MM-DD) when present
-        if 'Deadline' in df.columns:
-            def normalize_deadline(val):
-                if val is None:
-                    return None
-                s = str(val).strip()
-                # Try multiple common formats
-                for fmt in ("%d-%b-%Y", "%d %b %Y", "%d %B %Y", "%Y-%m-%d"):
-                    try:
-                        return datetime.strptime(s, fmt).strftime('%Y-%m-%d')
-                    except Exception:
-                        continue
-                # Try to extract a date-like substring
-                m = re.search(r"\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}", s)
-                if m:
-                    sub = m.group()
-                    for fmt in ("%d-%b-%Y", "%d %b %Y", "%d %B %Y", "%Y-%m-%d"):
-                        try:
-                            return datetime.strptime(sub, fmt).strftime('%Y-%m-%d')
-                        except Exception:
-                            continue
-                return None
-
-            df['Deadline'] = df['Deadline'].apply(normalize_deadline)
+        if report['duplicates_removed']:
+            logger.info(f"🗑️  Removed {report['duplicates_removed']} duplicate rows")
+        if report['invalid_deadlines']:
+            logger.info(f"📅 {report['invalid_deadlines']} deadlines could not be parsed (left empty)")
         
         return df
 
     def import_to_database(self, df):
-        """Import cleaned jobs to database"""
-        logger.info("💾 Importing to database...")
-        
+        """Import cleaned jobs to database; returns the bulk import result, or None if it failed"""
         with self.app.app_context():
-            imported = 0
-            failed = 0
-            
-            for _, row in df.iterrows():
-                try:
-                    # Map CSV columns to Job model
-                    job = Job(
-                        title=row['Job Title'],
-                        company=row['Company Name'],
-                        location=row['Location'] or 'Not specified',
-                        salary=row['Salary'] or 'Negotiable',
-                        job_type=row['Schedule'] or 'Full-time',
-                        category=row['Career Category'] or 'Other',
-                        description=self.build_description(row),
-                        requirements=self.build_requirements(row),
-                        logo=row['Company Logo'],
-                        contact_email=row['Contact Email'],
-                        contact_phone=row['Phone'],
-                        website=row['Website'],
-                        status='active',
-                        deadline=datetime.strptime(row['Deadline'], '%Y-%m-%d') if row.get('Deadline') else None,
-                        posted_date=datetime.strptime(row['Posting Date'], '%Y-%m-%d') if row['Posting Date'] else datetime.now()
-                    )
-                    
-                    db.session.add(job)
-                    db.session.commit()
-                    imported += 1
-                    logger.info(f"✅ Imported: {row['Job Title']} at {row['Company Name']}")
-                    # Create notifications for this job if it matches any CV keywords
-                    try:
-                        from app.routes.notifications import check_and_create_notifications
-                        check_and_create_notifications(str(job.id))
-                    except Exception as e:
-                        logger.error(f"⚠️ Failed to create notifications for job {job.id}: {str(e)}")
-                    
-                except Exception as e:
-                    db.session.rollback()
-                    failed += 1
-                    logger.error(f"❌ Failed to import {row['Job Title']}: {str(e)}")
+            try:
+                # One COPY + INSERT ... SELECT per batch instead of a commit per job
+                result = bulk_import_jobs(self.source.to_job(row) for _, row in df.iterrows())
+            except Exception as e:
+                logger.error(f"❌ Failed to import {len(df)} jobs: {str(e)}")
+                return None
             
-            logger.info(f"\n📊 Import Summary:")
-            logger.info(f"✅ Successfully imported: {imported}")
-            logger.info(f"❌ Failed: {failed}")
+            logger.info(f"💾 Imported {result['inserted']} new jobs ({result['duplicates']} already in database)")
+            return result
 
-    def build_description(self, row):
-        """Build job description from multiple fields"""
-        parts = []
-        
-        if row['Announcement Description']:
-            parts.append(row['Announcement Description'])
-        
-        if row['Position Summary']:
-            parts.append(f"\n\n**Position Summary:**\n{row['Position Summary']}")
-        
-        if row['Duties & Responsibilities']:
-            parts.append(f"\n\n**Duties & Responsibilities:**\n{row['Duties & Responsibilities']}")
+    def write_audit_csv(self, df):
+        """Append a cleaned batch to this run's CSV"""
+        if not self.audit_csv:
+            return
+        first = self.csv_columns is None
+        if first:
+            self.csv_columns = list(df.columns)
+        # BOM only at the start of the file, so Excel still reads it as UTF-8
+        df.reindex(columns=self.csv_columns).to_csv(self.csv_filename, mode='w' if first else 'a', header=first,
+                                                    index=False, encoding="utf-8-sig" if first else "utf-8")
+        if first:
+            logger.info(f"💾 Saving CSV: {self.csv_filename}")
+
+    def import_pages(self, pages):
+        """
+        Pipeline import stage: store the jobs of a batch of scraped pages
+
+        Returns the ids of the new jobs. Pages are recorded in scrape_state
+        only once their jobs are in; if the import fails they stay unknown,
+        so the next run tries them again.
+        """
+        jobs = [job for page in pages for job in page["jobs"]]
+        if self.dry_run:
+            return []
         
-        return '\n'.join(parts) if parts else 'No description available'
+        result = None
+        with self.timed('import'):
+            if jobs:
+                df = self.clean_data(pd.DataFrame(jobs))
+                self.write_audit_csv(df)
+                result = self.import_to_database(df)
+                if result is None:
+                    self.failed_count += len(df)
+                    self.error_count += 1
+                    return []
+                self.new_jobs_count += result['inserted']
+                self.duplicate_count += len(jobs) - len(df) + result['duplicates']
+                self.failed_count += result['invalid']
+            
+            self.save_scrape_state({page["url"]: page["detail"] for page in pages})
+        return result['job_ids'] if result else []
 
-    def build_requirements(self, row):
-        """Build requirements from qualifications and skills"""
-        parts = []
-        
-        if row['Qualifications']:
-            parts.append(f"**Qualifications:**\n{row['Qualifications']}")
-        
-        if row['Skills & Knowledge']:
-            parts.append(f"\n**Skills & Knowledge:**\n{row['Skills & Knowledge']}")
-        
-        if row['Languages Required']:
-            parts.append(f"\n**Languages Required:**\n{row['Languages Required']}")
-        
-        return '\n'.join(parts) if parts else 'No specific requirements listed'
+    def notify_jobs(self, job_ids):
+        """Pipeline notification stage: match new jobs against CV keywords and job alerts"""
+        if not job_ids:
+            return
+        with self.timed('notify'), self.app.app_context():
+            from app.routes.notifications import check_and_create_notifications_batch
+            created = check_and_create_notifications_batch(job_ids) or 0
+        self.notification_count += created
+        logger.info(f"🔔 Checked notifications for {len(job_ids)} new jobs ({created} created)")
+
+    def summary(self, duration):
+        return {
+            'source': self.source.name,
+            'duration': round(duration, 2),
+            'scraped': self.scraped_count,
+            'new': self.new_jobs_count,
+            'duplicates': self.duplicate_count,
+            'failed': self.failed_count,
+            'known': self.known_count,
+            'unchanged': self.unchanged_count,
+            'notifications': self.notification_count,
+            'errors': self.error_count,
+            'timings': {stage: round(seconds, 2) for stage, seconds in self.timings.items()},
+        }
+
+    def start_run_record(self):
+        """Insert this run's scrape_runs row, 'running' until it finishes; returns its id"""
+        if self.dry_run:
+            return None
+        try:
+            with self.app.app_context():
+                run = ScrapeRun(source=self.source.name, status='running', started_at=datetime.utcnow())
+                db.session.add(run)
+                db.session.commit()
+                return run.id
+        except Exception as e:
+            # Telemetry never stops a scrape
+            logger.warning(f"⚠️ Could not record the scrape run: {str(e)}")
+            return None
 
-    def run(self):
-        """Main execution method"""
+    def finish_run_record(self, run_id, duration, first_notification=None):
+        """Store the timings and counters of the run"""
+        if run_id is None:
+            return
+        try:
+            with self.app.app_context():
+                run = ScrapeRun.query.get(run_id)
+                run.status = 'failed' if self.error else 'completed'
+                run.finished_at = datetime.utcnow()
+                run.duration_seconds = round(duration, 3)
+                run.fetch_seconds = round(self.timings['fetch'], 3)
+                run.parse_seconds = round(self.timings['parse'], 3)
+                run.db_check_seconds = round(self.timings['db_check'], 3)
+                run.import_seconds = round(self.timings['import'], 3)
+                run.notify_seconds = round(self.timings['notify'], 3)
+                run.first_notification_seconds = round(first_notification, 3) if first_notification is not None else None
+                run.pages = self.page_count
+                run.details_fetched = self.details_fetched
+                run.known_pages = self.known_count + self.unchanged_count
+                run.jobs_scraped = self.scraped_count
+                run.duplicates = self.duplicate_count
+                run.imported = self.new_jobs_count
+                run.failed = self.failed_count
+                run.notifications_created = self.notification_count
+                run.errors = self.error_count
+                run.error = self.error
+                db.session.commit()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not record the scrape run: {str(e)}")
+
+    def run(self, max_pages=None):
+        """Main execution method; returns the counts of the run (see summary())"""
         start_time = datetime.now()
+        started = time.monotonic()
         logger.info(f"\n{'='*60}")
-        logger.info(f"🤖 AUTO SCRAPER STARTED at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"🤖 AUTO SCRAPER STARTED for {self.source.label} at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"{'='*60}\n")
+        run_id = self.start_run_record()
         
-        # Scrape jobs
-        jobs = self.scrape_bongthom(max_pages=3)
-        
-        if not jobs:
-            logger.info("ℹ️  No new jobs found. All jobs are duplicates or no jobs available.")
-            return
-        
-        # Save to CSV
-        df = pd.DataFrame(jobs)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        csv_filename = f"bongthom_scraped_{timestamp}.csv"
+        # Scrape, import and notify concurrently: each batch of pages is in the
+        # database (and matched against CVs) while the crawl goes on
+        pipeline = ScrapePipeline(self.import_pages, self.notify_jobs)
+        with pipeline:
+            self.scrape(max_pages=max_pages, sink=pipeline.put)
+        self.error_count += pipeline.errors
         
-        # Clean data
-        df = self.clean_data(df)
+        duration = (datetime.now() - start_time).total_seconds()
+        first_notification = pipeline.first_notified_at - started if pipeline.first_notified_at is not None else None
+        self.finish_run_record(run_id, duration, first_notification)
+        if self.dry_run:
+            logger.info(f"🧪 Dry run: scraped {self.scraped_count} positions in {duration:.2f} seconds (nothing saved)")
+            return self.summary(duration)
         
-        # Save CSV
-        df.to_csv(csv_filename, index=False, encoding="utf-8-sig")
-        logger.info(f"💾 Saved CSV: {csv_filename}")
-        
-        # Import to database
-        self.import_to_database(df)
-        
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        if not self.new_jobs_count:
+            logger.info("ℹ️  No new jobs found. All jobs are duplicates or no jobs available.")
         
         logger.info(f"\n{'='*60}")
-        logger.info(f"✅ AUTO SCRAPER COMPLETED")
+        logger.info(f"✅ AUTO SCRAPER COMPLETED for {self.source.label}")
         logger.info(f"⏱️  Duration: {duration:.2f} seconds")
+        logger.info("⏱️  Stages: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in self.timings.items()))
+        if first_notification is not None:
+            logger.info(f"🔔 First notifications after: {first_notification:.2f} seconds")
         logger.info(f"🆕 New jobs found: {self.new_jobs_count}")
         logger.info(f"⏭️  Duplicates skipped: {self.duplicate_count}")
+        logger.info(f"🔔 Notifications created: {self.notification_count}")
+        logger.info(f"❌ Failed: {self.failed_count} ({self.error_count} errors)")
+        logger.info(f"📌 Known pages skipped: {self.known_count} (+{self.unchanged_count} re-fetched, unchanged)")
+        if self.csv_columns is not None:
+            logger.info(f"💾 Saved CSV: {self.csv_filename}")
         logger.info(f"{'='*60}\n")
+        return self.summary(duration)
+
+
+class BongThomScraper(JobScraper):
+    """JobScraper for the BongThom source"""
+
+    def __init__(self, base_url=None, use_selenium=True, dry_run=False, audit_csv=None):
+        super().__init__('bongthom', base_url=base_url, use_selenium=use_selenium, dry_run=dry_run,
+                         audit_csv=audit_csv)
+
+    def scrape_bongthom(self, max_pages=None, sink=None):
+        return self.scrape(max_pages=max_pages, sink=sink)
+
+
+def run_source(name, max_pages=None, **options):
+    """Scrape one source start to finish (the entry point of each worker process)"""
+    if multiprocessing.parent_process() is not None:
+        multiprocessing.current_process().name = name  # shows up in the log lines
+    return JobScraper(name, **options).run(max_pages=max_pages)
+
+
+def run_sources(names=None, max_pages=None, **options):
+    """
+    Scrape several sources at once, each in its own process
+
+    Every source gets its own app, database connections, HTTP fetcher and
+    Chrome pool, and parses and cleans pages on its own core, so a second
+    board adds little to the total run time; a source that fails doesn't
+    stop the others. Duplicates across sources are handled by the bulk
+    import, which serializes concurrent imports.
+
+    Returns {source: summary of the run, or None if it failed}.
+    """
+    if names is None:
+        names = create_app().config.get('SCRAPER_SOURCES', ['bongthom'])
+    names = list(dict.fromkeys(names))
+    for name in names:
+        get_source(name)  # fail fast on a typo, before any process is started
+
+    results = {}
+    if len(names) == 1:
+        try:
+            results[names[0]] = run_source(names[0], max_pages=max_pages, **options)
+        except Exception as e:
+            logger.error(f"❌ Scraper for {names[0]} failed: {str(e)}", exc_info=True)
+            results[names[0]] = None
+        return results
+
+    logger.info(f"🚀 Scraping {len(names)} sources in parallel: {', '.join(names)}")
+    # spawn, not fork: the parent (e.g. the scheduler) may hold database connections and threads
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(names), mp_context=context) as pool:
+        futures = {pool.submit(run_source, name, max_pages, **options): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error(f"❌ Scraper for {name} failed: {str(e)}", exc_info=True)
+                results[name] = None
+    return results
 
 
 if __name__ == "__main__":
-    scraper = BongThomScraper()
-    scraper.run()
+    run_sources()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""
+Generate a synthetic CV corpus for the extraction benchmark
+
+Every synthetic candidate is written in three formats:
+- <id>.docx            python-docx document
+- <id>_text.pdf        PDF with a real text layer (reportlab)
+- <id>_scanned.pdf     rasterized pages with no text layer (PIL), exercises OCR
+
+ground_truth.json maps each file to the fields the parser should find.
+The corpus is deterministic for a given --seed and --count.
+
+Usage:
+    python benchmarks/generate_corpus.py
+    python benchmarks/generate_corpus.py --count 50 --output benchmarks/corpus --seed 7
+"""
+import argparse
+import json
+import os
+import random
+
+from docx import Document
+from PIL import Image, ImageDraw, ImageFont
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+FIRST_NAMES = ['Sokha', 'Dara', 'Maria', 'James', 'Linh', 'Chen', 'Amina', 'Lucas', 'Priya', 'Sophea',
+               'Daniel', 'Yuki', 'Omar', 'Elena', 'Vichea', 'Grace']
+LAST_NAMES = ['Chan', 'Sok', 'Garcia', 'Smith', 'Nguyen', 'Wang', 'Hassan', 'Martin', 'Sharma', 'Kim',
+              'Brown', 'Tanaka', 'Ali', 'Rossi', 'Heng', 'Taylor']
+LOCATIONS = ['Phnom Penh, Cambodia', 'Siem Reap, Cambodia', 'Toronto, Canada', 'Bangkok, Thailand',
+             'Singapore', 'London, United Kingdom']
+SKILLS = ['Python', 'Java', 'JavaScript', 'React', 'Docker', 'PostgreSQL', 'AWS', 'Git', 'Flask',
+          'Machine Learning', 'Excel', 'Figma', 'Kubernetes', 'Leadership', 'Communication', 'SQL']
+LANGUAGES = ['English', 'Khmer', 'French', 'Chinese', 'Japanese', 'Thai', 'Spanish']
+PROFICIENCIES = ['Native', 'Advanced', 'Intermediate', 'Basic']
+DEGREES = ['Bachelor of Computer Science', 'Master of Business Administration',
+           'Bachelor of Information Technology', 'Master of Data Science']
+SCHOOLS = ['Royal University of Phnom Penh', 'University of Toronto', 'National University of Singapore',
+           'Institute of Technology of Cambodia']
+TITLES = ['Software Engineer', 'Data Analyst', 'Project Manager', 'Web Developer', 'DevOps Engineer']
+COMPANIES = ['ABA Bank', 'Smart Axiata', 'Acme Corp', 'Globex Ltd', 'Initech']
+CERTIFICATIONS = ['AWS Certified Solutions Architect', 'Google Data Analytics Certificate',
+                  'Certified Scrum Master', 'Cisco CCNA']
+
+
+def make_candidate(rng: random.Random, index: int) -> dict:
+    """Random but self-consistent CV content"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    start_year = rng.randint(2008, 2018)
+    return {
+        'name': f'{first} {last}',
+        'email': f'{first.lower()}.{last.lower()}{index}@example.com',
+        'phone': f'+855 {rng.randint(10, 99)} {rng.randint(100, 999)} {rng.randint(100, 999)}',
+        'location': rng.choice(LOCATIONS),
+        'summary': f'{rng.choice(TITLES)} with {rng.randint(2, 12)} years of experience delivering '
+                   f'reliable products for banks, telecoms and startups.',
+        'skills': rng.sample(SKILLS, rng.randint(4, 8)),
+        'languages': [{'language': lang, 'proficiency': rng.choice(PROFICIENCIES)}
+                      for lang in rng.sample(LANGUAGES, rng.randint(1, 3))],
+        'education': [{'degree': degree, 'institution': rng.choice(SCHOOLS), 'year': str(start_year - 4 * i)}
+                      for i, degree in enumerate(rng.sample(DEGREES, rng.randint(1, 2)))],
+        'experience': [{'title': rng.choice(TITLES), 'company': company,
+                        'period': f'{start_year + 2 * i} - {start_year + 2 * i + 2}'}
+                       for i, company in enumerate(rng.sample(COMPANIES, rng.randint(1, 3)))],
+        'certifications': rng.sample(CERTIFICATIONS, rng.randint(0, 2)),
+    }
+
+
+def cv_lines(candidate: dict) -> list:
+    """CV as (style, text) lines, style being 'name', 'heading' or 'body'"""
+    lines = [
+        ('name', candidate['name']),
+        ('body', f"Email: {candidate['email']}"),
+        ('body', f"Phone: {candidate['phone']}"),
+        ('body', candidate['location']),
+        ('heading', 'Summary'),
+        ('body', candidate['summary']),
+        ('heading', 'Skills'),
+        ('body', ', '.join(candidate['skills'])),
+        ('heading', 'Experience'),
+    ]
+    for job in candidate['experience']:
+        lines.append(('body', f"{job['title']} - {job['company']} ({job['period']})"))
+    lines.append(('heading', 'Education'))
+    for edu in candidate['education']:
+        lines.append(('body', f"{edu['degree']}, {edu['institution']}, {edu['year']}"))
+    lines.append(('heading', 'Languages'))
+    for lang in candidate['languages']:
+        lines.append(('body', f"{lang['language']}: {lang['proficiency']}"))
+    if candidate['certifications']:
+        lines.append(('heading', 'Certifications'))
+        for cert in candidate['certifications']:
+            lines.append(('body', cert))
+    return lines
+
+
+def write_docx(path: str, lines: list):
+    doc = Document()
+    for style, text in lines:
+        if style == 'name':
+            doc.add_heading(text, level=0)
+        elif style == 'heading':
+            doc.add_heading(text, level=1)
+        else:
+            doc.add_paragraph(text)
+    doc.save(path)
+
+
+def write_text_pdf(path: str, lines: list):
+    pdf = canvas.Canvas(path, pagesize=letter)
+    width, height = letter
+    y = height - 72
+    for style, text in lines:
+        size = {'name': 18, 'heading': 13}.get(style, 10)
+        if style == 'heading':
+            y -= 8
+        if y < 72:
+            pdf.showPage()
+            y = height - 72
+        pdf.setFont('Helvetica-Bold' if style != 'body' else 'Helvetica', size)
+        pdf.drawString(72, y, text)
+        y -= size + 6
+    pdf.save()
+
+
+def _load_font(size: int):
+    for name in ('DejaVuSans.ttf', 'Arial.ttf', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def write_scanned_pdf(path: str, lines: list, rng: random.Random, dpi: int = 300):
+    """Draw the CV onto letter-size page images and save them as an image-only PDF"""
+    page_size = (int(8.5 * dpi), int(11 * dpi))
+    margin = dpi
+    pixel_sizes = {style: int(points * dpi / 72) for style, points in (('name', 18), ('heading', 13), ('body', 10))}
+    fonts = {style: _load_font(size) for style, size in pixel_sizes.items()}
+
+    pages = [Image.new('L', page_size, 255)]
+    draw = ImageDraw.Draw(pages[-1])
+    y = margin
+    for style, text in lines:
+        line_height = int(pixel_sizes[style] * 1.6)
+        if y + line_height > page_size[1] - margin:
+            pages.append(Image.new('L', page_size, 255))
+            draw = ImageDraw.Draw(pages[-1])
+            y = margin
+        draw.text((margin, y), text, fill=0, font=fonts[style])
+        y += line_height
+
+    # A slight skew, like a real scan
+    scans = [page.rotate(rng.uniform(-0.8, 0.8), fillcolor=245).convert('RGB') for page in pages]
+    scans[0].save(path, 'PDF', resolution=dpi, save_all=True, append_images=scans[1:])
+    for image in pages + scans:
+        image.close()
+
+
+def ground_truth(candidate: dict, fmt: str) -> dict:
+    return {
+        'format': fmt,
+        'fields': {
+            'name': candidate['name'],
+            'email': candidate['email'],
+            'phone': candidate['phone'],
+            'location': candidate['location'],
+            'skills': candidate['skills'],
+            'languages': candidate['languages'],
+            'education': candidate['education'],
+            'experience': candidate['experience'],
+            'certifications': candidate['certifications'],
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic CV benchmark corpus')
+    parser.add_argument('--count', type=int, default=20, help='number of synthetic candidates (default: 20)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='output directory (default: benchmarks/corpus)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-scanned', action='store_true', help='skip the OCR (scanned PDF) variants')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    rng = random.Random(args.seed)
+    truth = {}
+
+    for index in range(args.count):
+        candidate = make_candidate(rng, index)
+        lines = cv_lines(candidate)
+        stem = f'cv_{index:03d}'
+
+        write_docx(os.path.join(args.output, f'{stem}.docx'), lines)
+        truth[f'{stem}.docx'] = ground_truth(candidate, 'docx')
+
+        write_text_pdf(os.path.join(args.output, f'{stem}_text.pdf'), lines)
+        truth[f'{stem}_text.pdf'] = ground_truth(candidate, 'text_pdf')
+
+        if not args.no_scanned:
+            write_scanned_pdf(os.path.join(args.output, f'{stem}_scanned.pdf'), lines, rng)
+            truth[f'{stem}_scanned.pdf'] = ground_truth(candidate, 'scanned_pdf')
+
+    with open(os.path.join(args.output, 'ground_truth.json'), 'w') as f:
+        json.dump({'seed': args.seed, 'count': args.count, 'files': truth}, f, indent=2)
+
+    print(f"✅ Wrote {len(truth)} files for {args.count} candidates to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+Job cleaning benchmark
+
+Times app/utils/job_cleaning.py against the per-cell code it replaced
+(kept below as legacy_*) on a synthetic scraped-jobs frame, and checks that
+both produce the same cleaned deadlines and records.
+
+Usage:
+    python benchmarks/job_cleaning_benchmark.py                    # 100k rows
+    python benchmarks/job_cleaning_benchmark.py --rows 20000 --output cleaning.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.job_cleaning import clean_jobs, to_records, validate_jobs  # noqa: E402
+
+TITLES = ['Sales Executive', 'Accountant', 'IT Support', 'Marketing Manager', 'Driver', 'Receptionist',
+          'Software Developer', 'HR Officer', 'Teacher', 'Chef']
+COMPANIES = [f'Company {i}' for i in range(50000)]
+LOCATIONS = ['Phnom Penh', 'Siem Reap', 'Battambang', 'Kampot', '', None]
+
+
+def synthetic_frame(rows: int, seed: int = 42) -> pd.DataFrame:
+    """Scraper-shaped frame with padding, blanks, duplicates and mixed date formats"""
+    rng = random.Random(seed)
+    base = date(2026, 1, 1)
+
+    def deadline():
+        day = base + timedelta(days=rng.randrange(365))
+        return rng.choice([
+            day.strftime('%d-%b-%Y'), day.strftime('%d %b %Y'), day.strftime('%d %B %Y'),
+            day.strftime('%Y-%m-%d'), f"Closing date: {day.strftime('%d %b %Y')}", 'ASAP', '', None,
+        ])
+
+    return pd.DataFrame({
+        'Job Title': [rng.choice(TITLES + ['', None]) if rng.random() < 0.01 else f' {rng.choice(TITLES)} '
+                      for _ in range(rows)],
+        'Company Name': [rng.choice(COMPANIES) for _ in range(rows)],
+        'Location': [rng.choice(LOCATIONS) for _ in range(rows)],
+        'Salary': [rng.choice(['Negotiable', '$500-$800', '', None]) for _ in range(rows)],
+        'Schedule': [rng.choice(['Full Time', 'Part Time', None]) for _ in range(rows)],
+        'Career Category': [rng.choice(['Sales', 'IT', 'Finance', None]) for _ in range(rows)],
+        'Deadline': [deadline() for _ in range(rows)],
+        'Posting Date': [(base + timedelta(days=rng.randrange(365))).strftime('%Y-%m-%d') for _ in range(rows)],
+        'Announcement Description': [f'  Description {i}  ' for i in range(rows)],
+    })
+
+
+# --- The code job_cleaning.py replaced -------------------------------------
+
+def legacy_clean(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.drop_duplicates(subset=['Job Title', 'Company Name'], keep='first')
+    for col in df.columns:
+        if df[col].dtype == 'object' or pd.api.types.is_string_dtype(df[col].dtype):
+            df[col] = df[col].str.strip()
+    df = df.replace('', None)
+
+    def normalize_deadline(val):
+        if val is None or (isinstance(val, float) and val != val):
+            return None
+        s = str(val).strip()
+        for fmt in ("%d-%b-%Y", "%d %b %Y", "%d %B %Y", "%Y-%m-%d"):
+            try:
+                return datetime.strptime(s, fmt).strftime('%Y-%m-%d')
+            except Exception:
+                continue
+        m = re.search(r"\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}", s)
+        if m:
+            sub = m.group()
+            for fmt in ("%d-%b-%Y", "%d %b %Y", "%d %B %Y", "%Y-%m-%d"):
+                try:
+                    return datetime.strptime(sub, fmt).strftime('%Y-%m-%d')
+                except Exception:
+                    continue
+        return None
+
+    df['Deadline'] = df['Deadline'].apply(normalize_deadline)
+    return df
+
+
+def legacy_records(df: pd.DataFrame) -> list:
+    jobs_data = df.to_dict('records')
+    for job in jobs_data:
+        for key, value in job.items():
+            if pd.isna(value):
+                job[key] = None
+    return jobs_data
+
+
+# ----------------------------------------------------------------------------
+
+def _values(column: pd.Series) -> list:
+    return column.astype(object).where(column.notna(), None).tolist()
+
+
+def timed(fn, *args, repeat: int = 3):
+    """(best wall time in seconds, result of the last call)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized job cleaning against the per-cell version')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per step, best time is reported')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    frame = synthetic_frame(args.rows, args.seed)
+    print(f"📊 {len(frame):,} synthetic rows (pandas {pd.__version__}, numpy {np.__version__})\n")
+
+    legacy_clean_s, legacy_df = timed(lambda: legacy_clean(frame.copy()), repeat=args.repeat)
+    clean_s, (cleaned, clean_report) = timed(lambda: clean_jobs(frame.copy()), repeat=args.repeat)
+    legacy_records_s, legacy_rows = timed(legacy_records, legacy_df, repeat=args.repeat)
+    records_s, rows = timed(to_records, cleaned, repeat=args.repeat)
+    validate_s, report = timed(validate_jobs, frame, repeat=args.repeat)
+
+    # apply() may hand back None as NaN, depending on the pandas version
+    same_deadlines = _values(legacy_df['Deadline']) == _values(cleaned['Deadline'])
+    same_records = legacy_rows == rows
+
+    results = {
+        'rows': len(frame),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'seconds': {
+            'clean': {'legacy': round(legacy_clean_s, 4), 'vectorized': round(clean_s, 4)},
+            'to_records': {'legacy': round(legacy_records_s, 4), 'vectorized': round(records_s, 4)},
+            'validate': {'vectorized': round(validate_s, 4)},
+        },
+        'same_deadlines': same_deadlines,
+        'same_records': same_records,
+        'clean_report': clean_report,
+        'validation': {key: report[key] for key in ('rows', 'duplicates', 'unimportable_rows', 'issues')},
+    }
+
+    for step, times in results['seconds'].items():
+        legacy = times.get('legacy')
+        line = f"{step:12} vectorized {times['vectorized']:8.3f}s"
+        if legacy is not None:
+            line += f"   legacy {legacy:8.3f}s   x{legacy / max(times['vectorized'], 1e-9):.1f}"
+        print(line)
+    print(f"\n{'✅' if same_deadlines else '❌'} Deadlines identical to the legacy cleaning")
+    print(f"{'✅' if same_records else '❌'} Records identical to the legacy NaN loop")
+    print(f"🔍 Validation: {report['duplicates']} duplicate rows, {report['unimportable_rows']} unimportable, "
+          f"issues {report['issues']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+    return 0 if same_deadlines and same_records else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
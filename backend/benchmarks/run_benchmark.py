@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+"""
+CV extraction benchmark
+
+Runs CVTextExtractor over the corpus from generate_corpus.py and writes a
+JSON report with per-stage latency (pdfminer, rasterize, OCR, parse, ...),
+peak memory and field-level accuracy against ground_truth.json. Reports
+from two commits can be compared to spot regressions.
+
+Usage:
+    python benchmarks/run_benchmark.py --output baseline.json
+    python benchmarks/run_benchmark.py --output after.json --compare baseline.json
+    python benchmarks/run_benchmark.py --compare baseline.json --fail-on-regression
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.utils.cv_text_extractor import CVTextExtractor  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+# Relative change that counts as a regression in --compare
+LATENCY_TOLERANCE = 0.10
+ACCURACY_TOLERANCE = 0.01
+MEMORY_TOLERANCE = 0.10
+
+
+def _normalize(value) -> str:
+    return re.sub(r'\s+', ' ', str(value or '')).strip().lower()
+
+
+def _digits(value) -> str:
+    return re.sub(r'\D', '', str(value or ''))
+
+
+def _recall(expected: list, found: list) -> float:
+    """Share of expected items that appear in (or inside) some found item"""
+    if not expected:
+        return 1.0
+    found = [_normalize(item) for item in found]
+    hits = sum(1 for item in expected if any(_normalize(item) in f for f in found))
+    return hits / len(expected)
+
+
+def score_fields(expected: dict, parsed: dict) -> dict:
+    """Accuracy per field, each between 0 and 1"""
+    parsed_languages = {_normalize(lang.get('language')): _normalize(lang.get('proficiency'))
+                        for lang in parsed.get('languages') or []}
+    expected_languages = expected.get('languages') or []
+
+    def count_score(field):
+        want, got = len(expected.get(field) or []), len(parsed.get(field) or [])
+        return 1.0 if want == got else min(want, got) / max(want, got)
+
+    return {
+        'name': float(_normalize(parsed.get('name')) == _normalize(expected.get('name'))),
+        'email': float(_normalize(parsed.get('email')) == _normalize(expected.get('email'))),
+        'phone': float(_digits(expected.get('phone')) != '' and _digits(expected.get('phone')) in _digits(parsed.get('phone'))),
+        'location': float(_normalize(expected.get('location')).split(',')[0] in _normalize(parsed.get('location'))),
+        'skills': _recall(expected.get('skills') or [], parsed.get('skills') or []),
+        'languages': _recall([lang['language'] for lang in expected_languages], list(parsed_languages)),
+        'proficiency': (sum(1 for lang in expected_languages
+                            if parsed_languages.get(_normalize(lang['language'])) == _normalize(lang['proficiency']))
+                        / len(expected_languages)) if expected_languages else 1.0,
+        'education': count_score('education'),
+        'experience': count_score('experience'),
+        'certifications': count_score('certifications'),
+    }
+
+
+def run_file(extractor: CVTextExtractor, filepath: str, verbose: bool) -> dict:
+    started = time.perf_counter()
+    error = None
+    result = {}
+    try:
+        if verbose:
+            result = extractor.extract_from_file(filepath)
+        else:
+            # The extractor prints a lot of debug output per file
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = extractor.extract_from_file(filepath)
+    except Exception as e:
+        error = str(e)
+    elapsed = time.perf_counter() - started
+    metrics = result.get('metrics') or extractor.metrics
+    return {
+        'seconds': elapsed,
+        'stage_seconds': metrics.get('stage_seconds', {}),
+        'peak_rss_kb': metrics.get('peak_rss_kb', 0),
+        'ocr_worker_peak_rss_kb': metrics.get('ocr_worker_peak_rss_kb', 0),
+        'ocr_pages': metrics.get('ocr_pages', 0),
+        'extraction_method': result.get('extraction_method'),
+        'parsed_fields': result.get('parsed_fields') or {},
+        'error': error,
+    }
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(files: dict) -> dict:
+    """Aggregate per-file results per format and overall"""
+    groups = {}
+    for entry in files.values():
+        groups.setdefault(entry['format'], []).append(entry)
+        groups.setdefault('all', []).append(entry)
+
+    summary = {}
+    for fmt, entries in sorted(groups.items()):
+        latencies = [e['seconds'] for e in entries]
+        stages = sorted({stage for e in entries for stage in e['stage_seconds']})
+        fields = sorted({field for e in entries for field in e['accuracy']})
+        summary[fmt] = {
+            'files': len(entries),
+            'errors': sum(1 for e in entries if e['error']),
+            'latency_median_s': statistics.median(latencies),
+            'latency_p95_s': _percentile(latencies, 95),
+            'stage_median_s': {stage: statistics.median(e['stage_seconds'].get(stage, 0.0) for e in entries)
+                               for stage in stages},
+            'peak_rss_kb_max': max(e['peak_rss_kb'] for e in entries),
+            'ocr_worker_peak_rss_kb_max': max(e['ocr_worker_peak_rss_kb'] for e in entries),
+            'accuracy': {field: statistics.mean(e['accuracy'][field] for e in entries) for field in fields},
+        }
+        summary[fmt]['accuracy_mean'] = statistics.mean(summary[fmt]['accuracy'].values()) if fields else 0.0
+    return summary
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, timeout=5).stdout.strip()
+    except Exception:
+        return ''
+
+
+def compare(current: dict, baseline: dict) -> list:
+    """Print metric deltas against a baseline report; returns the regressions"""
+    regressions = []
+    print(f"\n{'='*78}")
+    print(f"📊 COMPARISON: {baseline['meta'].get('commit') or 'baseline'} -> {current['meta'].get('commit') or 'current'}")
+    print(f"{'='*78}")
+    print(f"{'format':<13}{'metric':<32}{'baseline':>11}{'current':>11}{'change':>11}")
+
+    def row(fmt, metric, before, after, higher_is_better, tolerance):
+        change = (after - before) / before if before else 0.0
+        worse = (change < -tolerance) if higher_is_better else (change > tolerance)
+        flag = ' ⚠️' if worse else ''
+        print(f"{fmt:<13}{metric:<32}{before:>11.4f}{after:>11.4f}{change:>+10.1%}{flag}")
+        if worse:
+            regressions.append(f"{fmt} {metric}: {before:.4f} -> {after:.4f}")
+
+    for fmt, now in current['summary'].items():
+        before = baseline['summary'].get(fmt)
+        if not before:
+            continue
+        row(fmt, 'latency_median_s', before['latency_median_s'], now['latency_median_s'], False, LATENCY_TOLERANCE)
+        row(fmt, 'latency_p95_s', before['latency_p95_s'], now['latency_p95_s'], False, LATENCY_TOLERANCE)
+        for stage, seconds in now['stage_median_s'].items():
+            if stage in before['stage_median_s']:
+                row(fmt, f'stage:{stage}', before['stage_median_s'][stage], seconds, False, LATENCY_TOLERANCE)
+        row(fmt, 'peak_rss_kb_max', before['peak_rss_kb_max'], now['peak_rss_kb_max'], False, MEMORY_TOLERANCE)
+        for field, score in now['accuracy'].items():
+            if field in before['accuracy']:
+                # Accuracy uses an absolute tolerance, scaled here into a relative one
+                tolerance = ACCURACY_TOLERANCE / before['accuracy'][field] if before['accuracy'][field] else 0
+                row(fmt, f'accuracy:{field}', before['accuracy'][field], score, True, tolerance)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CV text extraction against the synthetic corpus')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='corpus directory (default: benchmarks/corpus)')
+    parser.add_argument('--output', help='write the JSON report here')
+    parser.add_argument('--compare', help='baseline JSON report to compare against')
+    parser.add_argument('--fail-on-regression', action='store_true', help='exit 1 if --compare finds regressions')
+    parser.add_argument('--format', choices=['docx', 'text_pdf', 'scanned_pdf'], action='append',
+                        help='only benchmark these formats (repeatable)')
+    parser.add_argument('--ocr-workers', type=int, help='OCR pool size (default: Config.OCR_MAX_WORKERS)')
+    parser.add_argument('--verbose', action='store_true', help='show extractor output')
+    args = parser.parse_args()
+
+    truth_path = os.path.join(args.corpus, 'ground_truth.json')
+    if not os.path.exists(truth_path):
+        print(f"❌ {truth_path} not found, run benchmarks/generate_corpus.py first")
+        sys.exit(1)
+    with open(truth_path) as f:
+        truth = json.load(f)['files']
+
+    extractor = CVTextExtractor(ocr_workers=args.ocr_workers)
+    files = {}
+    for filename, expected in sorted(truth.items()):
+        if args.format and expected['format'] not in args.format:
+            continue
+        outcome = run_file(extractor, os.path.join(args.corpus, filename), args.verbose)
+        outcome['format'] = expected['format']
+        outcome['accuracy'] = score_fields(expected['fields'], outcome.pop('parsed_fields'))
+        files[filename] = outcome
+        status = f"❌ {outcome['error']}" if outcome['error'] else f"accuracy {statistics.mean(outcome['accuracy'].values()):.2f}"
+        print(f"{filename:<28}{outcome['seconds']:>8.2f}s  {outcome['peak_rss_kb'] / 1024:>7.1f} MB  {status}")
+
+    if not files:
+        print("❌ No files matched")
+        sys.exit(1)
+
+    report = {
+        'meta': {
+            'commit': _git_commit(),
+            'created_at': datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'ocr_workers': extractor.ocr_workers,
+        },
+        'summary': summarize(files),
+        'files': files,
+    }
+
+    print(f"\n{'='*78}")
+    print("📊 SUMMARY")
+    print(f"{'='*78}")
+    for fmt, stats in report['summary'].items():
+        stages = ', '.join(f"{stage} {seconds:.3f}s" for stage, seconds in stats['stage_median_s'].items())
+        print(f"{fmt:<12} {stats['files']:>3} files  median {stats['latency_median_s']:.3f}s  "
+              f"p95 {stats['latency_p95_s']:.3f}s  peak {stats['peak_rss_kb_max'] / 1024:.1f} MB  "
+              f"accuracy {stats['accuracy_mean']:.3f}")
+        if stages:
+            print(f"{'':<13}stages (median): {stages}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regressions:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            if args.fail_on_regression:
+                sys.exit(1)
+        else:
+            print("\n✅ No regressions")
+
+
+if __name__ == '__main__':
+    main()
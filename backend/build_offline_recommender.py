@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Build the offline job-title recommender from the jobs table
+
+The artifact (gzipped JSON, see app/utils/offline_recommender.py) is what
+the ML client falls back to when the ML API is down or slow. Workers pick
+up a rebuilt artifact automatically; the scheduler rebuilds it after every
+scrape.
+
+Usage:
+    python build_offline_recommender.py
+    python build_offline_recommender.py --output models/offline_recommender.json.gz --min-jobs 2
+"""
+import argparse
+import logging
+import time
+from app import create_app, db
+from app.models import Job
+from app.utils.offline_recommender import OFFLINE_RECOMMENDER_PATH, build_model, save_model
+
+logger = logging.getLogger(__name__)
+
+
+def iter_jobs(batch_size=1000):
+    """Stream the columns the model needs without loading whole Job objects"""
+    query = db.session.query(Job.title, Job.category, Job.description, Job.requirements) \
+        .execution_options(yield_per=batch_size)
+    for title, category, description, requirements in query:
+        yield {
+            'title': title,
+            'category': category,
+            # Long descriptions add little beyond their first part
+            'description': (description or '')[:4000],
+            'requirements': (requirements or '')[:2000],
+        }
+
+
+def build(output=OFFLINE_RECOMMENDER_PATH, min_jobs=1, max_terms=60):
+    """Build and save the artifact; must run inside an app context"""
+    started = time.time()
+    model = build_model(iter_jobs(), max_terms=max_terms, min_jobs=min_jobs)
+    save_model(model, output)
+    logger.info(f"✅ Offline recommender: {len(model['titles'])} titles, {len(model['idf'])} terms "
+                f"-> {output} ({time.time() - started:.1f}s)")
+    return model
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+
+    parser = argparse.ArgumentParser(description='Build the offline job-title recommender artifact')
+    parser.add_argument('--output', default=OFFLINE_RECOMMENDER_PATH, help=f'artifact path (default: {OFFLINE_RECOMMENDER_PATH})')
+    parser.add_argument('--min-jobs', type=int, default=1, help='ignore titles with fewer postings (default: 1)')
+    parser.add_argument('--max-terms', type=int, default=60, help='terms kept per title (default: 60)')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        build(args.output, args.min_jobs, args.max_terms)
+
+
+if __name__ == '__main__':
+    main()
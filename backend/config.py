@@ -46,6 +46,87 @@ class Config:
     # Poppler path for pdf2image
     POPPLER_PATH = os.getenv('POPPLER_PATH', r'C:\poppler\poppler-24.02.0\Library\bin')
     
+    # OCR process pool for scanned PDFs (0 = one worker per available CPU core)
+    OCR_MAX_WORKERS = int(os.getenv('OCR_MAX_WORKERS', 0))
+    OCR_PAGE_TIMEOUT = int(os.getenv('OCR_PAGE_TIMEOUT', 60))  # seconds per page
+    OCR_MAX_PAGES = int(os.getenv('OCR_MAX_PAGES', 20))  # pages beyond this are not OCR'd
+    
+    # PDF text layer: auto (pdftotext, then pdfminer if pages look garbled) | pdftotext | pdfminer
+    PDF_TEXT_ENGINE = os.getenv('PDF_TEXT_ENGINE', 'auto')
+    PDF_TEXT_TIMEOUT = int(os.getenv('PDF_TEXT_TIMEOUT', 30))  # seconds per document
+    
+    # Directory with skills.json / languages.json / proficiency.json overriding app/utils/data
+    CV_VOCABULARY_DIR = os.getenv('CV_VOCABULARY_DIR') or None
+    
+    # .doc conversion through a long-lived LibreOffice listener (unoserver)
+    UNOSERVER_HOST = os.getenv('UNOSERVER_HOST', '127.0.0.1')
+    UNOSERVER_PORT = int(os.getenv('UNOSERVER_PORT', 2003))
+    UNOSERVER_CMD = os.getenv('UNOSERVER_CMD', 'unoserver')
+    DOC_CONVERTER_MANAGED = os.getenv('DOC_CONVERTER_MANAGED', 'true').lower() == 'true'  # app starts/restarts it
+    DOC_CONVERT_TIMEOUT = int(os.getenv('DOC_CONVERT_TIMEOUT', 30))  # seconds per conversion
+    DOC_CONVERT_MAX_PENDING = int(os.getenv('DOC_CONVERT_MAX_PENDING', 8))  # queued conversions per process
+    DOC_CONVERTER_PID_FILE = os.getenv('DOC_CONVERTER_PID_FILE')  # shared by the processes using the listener (default: <tmp>/unoserver-<port>.pid)
+    
+    # Background CV analysis (analysis_worker.py)
+    ANALYSIS_POLL_INTERVAL = float(os.getenv('ANALYSIS_POLL_INTERVAL', 2))  # seconds between queue checks
+    ANALYSIS_STALE_AFTER = int(os.getenv('ANALYSIS_STALE_AFTER', 900))  # re-queue 'processing' rows older than this
+    ANALYSIS_MAX_ATTEMPTS = int(os.getenv('ANALYSIS_MAX_ATTEMPTS', 3))
+    
+    # ML recommendation API (app/utils/ml_client.py)
+    ML_API_URL = os.getenv('ML_API_URL', 'http://138.197.13.244:8000/upload')
+    ML_API_CONNECT_TIMEOUT = float(os.getenv('ML_API_CONNECT_TIMEOUT', 5))  # seconds
+    ML_API_READ_TIMEOUT = float(os.getenv('ML_API_READ_TIMEOUT', 60))  # seconds
+    ML_API_RETRIES = int(os.getenv('ML_API_RETRIES', 2))  # connection errors / 502-504 only
+    ML_API_POOL_SIZE = int(os.getenv('ML_API_POOL_SIZE', 10))
+    ML_CIRCUIT_FAILURES = int(os.getenv('ML_CIRCUIT_FAILURES', 3))  # consecutive failures before failing fast
+    ML_CIRCUIT_RESET = float(os.getenv('ML_CIRCUIT_RESET', 60))  # seconds before trying the service again
+    ML_CACHE_TTL = int(os.getenv('ML_CACHE_TTL', 86400))  # seconds recommendations stay in ml_recommendation_cache (0 = off)
+    ML_LATENCY_BUDGET = float(os.getenv('ML_LATENCY_BUDGET', 20))  # seconds before using the offline recommender (0 = off)
+    
+    # Offline job-title recommender (build_offline_recommender.py), used when the ML API fails
+    OFFLINE_RECOMMENDER_PATH = os.path.join(BASE_DIR, os.getenv('OFFLINE_RECOMMENDER_PATH', 'models/offline_recommender.json.gz'))
+    OFFLINE_MIN_SCORE = float(os.getenv('OFFLINE_MIN_SCORE', 0.05))
+    
+    # Rendered CV PDFs (app/utils/cv_pdf.py), keyed by a hash of the CV content
+    CV_PDF_CACHE_DIR = os.path.join(BASE_DIR, os.getenv('CV_PDF_CACHE_DIR', 'uploads/pdf_cache'))
+    CV_PDF_CACHE_MAX_AGE_DAYS = int(os.getenv('CV_PDF_CACHE_MAX_AGE_DAYS', 30))  # drop PDFs unused this long (0 = no limit)
+    CV_PDF_CACHE_MAX_MB = int(os.getenv('CV_PDF_CACHE_MAX_MB', 500))  # then least recently used first (0 = no limit)
+    
+    # Admin bulk CV export (POST /api/admin/cvs/export), built by analysis_worker.py
+    CV_EXPORT_WORKERS = int(os.getenv('CV_EXPORT_WORKERS', 2))  # processes rendering PDFs per analysis worker
+    CV_EXPORT_MAX_CVS = int(os.getenv('CV_EXPORT_MAX_CVS', 1000))  # CVs per archive
+    CV_EXPORT_STALE_AFTER = int(os.getenv('CV_EXPORT_STALE_AFTER', 3600))  # re-queue 'processing' exports older than this
+    CV_EXPORT_MAX_ATTEMPTS = int(os.getenv('CV_EXPORT_MAX_ATTEMPTS', 2))
+    CV_EXPORT_KEEP_HOURS = int(os.getenv('CV_EXPORT_KEEP_HOURS', 24))  # finished archives are deleted after this
+    
+    # Job scraper (auto_scraper.py): detail pages are fetched over plain HTTP, Chrome only when needed
+    SCRAPER_SOURCES = [s.strip() for s in os.getenv('SCRAPER_SOURCES', 'bongthom').split(',') if s.strip()]  # app/utils/job_sources.py, one process each
+    SCRAPER_BASE_URL = os.getenv('SCRAPER_BASE_URL', 'https://www.bongthom.com')
+    SCRAPER_CONCURRENCY = int(os.getenv('SCRAPER_CONCURRENCY', 4))  # requests in flight per host
+    SCRAPER_RATE_LIMIT = float(os.getenv('SCRAPER_RATE_LIMIT', 2))  # request starts per second per host (0 = unlimited)
+    SCRAPER_TIMEOUT = int(os.getenv('SCRAPER_TIMEOUT', 20))  # seconds
+    SCRAPER_RETRIES = int(os.getenv('SCRAPER_RETRIES', 2))  # connection errors / 429 / 5xx
+    # Headless Chrome for pages that need JavaScript (app/utils/browser_pool.py)
+    SCRAPER_BROWSERS = int(os.getenv('SCRAPER_BROWSERS', 2))  # Chrome instances rendering in parallel
+    SCRAPER_BLOCK_ASSETS = os.getenv('SCRAPER_BLOCK_ASSETS', 'true').lower() == 'true'  # skip images, fonts, CSS
+    SCRAPER_RENDER_TIMEOUT = int(os.getenv('SCRAPER_RENDER_TIMEOUT', 10))  # seconds to wait for the job links/positions
+    SCRAPER_PAGE_LOAD_TIMEOUT = int(os.getenv('SCRAPER_PAGE_LOAD_TIMEOUT', 30))  # seconds before a navigation is abandoned
+    # Incremental crawling (scrape_state table): pagination stops at the first fully known page
+    SCRAPER_MAX_PAGES = int(os.getenv('SCRAPER_MAX_PAGES', 10))  # safety cap per run
+    SCRAPER_INITIAL_MAX_PAGES = int(os.getenv('SCRAPER_INITIAL_MAX_PAGES', 50))  # cap when nothing is known yet
+    SCRAPER_REFETCH_DAYS = int(os.getenv('SCRAPER_REFETCH_DAYS', 14))  # re-download known pages older than this (0 = never)
+    # Raw HTML of every fetched page, gzipped and content-addressed (reparse_archive.py)
+    SCRAPER_ARCHIVE = os.getenv('SCRAPER_ARCHIVE', 'true').lower() == 'true'
+    SCRAPER_ARCHIVE_DIR = os.path.join(BASE_DIR, os.getenv('SCRAPER_ARCHIVE_DIR', 'scrape_archive'))
+    SCRAPER_ARCHIVE_RETENTION_DAYS = int(os.getenv('SCRAPER_ARCHIVE_RETENTION_DAYS', 90))  # pruned after each scheduled scrape (0 = keep everything)
+    # Scraped pages stream into the database in batches while the crawl goes on (app/utils/scrape_pipeline.py)
+    SCRAPER_PIPELINE_BATCH = int(os.getenv('SCRAPER_PIPELINE_BATCH', 50))  # pages per import batch
+    SCRAPER_PIPELINE_FLUSH_SECONDS = float(os.getenv('SCRAPER_PIPELINE_FLUSH_SECONDS', 5))  # longest wait for a batch to fill
+    SCRAPER_PIPELINE_QUEUE_SIZE = int(os.getenv('SCRAPER_PIPELINE_QUEUE_SIZE', 20))  # pages waiting before the crawl pauses
+    SCRAPER_AUDIT_CSV = os.getenv('SCRAPER_AUDIT_CSV', 'true').lower() == 'true'  # also write imported rows to <source>_scraped_*.csv
+    # scheduler.py replicas elect a leader through a Postgres advisory lock (app/utils/scheduler_lock.py)
+    SCHEDULER_HEARTBEAT_SECONDS = int(os.getenv('SCHEDULER_HEARTBEAT_SECONDS', 15))  # leader liveness check / standby retry
+    
     # Frontend URL for links in emails
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
 
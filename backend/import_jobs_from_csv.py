@@ -5,98 +5,182 @@ Import scraped jobs from CSV/Excel file to database
 Usage:
     python import_jobs_from_csv.py jobs.csv
     python import_jobs_from_csv.py jobs.xlsx
+
+Large feeds / scheduled runs (no prompt, constant memory):
+    python import_jobs_from_csv.py feed.csv --yes --chunksize 5000
+    python import_jobs_from_csv.py feed.csv --yes --chunksize 5000 --start-row 120000   # resume after a failure
+
+Rows are counted from 0 after the header. Every chunk is committed on its
+own, so after a failure the run can be resumed from the row it reports.
 """
 
+import argparse
 import sys
 import os
+import time
 import pandas as pd
 from app import create_app, db
+from app.utils.job_cleaning import to_records
 from app.utils.job_scraper import JobScraperImporter
 
-def import_from_file(file_path):
-    """Import jobs from CSV or Excel file"""
-    
+
+def iter_chunks(file_path, chunksize=None, start_row=0):
+    """(first row number, DataFrame) per chunk of the file, skipping rows before start_row"""
+    if file_path.endswith('.csv'):
+        if not chunksize:
+            df = pd.read_csv(file_path)
+            yield start_row, df.iloc[start_row:]
+            return
+        # Rows are skipped after parsing, not with skiprows: quoted descriptions span several lines
+        row = 0
+        for df in pd.read_csv(file_path, chunksize=chunksize):
+            first, row = row, row + len(df)
+            if row <= start_row:
+                continue
+            yield max(first, start_row), df.iloc[max(0, start_row - first):]
+    elif file_path.endswith('.xlsx') and chunksize:
+        # read_excel has no chunksize; openpyxl's read-only mode streams the rows
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            chunk, first = [], start_row
+            for row, values in enumerate(rows):
+                if row < start_row:
+                    continue
+                chunk.append(values)
+                if len(chunk) == chunksize:
+                    yield first, pd.DataFrame(chunk, columns=header)
+                    chunk, first = [], row + 1
+            if chunk:
+                yield first, pd.DataFrame(chunk, columns=header)
+        finally:
+            workbook.close()
+    else:
+        # .xls (or no --chunksize): the whole sheet is read, then sliced
+        df = pd.read_excel(file_path)
+        step = chunksize or max(1, len(df))
+        for first in range(start_row, len(df), step):
+            yield first, df.iloc[first:first + step]
+
+
+def print_results(stats):
+    print(f"\n{'='*50}")
+    print(f"📊 IMPORT RESULTS")
+    print(f"{'='*50}")
+    print(f"📋 Total jobs processed: {stats['total']}")
+    print(f"✅ Successfully imported: {stats['imported']}")
+    print(f"⏭️  Skipped (duplicates): {stats['skipped']}")
+    print(f"🚫 Skipped (no logo): {stats['no_logo']}")
+    print(f"❌ Failed: {stats['failed']}")
+    print(f"{'='*50}")
+
+    if stats['imported'] > 0:
+        print(f"\n🎉 Success! {stats['imported']} jobs added to database")
+
+    if stats['skipped'] > 0:
+        print(f"\nℹ️  {stats['skipped']} jobs were already in database (skipped)")
+
+    if stats['failed'] > 0:
+        print(f"\n⚠️  {stats['failed']} jobs failed to import (check logs above)")
+
+
+def import_from_file(file_path, assume_yes=False, chunksize=None, start_row=0):
+    """Import jobs from CSV or Excel file; returns False if the import stopped on an error"""
+
     if not os.path.exists(file_path):
         print(f"❌ File not found: {file_path}")
-        return
-    
+        return False
+
+    if not file_path.endswith(('.csv', '.xlsx', '.xls')):
+        print("❌ Unsupported file format. Use .csv, .xlsx, or .xls")
+        return False
+
     print(f"📄 Reading file: {file_path}")
-    
-    # Read file based on extension
-    if file_path.endswith('.csv'):
-        df = pd.read_csv(file_path)
-    elif file_path.endswith(('.xlsx', '.xls')):
-        df = pd.read_excel(file_path)
+    chunks = iter_chunks(file_path, chunksize, start_row)
+
+    if not chunksize:
+        # Whole file at once: show what is about to be imported
+        first_row, df = next(chunks, (start_row, pd.DataFrame()))
+        print(f"📊 Found {len(df)} jobs in file")
+        print(f"📋 Columns: {', '.join(df.columns.tolist())}")
+
+        # Show sample
+        print(f"\n📝 Sample job:")
+        if len(df):
+            sample = to_records(df.head(1))[0]
+            for key, value in list(sample.items())[:5]:  # Show first 5 fields
+                print(f"   {key}: {value}")
+            print("   ...")
+        chunks = iter([(first_row, df)])
+        summary = f"{len(df)} jobs"
     else:
-        print("❌ Unsupported file format. Use .csv, .xlsx, or .xls")
-        return
-    
-    print(f"📊 Found {len(df)} jobs in file")
-    print(f"📋 Columns: {', '.join(df.columns.tolist())}")
-    
-    # Convert DataFrame to list of dictionaries
-    jobs_data = df.to_dict('records')
-    
-    # Clean NaN values (replace with None)
-    for job in jobs_data:
-        for key, value in job.items():
-            if pd.isna(value):
-                job[key] = None
-    
-    # Show sample
-    print(f"\n📝 Sample job:")
-    if jobs_data:
-        sample = jobs_data[0]
-        for key, value in list(sample.items())[:5]:  # Show first 5 fields
-            print(f"   {key}: {value}")
-        print("   ...")
-    
+        summary = f"jobs in chunks of {chunksize} rows" + (f", from row {start_row}" if start_row else "")
+
     # Confirm import
-    print(f"\n⚠️  About to import {len(jobs_data)} jobs to database")
-    response = input("Continue? (yes/no): ")
-    
-    if response.lower() not in ['yes', 'y']:
-        print("❌ Import cancelled")
-        return
-    
+    if not assume_yes:
+        print(f"\n⚠️  About to import {summary} to database")
+        response = input("Continue? (yes/no): ")
+
+        if response.lower() not in ['yes', 'y']:
+            print("❌ Import cancelled")
+            return True
+
     # Create Flask app context
     app = create_app()
-    
+    totals = {'total': 0, 'imported': 0, 'skipped': 0, 'no_logo': 0, 'failed': 0}
+    started = time.monotonic()
+
     with app.app_context():
         print(f"\n🚀 Starting import...\n")
-        
-        # Import jobs
-        stats = JobScraperImporter.import_jobs_batch(jobs_data)
-        
-        print(f"\n{'='*50}")
-        print(f"📊 IMPORT RESULTS")
-        print(f"{'='*50}")
-        print(f"📋 Total jobs processed: {stats['total']}")
-        print(f"✅ Successfully imported: {stats['imported']}")
-        print(f"⏭️  Skipped (duplicates): {stats['skipped']}")
-        print(f"🚫 Skipped (no logo): {stats['no_logo']}")
-        print(f"❌ Failed: {stats['failed']}")
-        print(f"{'='*50}")
-        
-        if stats['imported'] > 0:
-            print(f"\n🎉 Success! {stats['imported']} jobs added to database")
-        
-        if stats['skipped'] > 0:
-            print(f"\nℹ️  {stats['skipped']} jobs were already in database (skipped)")
-        
-        if stats['failed'] > 0:
-            print(f"\n⚠️  {stats['failed']} jobs failed to import (check logs above)")
+
+        for first_row, df in chunks:
+            chunk_started = time.monotonic()
+            stats = JobScraperImporter.import_jobs_batch(to_records(df))
+            for key in totals:
+                totals[key] += stats[key]
+
+            elapsed = time.monotonic() - chunk_started
+            last_row = first_row + len(df) - 1
+            print(f"📦 Rows {first_row}-{last_row}: {stats['imported']} imported, {stats['skipped']} duplicates, "
+                  f"{stats['no_logo']} no logo, {stats['failed']} failed "
+                  f"({len(df) / max(elapsed, 1e-6):.0f} rows/s)")
+
+            if stats.get('error'):
+                # Earlier chunks are committed; this one rolled back as a whole
+                print(f"\n❌ Import stopped at row {first_row}: {stats['error']}")
+                print(f"   → Resume with: python import_jobs_from_csv.py {file_path} --yes"
+                      f"{f' --chunksize {chunksize}' if chunksize else ''} --start-row {first_row}")
+                print_results(totals)
+                return False
+
+            # Don't let the identity map grow across chunks
+            db.session.expunge_all()
+
+        elapsed = time.monotonic() - started
+        print(f"\n⏱️  {totals['total']} rows in {elapsed:.1f}s ({totals['total'] / max(elapsed, 1e-6):.0f} rows/s)")
+        print_results(totals)
+    return True
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python import_jobs_from_csv.py <file.csv|file.xlsx>")
-        print("\nExample:")
-        print("  python import_jobs_from_csv.py jobs.csv")
-        print("  python import_jobs_from_csv.py jobs.xlsx")
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    import_from_file(file_path)
+    parser = argparse.ArgumentParser(description='Import scraped jobs from a CSV or Excel file')
+    parser.add_argument('file', help='.csv, .xlsx or .xls file')
+    parser.add_argument('-y', '--yes', action='store_true', help='do not ask for confirmation')
+    parser.add_argument('--chunksize', type=int, help='rows per import batch, read as the file is streamed '
+                                                      '(default: the whole file at once)')
+    parser.add_argument('--start-row', type=int, default=0, help='skip the rows before this one (0 = first after the header)')
+    args = parser.parse_args()
+
+    if args.chunksize is not None and args.chunksize < 1:
+        parser.error('--chunksize must be at least 1')
+    if args.start_row < 0:
+        parser.error('--start-row must not be negative')
+
+    ok = import_from_file(args.file, assume_yes=args.yes, chunksize=args.chunksize, start_row=args.start_row)
+    sys.exit(0 if ok else 1)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,44 @@
+"""add cv_analyses table
+
+Revision ID: 3a1f6c2d9b47
+Revises: add_profiles_email_001
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '3a1f6c2d9b47'
+down_revision = 'add_profiles_email_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cv_analyses',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('filename', sa.String(length=255), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=True),
+        sa.Column('content_type', sa.String(length=100), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('stage', sa.String(length=50), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('result', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cv_analyses_user_id'), 'cv_analyses', ['user_id'], unique=False)
+    op.create_index(op.f('ix_cv_analyses_status'), 'cv_analyses', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_cv_analyses_status'), table_name='cv_analyses')
+    op.drop_index(op.f('ix_cv_analyses_user_id'), table_name='cv_analyses')
+    op.drop_table('cv_analyses')
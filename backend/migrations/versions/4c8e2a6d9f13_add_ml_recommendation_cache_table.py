@@ -0,0 +1,32 @@
+"""add ml_recommendation_cache table
+
+Revision ID: 4c8e2a6d9f13
+Revises: 9e5a1c7f3b20
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c8e2a6d9f13'
+down_revision = '9e5a1c7f3b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ml_recommendation_cache',
+        sa.Column('text_hash', sa.String(length=64), nullable=False),
+        sa.Column('recommendations', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('text_hash')
+    )
+    op.create_index(op.f('ix_ml_recommendation_cache_expires_at'), 'ml_recommendation_cache', ['expires_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_ml_recommendation_cache_expires_at'), table_name='ml_recommendation_cache')
+    op.drop_table('ml_recommendation_cache')
@@ -0,0 +1,35 @@
+"""add scrape_state table
+
+Revision ID: 5b2e8d41c7a3
+Revises: 3a1f6c2d9b47
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '5b2e8d41c7a3'
+down_revision = '3a1f6c2d9b47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scrape_state',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('source', sa.String(length=50), nullable=False),
+        sa.Column('url', sa.String(length=500), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=True),
+        sa.Column('positions', sa.Integer(), nullable=False),
+        sa.Column('first_seen_at', sa.DateTime(), nullable=False),
+        sa.Column('last_seen_at', sa.DateTime(), nullable=False),
+        sa.Column('last_fetched_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('source', 'url', name='uq_scrape_state_source_url')
+    )
+
+
+def downgrade():
+    op.drop_table('scrape_state')
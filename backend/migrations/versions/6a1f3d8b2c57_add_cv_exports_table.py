@@ -0,0 +1,42 @@
+"""add cv_exports table
+
+Revision ID: 6a1f3d8b2c57
+Revises: 4c8e2a6d9f13
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '6a1f3d8b2c57'
+down_revision = '4c8e2a6d9f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cv_exports',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('cv_ids', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=True),
+        sa.Column('file_size', sa.BigInteger(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_cv_exports_status'), 'cv_exports', ['status'], unique=False)
+    op.create_index(op.f('ix_cv_exports_user_id'), 'cv_exports', ['user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_cv_exports_user_id'), table_name='cv_exports')
+    op.drop_index(op.f('ix_cv_exports_status'), table_name='cv_exports')
+    op.drop_table('cv_exports')
@@ -0,0 +1,52 @@
+"""add scrape_runs table
+
+Revision ID: 7d3c9f1b2e84
+Revises: 5b2e8d41c7a3
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '7d3c9f1b2e84'
+down_revision = '5b2e8d41c7a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scrape_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('source', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('duration_seconds', sa.Float(), nullable=True),
+        sa.Column('fetch_seconds', sa.Float(), nullable=False),
+        sa.Column('parse_seconds', sa.Float(), nullable=False),
+        sa.Column('db_check_seconds', sa.Float(), nullable=False),
+        sa.Column('import_seconds', sa.Float(), nullable=False),
+        sa.Column('notify_seconds', sa.Float(), nullable=False),
+        sa.Column('first_notification_seconds', sa.Float(), nullable=True),
+        sa.Column('pages', sa.Integer(), nullable=False),
+        sa.Column('details_fetched', sa.Integer(), nullable=False),
+        sa.Column('known_pages', sa.Integer(), nullable=False),
+        sa.Column('jobs_scraped', sa.Integer(), nullable=False),
+        sa.Column('duplicates', sa.Integer(), nullable=False),
+        sa.Column('imported', sa.Integer(), nullable=False),
+        sa.Column('failed', sa.Integer(), nullable=False),
+        sa.Column('notifications_created', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scrape_runs_source'), 'scrape_runs', ['source'], unique=False)
+    op.create_index(op.f('ix_scrape_runs_started_at'), 'scrape_runs', ['started_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_scrape_runs_started_at'), table_name='scrape_runs')
+    op.drop_index(op.f('ix_scrape_runs_source'), table_name='scrape_runs')
+    op.drop_table('scrape_runs')
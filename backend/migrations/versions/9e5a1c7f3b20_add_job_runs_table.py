@@ -0,0 +1,40 @@
+"""add job_runs table
+
+Revision ID: 9e5a1c7f3b20
+Revises: 7d3c9f1b2e84
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '9e5a1c7f3b20'
+down_revision = '7d3c9f1b2e84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('job_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('job_id', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('trigger', sa.String(length=20), nullable=False),
+        sa.Column('worker', sa.String(length=255), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_runs_job_id'), 'job_runs', ['job_id'], unique=False)
+    op.create_index(op.f('ix_job_runs_started_at'), 'job_runs', ['started_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_job_runs_started_at'), table_name='job_runs')
+    op.drop_index(op.f('ix_job_runs_job_id'), table_name='job_runs')
+    op.drop_table('job_runs')
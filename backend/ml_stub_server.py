@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the ML recommendation API
+
+Accepts the same multipart POST /upload as the real service and answers
+with deterministic recommendations based on job-title words found in the
+uploaded text. Latency and failures can be injected to exercise the
+client's timeouts, retries and circuit breaker.
+
+Usage:
+    python ml_stub_server.py                         # http://127.0.0.1:8000/upload
+    python ml_stub_server.py --port 8001 --delay 2
+    python ml_stub_server.py --fail-rate 0.5 --fail-status 503
+
+Then point the app at it:
+    ML_API_URL=http://127.0.0.1:8000/upload
+"""
+import argparse
+import json
+import random
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Words in the CV text -> recommended job title
+TITLE_HINTS = [
+    ('python', 'Python Developer'),
+    ('javascript', 'Frontend Developer'),
+    ('react', 'Frontend Developer'),
+    ('java', 'Java Developer'),
+    ('docker', 'DevOps Engineer'),
+    ('kubernetes', 'DevOps Engineer'),
+    ('machine learning', 'Machine Learning Engineer'),
+    ('data', 'Data Analyst'),
+    ('sql', 'Database Administrator'),
+    ('accounting', 'Accountant'),
+    ('marketing', 'Marketing Officer'),
+    ('sales', 'Sales Executive'),
+    ('teacher', 'Teacher'),
+    ('nurse', 'Nurse'),
+    ('project', 'Project Manager'),
+]
+DEFAULT_TITLES = ['Administrative Assistant', 'Customer Service Officer']
+
+
+def recommend(text: str, limit: int = 5) -> list:
+    text = text.lower()
+    titles = []
+    for hint, title in TITLE_HINTS:
+        if hint in text and title not in titles:
+            titles.append(title)
+    titles = (titles or DEFAULT_TITLES)[:limit]
+    return [{'job_title': title, 'score': round(1 - i * 0.1, 2)} for i, title in enumerate(titles)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    options = None  # argparse namespace, set in main()
+    requests_served = 0
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path in ('/', '/health'):
+            self._send_json(200, {'status': 'ok', 'requests_served': StubHandler.requests_served})
+        else:
+            self._send_json(404, {'detail': 'Not Found'})
+
+    def do_POST(self):
+        if self.path != '/upload':
+            self._send_json(404, {'detail': 'Not Found'})
+            return
+
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        StubHandler.requests_served += 1
+
+        if self.options.delay:
+            time.sleep(self.options.delay)
+        if random.random() < self.options.fail_rate:
+            self._send_json(self.options.fail_status, {'detail': 'Injected failure'})
+            return
+
+        # Parse the multipart body with the stdlib email parser
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode('latin-1') + body
+        )
+        upload = next((part for part in message.iter_parts() if part.get_param('name', header='content-disposition') == 'file'), None) \
+            if message.is_multipart() else None
+        if upload is None:
+            self._send_json(422, {'detail': 'file is required'})
+            return
+
+        text = upload.get_payload(decode=True).decode('utf-8', errors='replace')
+        self._send_json(200, {
+            'filename': upload.get_filename(),
+            'recommendations': recommend(text, self.options.limit)
+        })
+
+    def log_message(self, format, *args):
+        print(f"[ml-stub] {self.address_string()} - {format % args}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the ML recommendation API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--delay', type=float, default=0, help='seconds to wait before answering')
+    parser.add_argument('--fail-rate', type=float, default=0, help='share of requests that fail (0-1)')
+    parser.add_argument('--fail-status', type=int, default=503, help='status code for injected failures')
+    parser.add_argument('--limit', type=int, default=5, help='recommendations per response')
+    StubHandler.options = parser.parse_args()
+
+    server = ThreadingHTTPServer((StubHandler.options.host, StubHandler.options.port), StubHandler)
+    print(f"🤖 ML stub listening on http://{StubHandler.options.host}:{StubHandler.options.port}/upload")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
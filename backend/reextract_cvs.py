@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+"""
+Re-run CV text extraction for stored CVs
+
+Walks CV rows whose file is stored under uploads/cvs, re-extracts each file
+with the current CVTextExtractor in a process pool and writes the parsed
+fields back in batched transactions. Progress is checkpointed after every
+committed batch, so an interrupted run continues where it stopped.
+
+Usage:
+    python reextract_cvs.py                  # resume from the checkpoint
+    python reextract_cvs.py --dry-run        # show what would change, write nothing
+    python reextract_cvs.py --restart        # ignore the checkpoint, start over
+    python reextract_cvs.py --workers 4 --batch-size 50 --limit 200
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import time
+import uuid
+from multiprocessing import Pool
+from app import create_app, db
+from app.models import CV
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('reextract_cvs.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = 'reextract_cvs.checkpoint.json'
+
+# Parsed fields mirrored into dedicated CV columns (column, field, max length)
+COLUMN_FIELDS = [
+    ('extracted_fullname', 'name', 200),
+    ('extracted_email', 'email', 120),
+    ('extracted_phone', 'phone', 50),
+    ('extracted_location', 'location', None),
+    ('extracted_summary', 'summary', None),
+]
+
+# One extractor per pool process
+_extractor = None
+_verbose = False
+
+
+def _init_worker(verbose):
+    """Pool initializer: build the extractor once per process"""
+    global _extractor, _verbose
+    from app.utils.cv_text_extractor import CVTextExtractor
+    # Pool processes are daemonic and can't start their own OCR pool,
+    # so each one OCRs its pages inline; the pool gives the parallelism
+    _extractor = CVTextExtractor(ocr_workers=1)
+    _verbose = verbose
+
+
+def _extract(job):
+    """Extract one CV file. Returns (cv_id, parsed_fields, extraction_method, error)"""
+    cv_id, filepath = job
+    try:
+        if _verbose:
+            result = _extractor.extract_from_file(filepath)
+        else:
+            # The extractor prints a lot of debug output per file
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = _extractor.extract_from_file(filepath)
+        return cv_id, result.get('parsed_fields') or {}, result.get('extraction_method'), None
+    except Exception as e:
+        return cv_id, None, None, str(e)
+
+
+def resolve_cv_file(upload_folder, file_path):
+    """Map a stored '/uploads/cvs/<name>' path to the file on disk"""
+    return os.path.join(upload_folder, 'cvs', os.path.basename(file_path))
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, checkpoint):
+    # Write then rename so a crash never leaves a truncated checkpoint
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def apply_parsed_fields(cv, parsed):
+    """Store parsed fields on a CV the same way the upload route does"""
+    cv.extracted_data = parsed
+    for column, field, max_length in COLUMN_FIELDS:
+        value = parsed.get(field)
+        if value:
+            setattr(cv, column, value[:max_length] if max_length else value)
+
+
+def describe_changes(old, new):
+    """Field-by-field summary of what re-extraction changes"""
+    old = old or {}
+    changes = []
+    for field in sorted(set(old) | set(new)):
+        before, after = old.get(field), new.get(field)
+        if before == after:
+            continue
+        if isinstance(before, list) or isinstance(after, list):
+            changes.append(f"{field}: {len(before or [])} -> {len(after or [])} items")
+        else:
+            changes.append(f"{field}: {str(before)[:60]!r} -> {str(after)[:60]!r}")
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-extract parsed fields for stored CV files')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='extraction processes (default: CPU count)')
+    parser.add_argument('--batch-size', type=int, default=25, help='CVs per transaction (default: 25)')
+    parser.add_argument('--limit', type=int, help='stop after this many CVs')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help=f'checkpoint file (default: {DEFAULT_CHECKPOINT})')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and start from the first CV')
+    parser.add_argument('--dry-run', action='store_true', help='print the changes without writing anything')
+    parser.add_argument('--verbose', action='store_true', help='show extractor output')
+    args = parser.parse_args()
+
+    app = create_app()
+
+    with app.app_context():
+        upload_folder = app.config['UPLOAD_FOLDER']
+
+        checkpoint = {} if args.restart or args.dry_run else load_checkpoint(args.checkpoint)
+        last_id = checkpoint.get('last_id')
+        stats = checkpoint.get('stats') or {'processed': 0, 'updated': 0, 'unchanged': 0, 'missing': 0, 'failed': 0}
+        if last_id:
+            logger.info(f"↩️  Resuming after CV {last_id} ({stats['processed']} already processed)")
+
+        query = CV.query.filter(CV.file_path.like('/uploads/cvs/%'))
+        if last_id:
+            query = query.filter(CV.id > uuid.UUID(last_id))
+        total = query.count()
+        if args.limit:
+            total = min(total, args.limit)
+        logger.info(f"📊 {total} CVs to re-extract with {args.workers} workers{' (dry run)' if args.dry_run else ''}")
+
+        started = time.time()
+        done = 0
+
+        with Pool(args.workers, initializer=_init_worker, initargs=(args.verbose,)) as pool:
+            while done < total:
+                # Keyset pagination on id, so the cursor stays valid while rows are updated
+                batch_query = CV.query.filter(CV.file_path.like('/uploads/cvs/%'))
+                if last_id:
+                    batch_query = batch_query.filter(CV.id > uuid.UUID(last_id))
+                batch = batch_query.order_by(CV.id).limit(min(args.batch_size, total - done)).all()
+                if not batch:
+                    break
+
+                cvs = {str(cv.id): cv for cv in batch}
+                jobs = []
+                for cv in batch:
+                    filepath = resolve_cv_file(upload_folder, cv.file_path)
+                    if os.path.exists(filepath):
+                        jobs.append((str(cv.id), filepath))
+                    else:
+                        stats['missing'] += 1
+                        logger.warning(f"⚠️  File missing for CV {cv.id}: {filepath}")
+
+                for cv_id, parsed, method, error in pool.imap_unordered(_extract, jobs):
+                    cv = cvs[cv_id]
+                    if error:
+                        stats['failed'] += 1
+                        logger.error(f"❌ CV {cv_id} ({cv.name}): {error}")
+                        continue
+
+                    changes = describe_changes(cv.extracted_data, parsed)
+                    if not changes:
+                        stats['unchanged'] += 1
+                        continue
+
+                    stats['updated'] += 1
+                    if args.dry_run:
+                        logger.info(f"📝 CV {cv_id} ({cv.name}, {method}):\n    " + '\n    '.join(changes))
+                    else:
+                        apply_parsed_fields(cv, parsed)
+
+                last_id = str(batch[-1].id)
+                done += len(batch)
+                stats['processed'] += len(batch)
+
+                if args.dry_run:
+                    db.session.rollback()
+                else:
+                    db.session.commit()
+                    save_checkpoint(args.checkpoint, {'last_id': last_id, 'stats': stats})
+
+                elapsed = time.time() - started
+                rate = done / elapsed if elapsed else 0
+                eta = (total - done) / rate if rate else 0
+                logger.info(f"⏳ {done}/{total} CVs ({rate:.1f}/s, ETA {eta:.0f}s) - "
+                            f"updated {stats['updated']}, unchanged {stats['unchanged']}, "
+                            f"missing {stats['missing']}, failed {stats['failed']}")
+
+        logger.info(f"✅ Done in {time.time() - started:.0f}s")
+        if not args.dry_run:
+            logger.info(f"💾 Checkpoint: {args.checkpoint} (use --restart to process every CV again)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Re-run a job source's parser over the raw HTML archive
+
+The scraper stores every page it downloads (app/utils/html_archive.py).
+This script parses the archived pages again - in parallel, without touching
+the site or the database - and writes the resulting jobs to a CSV in the
+scraper's format. Use it to apply a parser fix to past crawls, or to time
+the parser (--benchmark).
+
+Usage:
+    python reparse_archive.py
+    python reparse_archive.py --since 2026-10-01 --output reparsed.csv
+    python reparse_archive.py --source bongthom
+    python reparse_archive.py --benchmark --workers 4
+"""
+import argparse
+import csv
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from app.utils.html_archive import SCRAPER_ARCHIVE_DIR, HtmlArchive
+from app.utils.job_sources import available_sources, get_source
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('reparse_archive.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Each worker opens the archive itself, so only sha256s cross the process boundary
+_archive = None
+
+
+def _init_worker(root):
+    global _archive
+    _archive = HtmlArchive(root)
+
+
+def _parse_listing_entry(entry):
+    url = urlsplit(entry['url'])
+    try:
+        source = get_source(entry['source'])
+        return source.parse_listing(_archive.load(entry['sha256']), f"{url.scheme}://{url.netloc}", entry['fetched_at']), None
+    except Exception as e:
+        return [], f"{entry['url']}: {str(e)}"
+
+
+def _parse_detail_entry(entry):
+    try:
+        return get_source(entry['source']).parse_detail(_archive.load(entry['sha256'])), None
+    except Exception as e:
+        return None, f"{entry['url']}: {str(e)}"
+
+
+def reparse(root, source='bongthom', since=None, until=None, workers=None):
+    """Parse one source's archived pages with its parser; returns (job rows, stats)"""
+    archive = HtmlArchive(root)
+    job_source = get_source(source)
+    stats = {'listing_pages': 0, 'detail_pages': 0, 'errors': 0, 'without_listing': 0}
+    rows = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(root,)) as pool:
+        # Listing fields (company, posting date, deadline) for each detail URL, from the
+        # most recent listing page that showed it - so listings are parsed in time order
+        listing_entries = list(archive.iter_index(kind='listing', source=source, since=since, until=until))
+        listing_by_url = {}
+        for listings, error in pool.map(_parse_listing_entry, listing_entries, chunksize=8):
+            stats['listing_pages'] += 1
+            if error:
+                stats['errors'] += 1
+                logger.warning(f"⚠️ {error}")
+            for listing in listings:
+                listing_by_url[listing['url']] = listing
+
+        # Latest fetch of each detail page
+        detail_entries = list(archive.latest(kind='detail', source=source, since=since, until=until).values())
+        for entry, (detail, error) in zip(detail_entries, pool.map(_parse_detail_entry, detail_entries, chunksize=8)):
+            stats['detail_pages'] += 1
+            if error:
+                stats['errors'] += 1
+                logger.warning(f"⚠️ {error}")
+                continue
+            listing = listing_by_url.get(entry['url'])
+            if listing is None:
+                stats['without_listing'] += 1
+                listing = {'url': entry['url'], 'job_title': '', 'company_name': '', 'deadline': '', 'posting_date': ''}
+            rows.extend(job_source.build_job_rows(listing, detail))
+
+    return rows, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-parse the raw HTML archive into jobs')
+    parser.add_argument('--archive', default=SCRAPER_ARCHIVE_DIR, help=f'archive folder (default: {SCRAPER_ARCHIVE_DIR})')
+    parser.add_argument('--source', default='bongthom', choices=available_sources(),
+                        help='job source whose pages to re-parse (default: bongthom)')
+    parser.add_argument('--since', help='first fetch day to include (YYYY-MM-DD)')
+    parser.add_argument('--until', help='last fetch day to include (YYYY-MM-DD)')
+    parser.add_argument('--workers', type=int, default=None, help='parser processes (default: one per CPU core)')
+    parser.add_argument('--output', help='CSV to write (default: <source>_reparsed_<timestamp>.csv)')
+    parser.add_argument('--benchmark', action='store_true', help='only parse and report timings, write nothing')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.archive):
+        logger.error(f"❌ No archive at {args.archive}")
+        return
+
+    started = time.time()
+    rows, stats = reparse(args.archive, args.source, args.since, args.until, args.workers)
+    elapsed = time.time() - started
+    pages = stats['listing_pages'] + stats['detail_pages']
+
+    logger.info(f"📄 Parsed {stats['listing_pages']} listing and {stats['detail_pages']} detail pages "
+                f"in {elapsed:.2f}s ({pages / elapsed if elapsed else 0:.1f} pages/s)")
+    logger.info(f"🧾 {len(rows)} positions, {stats['errors']} pages failed, "
+                f"{stats['without_listing']} detail pages without an archived listing")
+
+    if args.benchmark or not rows:
+        return
+
+    output = args.output or f"{args.source}_reparsed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    with open(output, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    logger.info(f"💾 Saved CSV: {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,7 @@ Reset jobs table and import only jobs with logos from CSV
 from app import create_app, db
 from app.models import Job
 import pandas as pd
-from datetime import datetime
-import uuid
+from app.utils.job_bulk_import import bulk_import_jobs
 
 def reset_and_import():
     app = create_app()
@@ -33,74 +32,55 @@ def reset_and_import():
         print(f"⏭️  Jobs without logos (skipped): {len(df) - len(df_with_logos)}")
         
         # Step 4: Import jobs
-        imported = 0
-        failed = 0
-        
         print(f"\n💾 Importing {len(df_with_logos)} jobs with logos...")
         
+        records = []
         for _, row in df_with_logos.iterrows():
-            try:
-                # Build description
-                description_parts = []
-                if pd.notna(row['Announcement Description']):
-                    description_parts.append(row['Announcement Description'])
-                if pd.notna(row['Position Summary']):
-                    description_parts.append(f"\n\n**Position Summary:**\n{row['Position Summary']}")
-                if pd.notna(row['Duties & Responsibilities']):
-                    description_parts.append(f"\n\n**Duties & Responsibilities:**\n{row['Duties & Responsibilities']}")
-                
-                description = '\n'.join(description_parts) if description_parts else 'No description available'
-                
-                # Build requirements
-                requirements_parts = []
-                if pd.notna(row['Qualifications']):
-                    requirements_parts.append(f"**Qualifications:**\n{row['Qualifications']}")
-                if pd.notna(row['Skills & Knowledge']):
-                    requirements_parts.append(f"\n**Skills & Knowledge:**\n{row['Skills & Knowledge']}")
-                if pd.notna(row['Languages Required']):
-                    requirements_parts.append(f"\n**Languages Required:**\n{row['Languages Required']}")
-                
-                requirements = '\n'.join(requirements_parts) if requirements_parts else 'No specific requirements listed'
-                
-                # Parse posting date
-                posting_date = None
-                if pd.notna(row['Posting Date']) and row['Posting Date']:
-                    try:
-                        posting_date = datetime.strptime(row['Posting Date'], '%Y-%m-%d')
-                    except:
-                        posting_date = datetime.now()
-                else:
-                    posting_date = datetime.now()
-                
-                # Create job
-                job = Job(
-                    title=row['Job Title'],
-                    company=row['Company Name'],
-                    location=row['Location'] if pd.notna(row['Location']) else 'Not specified',
-                    salary=row['Salary'] if pd.notna(row['Salary']) else 'Negotiable',
-                    job_type=row['Schedule'] if pd.notna(row['Schedule']) else 'Full-time',
-                    category=row['Career Category'] if pd.notna(row['Career Category']) else 'Other',
-                    description=description,
-                    requirements=requirements,
-                    logo=row['Company Logo'],  # Logo is guaranteed to exist
-                    contact_email=row['Contact Email'] if pd.notna(row['Contact Email']) else None,
-                    contact_phone=row['Phone'] if pd.notna(row['Phone']) else None,
-                    website=row['Website'] if pd.notna(row['Website']) else None,
-                    status='active',
-                    posted_date=posting_date
-                )
-                
-                db.session.add(job)
-                db.session.commit()
-                imported += 1
-                
-                if imported % 50 == 0:
-                    print(f"  ✅ Imported {imported} jobs...")
-                
-            except Exception as e:
-                db.session.rollback()
-                failed += 1
-                print(f"  ❌ Failed: {row['Job Title']} - {str(e)}")
+            # Build description
+            description_parts = []
+            if pd.notna(row['Announcement Description']):
+                description_parts.append(row['Announcement Description'])
+            if pd.notna(row['Position Summary']):
+                description_parts.append(f"\n\n**Position Summary:**\n{row['Position Summary']}")
+            if pd.notna(row['Duties & Responsibilities']):
+                description_parts.append(f"\n\n**Duties & Responsibilities:**\n{row['Duties & Responsibilities']}")
+            
+            description = '\n'.join(description_parts) if description_parts else 'No description available'
+            
+            # Build requirements
+            requirements_parts = []
+            if pd.notna(row['Qualifications']):
+                requirements_parts.append(f"**Qualifications:**\n{row['Qualifications']}")
+            if pd.notna(row['Skills & Knowledge']):
+                requirements_parts.append(f"\n**Skills & Knowledge:**\n{row['Skills & Knowledge']}")
+            if pd.notna(row['Languages Required']):
+                requirements_parts.append(f"\n**Languages Required:**\n{row['Languages Required']}")
+            
+            requirements = '\n'.join(requirements_parts) if requirements_parts else 'No specific requirements listed'
+            
+            records.append({
+                'title': row['Job Title'],
+                'company': row['Company Name'],
+                'location': row['Location'] if pd.notna(row['Location']) else 'Not specified',
+                'salary': row['Salary'] if pd.notna(row['Salary']) else 'Negotiable',
+                'job_type': row['Schedule'] if pd.notna(row['Schedule']) else 'Full-time',
+                'category': row['Career Category'] if pd.notna(row['Career Category']) else 'Other',
+                'description': description,
+                'requirements': requirements,
+                'logo': row['Company Logo'],  # Logo is guaranteed to exist
+                'contact_email': row['Contact Email'],
+                'contact_phone': row['Phone'],
+                'website': row['Website'],
+                'status': 'active',
+                'posted_date': row['Posting Date']  # Unparseable or missing dates become now
+            })
+        
+        # One COPY + INSERT ... SELECT instead of a commit per job
+        result = bulk_import_jobs(records)
+        imported = result['inserted']
+        failed = result['invalid']
+        if result['duplicates']:
+            print(f"⏭️  Duplicate title/company rows in CSV (skipped): {result['duplicates']}")
         
         print("\n" + "=" * 60)
         print("📊 IMPORT SUMMARY")
@@ -1,10 +1,39 @@
 """
 Manual scraper runner - for testing or manual runs
+
+Usage:
+    python run_scraper_now.py
+    python run_scraper_now.py --max-pages 5
+    python run_scraper_now.py --no-csv
+    python run_scraper_now.py --source bongthom   # one board (default: every board in SCRAPER_SOURCES, in parallel)
+    python run_scraper_now.py --base-url http://127.0.0.1:8010 --no-selenium --dry-run   # against scraper_fixture_server.py
 """
-from auto_scraper import BongThomScraper
+import argparse
+from app.utils.job_sources import available_sources
+from auto_scraper import run_sources
 
 if __name__ == "__main__":
-    print("\n🚀 Running BongThom scraper manually...")
-    scraper = BongThomScraper()
-    scraper.run()
+    parser = argparse.ArgumentParser(description='Run the job scraper once')
+    parser.add_argument('--source', action='append', choices=available_sources(),
+                        help='job board to scrape, repeat for several (default: SCRAPER_SOURCES)')
+    parser.add_argument('--max-pages', type=int, help='listing pages to walk at most (default: SCRAPER_MAX_PAGES, SCRAPER_INITIAL_MAX_PAGES on the first run)')
+    parser.add_argument('--base-url', help="site to scrape (default: the source's own, SCRAPER_BASE_URL for bongthom)")
+    parser.add_argument('--no-selenium', action='store_true', help='plain HTTP only, never start Chrome')
+    parser.add_argument('--dry-run', action='store_true', help='scrape only: no duplicate checks, CSV or import')
+    parser.add_argument('--no-csv', action='store_true', help="import without writing the audit CSV (default: SCRAPER_AUDIT_CSV)")
+    args = parser.parse_args()
+
+    if args.base_url and args.source and len(args.source) > 1:
+        parser.error('--base-url applies to a single --source')
+
+    print("\n🚀 Running job scraper manually...")
+    results = run_sources(args.source, max_pages=args.max_pages, base_url=args.base_url,
+                          use_selenium=not args.no_selenium, dry_run=args.dry_run,
+                          audit_csv=False if args.no_csv else None)
+    for name, summary in results.items():
+        if summary is None:
+            print(f"❌ {name}: failed (see scraper_logs.log)")
+        else:
+            print(f"📊 {name}: {summary['new']} new, {summary['duplicates']} duplicates, "
+                  f"{summary['failed']} failed in {summary['duration']:.1f}s")
     print("\n✅ Manual scrape complete!")
@@ -1,12 +1,18 @@
 """
 Job Scraper Scheduler
 Runs the auto scraper daily at a specified time
+
+Several replicas can run at once (docker compose up --scale worker=2):
+only the elected leader fires jobs, one replica at a time runs each job,
+and every run is recorded in job_runs (app/utils/scheduler_lock.py).
 """
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
-from auto_scraper import BongThomScraper
+from app import create_app, db
+from app.utils.scheduler_lock import LeaderElection, WORKER_ID, is_due, run_exclusive
+from auto_scraper import run_sources
 
 # Setup logging
 logging.basicConfig(
@@ -19,6 +25,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SCRAPER_JOB_ID = 'job_scraper'
+SCRAPER_INTERVAL = timedelta(days=2)  # matches the cron trigger below
+PDF_CACHE_JOB_ID = 'pdf_cache_prune'
+
 
 def run_scraper():
     """Execute the scraper"""
@@ -26,35 +36,111 @@ def run_scraper():
     logger.info("⏰ SCHEDULED SCRAPER TRIGGERED")
     logger.info("="*60 + "\n")
     
+    results = None
     try:
-        scraper = BongThomScraper()
-        scraper.run()
+        # Every source in SCRAPER_SOURCES, in parallel worker processes
+        results = run_sources()
+        failed = [name for name, summary in results.items() if summary is None]
+        if failed:
+            logger.error(f"❌ Scraper failed for: {', '.join(failed)}")
     except Exception as e:
         logger.error(f"❌ Scraper failed: {str(e)}", exc_info=True)
+    
+    rebuild_recommender()
+    prune_scrape_archive()
+    return results
+
+
+def rebuild_recommender():
+    """Refresh the offline recommender (ML API fallback) with the current jobs"""
+    try:
+        from app import create_app
+        from build_offline_recommender import build
+        app = create_app()
+        with app.app_context():
+            build()
+    except Exception as e:
+        logger.error(f"❌ Offline recommender build failed: {str(e)}", exc_info=True)
+
+
+def prune_scrape_archive():
+    """Drop archived pages older than SCRAPER_ARCHIVE_RETENTION_DAYS"""
+    try:
+        from app.utils.html_archive import SCRAPER_ARCHIVE_DIR, SCRAPER_ARCHIVE_RETENTION_DAYS, HtmlArchive
+        removed = HtmlArchive(SCRAPER_ARCHIVE_DIR).prune(SCRAPER_ARCHIVE_RETENTION_DAYS)
+        if removed['index_days']:
+            logger.info(f"🧹 Scrape archive: removed {removed['index_days']} index day(s) "
+                        f"and {removed['objects']} page(s) older than {SCRAPER_ARCHIVE_RETENTION_DAYS} days")
+    except Exception as e:
+        logger.error(f"❌ Scrape archive pruning failed: {str(e)}", exc_info=True)
+
+
+def prune_pdf_cache_job(app):
+    """Evict stale rendered CV PDFs (other template versions, unused, over the size cap)"""
+    from app.utils.cv_pdf import prune_pdf_cache
+    removed = prune_pdf_cache(
+        app.config['CV_PDF_CACHE_DIR'],
+        max_age_days=app.config.get('CV_PDF_CACHE_MAX_AGE_DAYS', 30),
+        max_mb=app.config.get('CV_PDF_CACHE_MAX_MB', 500)
+    )
+    logger.info(f"🧹 PDF cache: removed {removed['files']} file(s), {removed['bytes'] / 1024 / 1024:.1f} MB")
+    return removed
 
 
 if __name__ == "__main__":
+    app = create_app()
     scheduler = BlockingScheduler()
     
-    # Schedule to run every 2 days at 2:00 AM
+    # Schedule to run every 2 days at 2:00 AM; paused (next_run_time=None) until this replica is the leader
     scheduler.add_job(
-        run_scraper,
+        run_exclusive,
         CronTrigger(day='*/2', hour=2, minute=0),  # Run every 2 days at 2:00 AM
-        id='bongthom_scraper',
-        name='BongThom Daily Job Scraper',
-        replace_existing=True
+        args=[app, SCRAPER_JOB_ID, run_scraper],
+        id=SCRAPER_JOB_ID,
+        name='Daily Job Scraper',
+        replace_existing=True,
+        next_run_time=None
     )
     
-    logger.info("🚀 Scheduler started!")
-    logger.info("📅 Next run scheduled for: 2:00 AM daily")
-    logger.info("⏸️  Press Ctrl+C to stop the scheduler\n")
+    # Daily at 4:00 AM, after the scraper; also paused until elected
+    scheduler.add_job(
+        run_exclusive,
+        CronTrigger(hour=4, minute=0),
+        args=[app, PDF_CACHE_JOB_ID, lambda: prune_pdf_cache_job(app)],
+        id=PDF_CACHE_JOB_ID,
+        name='CV PDF Cache Pruning',
+        replace_existing=True,
+        next_run_time=None
+    )
+    
+    def on_elected():
+        scheduler.resume_job(SCRAPER_JOB_ID)
+        scheduler.resume_job(PDF_CACHE_JOB_ID)
+        # Instead of scraping on every startup: catch up only if no replica has scraped recently
+        with app.app_context():
+            due = is_due(SCRAPER_JOB_ID, SCRAPER_INTERVAL)
+        if due:
+            logger.info("▶️  No scraper run in the last 2 days, running it now...")
+            scheduler.add_job(run_exclusive, args=[app, SCRAPER_JOB_ID, run_scraper], kwargs={'trigger': 'catch_up'},
+                              id=f'{SCRAPER_JOB_ID}_catch_up', replace_existing=True)
+    
+    def on_demoted():
+        scheduler.pause_job(SCRAPER_JOB_ID)
+        scheduler.pause_job(PDF_CACHE_JOB_ID)
     
-    # Optionally run once immediately on startup
-    logger.info("▶️  Running scraper immediately on startup...")
-    run_scraper()
+    with app.app_context():
+        leader = LeaderElection(db.engine, on_elected=on_elected, on_demoted=on_demoted)
+    
+    logger.info(f"🚀 Scheduler started! ({WORKER_ID})")
+    logger.info("📅 Runs scheduled for: 2:00 AM every 2 days, on the elected leader")
+    logger.info("📅 PDF cache pruning: 4:00 AM daily")
+    logger.info("⏸️  Press Ctrl+C to stop the scheduler\n")
     
     # Start the scheduler
+    leader.start()
     try:
         scheduler.start()
     except (KeyboardInterrupt, SystemExit):
         logger.info("\n🛑 Scheduler stopped by user")
+    finally:
+        leader.stop()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Local stand-in for BongThom, serving saved HTML from scraper_fixtures/
+
+    /job_list.html?page=N       -> scraper_fixtures/job_list_N.html (an empty listing past the last page)
+    /job_detail/<name>.html     -> scraper_fixtures/job_detail/<name>.html
+    /stats                      -> requests served and peak concurrent requests
+
+Latency and failures can be injected to exercise the scraper's concurrency
+limits, rate limiting and retries.
+
+Usage:
+    python scraper_fixture_server.py                      # http://127.0.0.1:8010
+    python scraper_fixture_server.py --delay 0.5 --fail-rate 0.2
+
+Then run the scraper against it:
+    python run_scraper_now.py --base-url http://127.0.0.1:8010 --no-selenium --dry-run
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper_fixtures')
+
+EMPTY_LISTING = '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body><div class="job-list"></div></body></html>'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    options = None  # argparse namespace, set in main()
+    stats = {'requests': 0, 'in_flight': 0, 'peak_in_flight': 0}
+    stats_lock = threading.Lock()
+
+    def _send(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8'):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _fixture(self, *parts) -> str:
+        # Only plain file names, never paths out of the fixtures folder
+        if any(os.path.basename(part) != part or part.startswith('.') for part in parts):
+            return None
+        path = os.path.join(self.options.fixtures, *parts)
+        if not os.path.isfile(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/stats':
+            with self.stats_lock:
+                self._send(200, json.dumps(self.stats), 'application/json')
+            return
+
+        with self.stats_lock:
+            self.stats['requests'] += 1
+            self.stats['in_flight'] += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.stats['in_flight'])
+        try:
+            if self.options.delay:
+                time.sleep(self.options.delay)
+            if random.random() < self.options.fail_rate:
+                self._send(503, 'Injected failure', 'text/plain')
+                return
+
+            if url.path == '/job_list.html':
+                page = parse_qs(url.query).get('page', ['1'])[0]
+                self._send(200, self._fixture(f'job_list_{page}.html') or EMPTY_LISTING)
+            elif url.path.startswith('/job_detail/'):
+                html = self._fixture('job_detail', url.path[len('/job_detail/'):])
+                if html is None:
+                    self._send(404, 'Not Found', 'text/plain')
+                else:
+                    self._send(200, html)
+            else:
+                self._send(404, 'Not Found', 'text/plain')
+        finally:
+            with self.stats_lock:
+                self.stats['in_flight'] -= 1
+
+    def log_message(self, format, *args):
+        print(f"[fixtures] {self.address_string()} - {format % args}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve saved BongThom pages for scraper testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8010)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help=f'folder with saved pages (default: {FIXTURES_DIR})')
+    parser.add_argument('--delay', type=float, default=0, help='seconds to wait before answering')
+    parser.add_argument('--fail-rate', type=float, default=0, help='share of requests answered with 503 (0-1)')
+    FixtureHandler.options = parser.parse_args()
+
+    server = ThreadingHTTPServer((FixtureHandler.options.host, FixtureHandler.options.port), FixtureHandler)
+    print(f"🧪 Fixture site listening on http://{FixtureHandler.options.host}:{FixtureHandler.options.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
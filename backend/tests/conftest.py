@@ -0,0 +1,11 @@
+"""
+Shared pytest setup: run from backend/ with `python -m pytest tests`
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+FIXTURES_DIR = os.path.join(BACKEND_DIR, 'scraper_fixtures')
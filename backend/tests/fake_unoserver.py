@@ -0,0 +1,29 @@
+"""
+Stand-in for unoserver in tests: XML-RPC convert() that echoes the input,
+and never answers for a document containing b'hang'
+"""
+import argparse
+import time
+import xmlrpc.client
+from xmlrpc.server import SimpleXMLRPCServer
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--interface', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=2003)
+    parser.add_argument('--user-installation')
+    args = parser.parse_args()
+
+    def convert(inpath, indata, outpath, convert_to, *options):
+        if b'hang' in indata.data:
+            time.sleep(3600)
+        return xmlrpc.client.Binary(f'{convert_to}:'.encode() + indata.data)
+
+    server = SimpleXMLRPCServer((args.interface, args.port), allow_none=True, logRequests=False)
+    server.register_function(convert)
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
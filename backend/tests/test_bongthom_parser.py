@@ -0,0 +1,115 @@
+"""
+BongThom parser against the saved pages in scraper_fixtures/
+"""
+import os
+from datetime import datetime
+
+import pytest
+
+from app.utils.bongthom_parser import build_job_rows, parse_detail, parse_listing, parse_posting_date
+from app.utils.html_archive import HtmlArchive
+from tests.conftest import FIXTURES_DIR
+
+BASE_URL = 'https://www.bongthom.com'
+FETCHED_AT = datetime(2026, 1, 15, 2, 0)  # the scheduled 02:00 run
+
+
+def read_fixture(*parts):
+    with open(os.path.join(FIXTURES_DIR, *parts), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2 days ago', '2026-01-13'),
+    ('1 day ago', '2026-01-14'),
+    ('5 hours ago', '2026-01-15'),
+    ('30 minutes ago', '2026-01-15'),
+    ('Today', ''),
+    ('3 weeks ago', ''),
+])
+def test_parse_posting_date(text, expected):
+    assert parse_posting_date(text, FETCHED_AT) == expected
+
+
+def test_parse_posting_date_crosses_month():
+    assert parse_posting_date('2 days ago', datetime(2026, 3, 1, 2, 0)) == '2026-02-27'
+
+
+def test_parse_listing():
+    listings = parse_listing(read_fixture('job_list_1.html'), BASE_URL, FETCHED_AT)
+
+    assert [listing['url'] for listing in listings] == [
+        f'{BASE_URL}/job_detail/accountant_1001.html',
+        f'{BASE_URL}/job_detail/it_support_1002.html',
+        f'{BASE_URL}/job_detail/sales_1003.html',
+    ]
+    assert listings[0] == {
+        'url': f'{BASE_URL}/job_detail/accountant_1001.html',
+        'job_title': 'Accountant',
+        'company_name': 'Golden Rice Co., Ltd.',
+        'deadline': '31-Jan-2026',
+        'posting_date': '2026-01-13',
+    }
+    # No deadline on the listing: left for the detail page
+    assert listings[2]['deadline'] == ''
+    assert listings[2]['posting_date'] == '2026-01-14'
+
+
+def test_parse_listing_resolves_against_base_url():
+    listings = parse_listing(read_fixture('job_list_1.html'), 'http://127.0.0.1:8010/', FETCHED_AT)
+    assert listings[0]['url'] == 'http://127.0.0.1:8010/job_detail/accountant_1001.html'
+
+
+def test_parse_listing_without_jobs():
+    assert parse_listing('<html><body><p>No jobs</p></body></html>', BASE_URL, FETCHED_AT) == []
+
+
+def test_parse_detail():
+    detail = parse_detail(read_fixture('job_detail', 'accountant_1001.html'))
+
+    assert detail['contact_email'] == 'hr@accountant.com.kh'
+    assert detail['phone'] == '012 345 678'
+    assert detail['website'] == 'https://www.accountant.com.kh'
+    assert detail['deadline'] == '31-Jan-2026'
+    assert detail['logo_url'].endswith('/library/logos/accountant_1001.png')
+    assert len(detail['positions']) == 1
+    position = detail['positions'][0]
+    assert position['title'] == 'Senior Accountant'
+    assert position['location'] == 'Phnom Penh'
+    assert position['schedule'] == 'Full Time'
+    assert position['salary'] == '$800-$1200'
+    assert position['duties'].split(' | ')[1] == 'Report to the department manager'
+
+
+def test_parse_detail_with_several_positions():
+    detail = parse_detail(read_fixture('job_detail', 'it_support_1002.html'))
+    assert len(detail['positions']) == 2
+    assert all(position['title'] for position in detail['positions'])
+
+
+def test_parse_detail_without_positions():
+    assert parse_detail('<html><body><h1>Removed</h1></body></html>')['positions'] == []
+
+
+def test_build_job_rows():
+    listing = parse_listing(read_fixture('job_list_1.html'), BASE_URL, FETCHED_AT)[0]
+    rows = build_job_rows(listing, parse_detail(read_fixture('job_detail', 'accountant_1001.html')))
+
+    assert len(rows) == 1
+    assert rows[0]['Job Title'] == 'Senior Accountant'
+    assert rows[0]['Company Name'] == 'Golden Rice Co., Ltd.'
+    assert rows[0]['Posting Date'] == '2026-01-13'
+    assert rows[0]['Job URL'] == listing['url']
+
+
+def test_archived_listing_reparses_to_the_same_dates(tmp_path):
+    # reparse_archive.py passes the archived fetched_at; it must be the clock the live parse used
+    html = read_fixture('job_list_1.html')
+    live = parse_listing(html, BASE_URL, FETCHED_AT)
+
+    archive = HtmlArchive(str(tmp_path))
+    archive.store(f'{BASE_URL}/job_list.html?page=1', html, 'listing', fetched_at=FETCHED_AT)
+    entry = next(archive.iter_index(kind='listing'))
+
+    assert entry['fetched_at'] == FETCHED_AT
+    assert parse_listing(archive.load(entry['sha256']), BASE_URL, entry['fetched_at']) == live
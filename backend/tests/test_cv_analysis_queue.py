@@ -0,0 +1,75 @@
+"""
+CV analysis queue: the upload outlives every commit that fails
+"""
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from app import db
+from app.models import CV, CVAnalysis, CVKeyword, Profile, User
+from app.utils import cv_analysis_queue
+from app.utils.cv_analysis_queue import claim_next_analysis, process_analysis
+
+
+class ShortTextExtractor:
+    def extract_from_file(self, path):
+        return {'full_text': 'too short', 'extraction_method': 'pdftotext', 'parsed_fields': {}}
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'queue.db'}"
+    app.config['ANALYSIS_MAX_ATTEMPTS'] = 2
+    db.init_app(app)
+    monkeypatch.setattr(cv_analysis_queue, 'CVTextExtractor', ShortTextExtractor)
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[t.__table__ for t in (User, Profile, CV, CVKeyword, CVAnalysis)])
+        yield app
+
+
+@pytest.fixture
+def analysis(app, tmp_path):
+    user = User(email='dara@example.com', password_hash='x', fullname='Sok Dara')
+    db.session.add(user)
+    db.session.flush()
+    upload = tmp_path / 'upload.pdf'
+    upload.write_bytes(b'%PDF-1.4')
+    analysis = CVAnalysis(user_id=user.id, filename='cv.pdf', file_path=str(upload), status='queued', stage='queued')
+    db.session.add(analysis)
+    db.session.commit()
+    return analysis
+
+
+def test_upload_removed_after_the_result_is_committed(analysis):
+    upload = analysis.file_path
+    process_analysis(claim_next_analysis())
+
+    analysis = db.session.get(CVAnalysis, analysis.id)
+    assert analysis.status == 'failed' and analysis.file_path is None
+    assert not os.path.exists(upload)
+
+
+def test_upload_kept_when_the_commit_fails(analysis, monkeypatch):
+    upload = analysis.file_path
+    claimed = claim_next_analysis()
+
+    def commit():
+        raise RuntimeError('database went away')
+
+    monkeypatch.setattr(db.session, 'commit', commit)
+    with pytest.raises(RuntimeError):
+        process_analysis(claimed)
+    monkeypatch.undo()
+    db.session.rollback()
+
+    # Still 'processing' with its file: a later claim can retry it
+    analysis = db.session.get(CVAnalysis, analysis.id)
+    assert analysis.status == 'processing' and analysis.file_path == upload
+    assert os.path.exists(upload)
+
+    analysis.started_at = datetime.utcnow() - timedelta(hours=1)
+    db.session.commit()
+    assert claim_next_analysis().attempts == 2
@@ -0,0 +1,101 @@
+"""
+Background CV export queue, with SQLite standing in for Postgres
+"""
+import csv
+import io
+import os
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from app import db
+from app.models import CV, CVExport, Profile, User
+from app.utils.cv_export import claim_next_export, enqueue_export, expire_exports, process_export
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'export.db'}"
+    app.config['UPLOAD_FOLDER'] = str(tmp_path / 'uploads')
+    app.config['CV_PDF_CACHE_DIR'] = str(tmp_path / 'uploads' / 'pdf_cache')
+    app.config['CV_EXPORT_WORKERS'] = 1
+    db.init_app(app)
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[table.__table__ for table in (User, Profile, CV, CVExport)])
+        yield app
+
+
+@pytest.fixture
+def cvs(app):
+    user = User(email='dara@example.com', password_hash='x', fullname='Sok Dara')
+    db.session.add(user)
+    db.session.flush()
+    profile = Profile(user_id=user.id)
+    db.session.add(profile)
+    db.session.flush()
+    cvs = [
+        CV(profile_id=profile.id, name=f'CV {n}', file_path='', upload_date=datetime(2026, 1, n),
+           cv_builder_data={'fullname': 'Sok Dara', 'professional_summary': f'Version {n}'})
+        for n in (1, 2)
+    ]
+    db.session.add_all(cvs)
+    db.session.commit()
+    return user, [cv.id for cv in cvs]
+
+
+def test_export_is_built_by_the_worker(app, cvs):
+    user, cv_ids = cvs
+    export = enqueue_export(user.id, cv_ids)
+    assert export.to_dict()['status'] == 'queued'
+    assert export.to_dict()['download_url'] is None
+
+    claimed = claim_next_export()
+    assert claimed.id == export.id and claimed.status == 'processing' and claimed.attempts == 1
+    assert claim_next_export() is None
+
+    process_export(claimed)
+    export = db.session.get(CVExport, export.id)
+    assert export.status == 'completed', export.error
+    assert export.file_size == os.path.getsize(export.file_path)
+    assert export.to_dict()['download_url'] == f'/api/admin/cvs/exports/{export.id}/download'
+
+    with zipfile.ZipFile(export.file_path) as archive:
+        names = archive.namelist()
+        manifest = list(csv.DictReader(io.StringIO(archive.read('manifest.csv').decode('utf-8'))))
+    assert names[-1] == 'manifest.csv'
+    assert [name.rsplit('/', 1)[1] for name in names[:-1]] == ['CV_1.pdf', 'CV_2.pdf']
+    assert [row['source'] for row in manifest] == ['generated', 'generated']
+    assert not [name for name in os.listdir(os.path.dirname(export.file_path)) if name.endswith('.tmp')]
+
+
+def test_stale_export_is_retried_then_failed(app, cvs):
+    user, cv_ids = cvs
+    export = enqueue_export(user.id, cv_ids)
+    for attempt in (1, 2):
+        claimed = claim_next_export()
+        assert claimed.attempts == attempt
+        # Worker died mid-build
+        claimed.started_at = datetime.utcnow() - timedelta(hours=2)
+        db.session.commit()
+
+    assert claim_next_export() is None
+    export = db.session.get(CVExport, export.id)
+    assert export.status == 'failed'
+
+
+def test_expired_exports_are_deleted(app, cvs):
+    user, cv_ids = cvs
+    export = enqueue_export(user.id, cv_ids[:1])
+    process_export(claim_next_export())
+    path = db.session.get(CVExport, export.id).file_path
+
+    assert expire_exports() == 0
+    db.session.get(CVExport, export.id).finished_at = datetime.utcnow() - timedelta(days=2)
+    db.session.commit()
+
+    assert expire_exports() == 1
+    assert not os.path.exists(path)
+    assert db.session.get(CVExport, export.id).status == 'expired'
@@ -0,0 +1,39 @@
+"""
+Language section parsing (CVTextExtractor._extract_languages)
+"""
+import pytest
+
+from app.utils.cv_text_extractor import CVTextExtractor
+
+
+def languages(section):
+    return [(entry['language'], entry['proficiency']) for entry in CVTextExtractor()._extract_languages(section)]
+
+
+@pytest.mark.parametrize('section, expected', [
+    ('English: Fluent\nKhmer: Native\nFrench: Basic',
+     [('English', 'Native'), ('Khmer', 'Native'), ('French', 'Basic')]),
+    ('English, Khmer (native), Chinese',
+     [('English', 'Intermediate'), ('Khmer', 'Native'), ('Chinese', 'Intermediate')]),
+    ('English (fluent); Mandarin, Cambodian - native',
+     [('English', 'Native'), ('Chinese (Mandarin)', 'Intermediate'), ('Khmer', 'Native')]),
+    # A comma-separated item takes its first language in vocabulary order and is skipped if that one
+    # was already listed; the other language on the line is picked up by the line pass
+    ('English - Native, French and English - Intermediate',
+     [('English', 'Native'), ('French', 'Native')]),
+    ('French and English - Intermediate, Khmer',
+     [('English', 'Intermediate'), ('Khmer', 'Intermediate'), ('French', 'Intermediate')]),
+    ('• English - Advanced\n• Chinese and English - Basic, Thai',
+     [('English', 'Advanced'), ('Thai', 'Intermediate'), ('Chinese', 'Basic')]),
+])
+def test_extract_languages(section, expected):
+    assert languages(section) == expected
+
+
+def test_proficiency_words_match_whole_words_only():
+    # 'fluently' is not 'fluent', 'basically' is not 'basic'
+    assert languages('English: used fluently, basically every day') == [('English', 'Intermediate')]
+
+
+def test_no_section():
+    assert languages(None) == []
@@ -0,0 +1,56 @@
+"""
+Rendered CV PDF cache
+"""
+import os
+import time
+
+from app.utils import cv_pdf
+from app.utils.cv_pdf import prune_pdf_cache, render_cv_pdf
+
+CONTENT = {
+    'fullname': 'Sok Dara', 'email': 'dara@example.com', 'phone': None, 'location': 'Phnom Penh',
+    'summary': 'Accountant', 'educations': [], 'experiences': [], 'skills': [], 'languages': [],
+    'certifications': [],
+}
+
+
+def write(path, size=1024, age_days=0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'%' * size)
+    used = time.time() - age_days * 86400
+    os.utime(path, (used, used))
+    return path
+
+
+def test_render_is_cached_per_template_version(tmp_path):
+    path, etag = render_cv_pdf(CONTENT, str(tmp_path))
+    assert os.path.relpath(path, tmp_path).startswith(f'v{cv_pdf.TEMPLATE_VERSION}{os.sep}')
+    assert render_cv_pdf(CONTENT, str(tmp_path)) == (path, etag)
+
+
+def test_prune_removes_other_template_versions(tmp_path, monkeypatch):
+    path, _ = render_cv_pdf(CONTENT, str(tmp_path))
+    legacy = write(str(tmp_path / 'ab' / 'ab12.pdf'))  # layout before versioned folders
+
+    monkeypatch.setattr(cv_pdf, 'TEMPLATE_VERSION', cv_pdf.TEMPLATE_VERSION + 1)
+    assert prune_pdf_cache(str(tmp_path))['files'] == 2
+    assert not os.path.exists(path) and not os.path.exists(legacy)
+
+
+def test_prune_age_and_size_caps(tmp_path):
+    current = tmp_path / f'v{cv_pdf.TEMPLATE_VERSION}'
+    unused = write(str(current / 'aa' / 'unused.pdf'), age_days=40)
+    older = write(str(current / 'bb' / 'older.pdf'), size=600 * 1024, age_days=5)
+    newer = write(str(current / 'cc' / 'newer.pdf'), size=600 * 1024, age_days=1)
+
+    removed = prune_pdf_cache(str(tmp_path), max_age_days=30, max_mb=1)
+    assert removed == {'files': 2, 'bytes': 1024 + 600 * 1024}
+    assert not os.path.exists(unused) and not os.path.exists(older)
+    assert os.path.exists(newer)
+
+
+def test_prune_keeps_files_in_use(tmp_path):
+    just_sent = write(str(tmp_path / f'v{cv_pdf.TEMPLATE_VERSION}' / 'aa' / 'big.pdf'), size=2 * 1024 * 1024)
+    assert prune_pdf_cache(str(tmp_path), max_mb=1)['files'] == 0
+    assert os.path.exists(just_sent)
@@ -0,0 +1,76 @@
+"""
+DocConverter listener recovery when several processes share one listener
+
+Two DocConverter instances stand in for two processes: only the first one
+starts (owns) the listener.
+"""
+import os
+import socket
+import sys
+
+import pytest
+
+from app.utils.doc_converter import ConverterUnavailable, DocConverter
+from tests.conftest import BACKEND_DIR
+
+FAKE_UNOSERVER = os.path.join(BACKEND_DIR, 'tests', 'fake_unoserver.py')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def converters(tmp_path):
+    options = {
+        'port': free_port(),
+        'command': f'{sys.executable} {FAKE_UNOSERVER}',
+        'timeout': 2,
+        'pid_file': str(tmp_path / 'unoserver.pid'),
+    }
+    owner, other = DocConverter(**options), DocConverter(**options)
+    yield owner, other
+    for converter in (owner, other):
+        converter.shutdown()
+    other._kill_listener(other._read_pid())
+
+
+def document(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_any_process_replaces_a_hung_listener(converters, tmp_path):
+    owner, other = converters
+    ok = document(tmp_path, 'ok.doc', b'text')
+    hung = document(tmp_path, 'hung.doc', b'hang')
+
+    assert owner.convert(ok) == b'docx:text'
+    first_pid = owner._read_pid()
+    assert first_pid == owner._process.pid
+    assert other.convert(ok) == b'docx:text' and other._process is None
+
+    # The conversion hangs in the process that does not own the listener
+    with pytest.raises(ConverterUnavailable):
+        other.convert(hung)
+    assert owner._process.poll() is not None  # killed although another process started it
+
+    assert other.convert(ok) == b'docx:text'
+    second_pid = other._read_pid()
+    assert second_pid not in (None, first_pid) and second_pid == other._process.pid
+
+    # The former owner reaps its dead listener and uses the new one instead of killing it
+    assert owner.convert(ok) == b'docx:text'
+    assert owner._process is None and owner._read_pid() == second_pid and other._process.poll() is None
+
+
+def test_stale_pid_file_is_ignored(converters, tmp_path):
+    owner, _ = converters
+    with open(owner.pid_file, 'w') as f:
+        f.write(str(os.getpid()))  # not a unoserver: must not be killed
+
+    assert owner.convert(document(tmp_path, 'ok.doc', b'text')) == b'docx:text'
+    assert owner._read_pid() == owner._process.pid
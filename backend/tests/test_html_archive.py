@@ -0,0 +1,50 @@
+"""
+HtmlArchive retention
+"""
+import os
+import time
+from datetime import datetime
+
+from app.utils.html_archive import HtmlArchive
+
+NOW = datetime(2026, 6, 1, 2, 0)
+
+
+def age_objects(archive):
+    """Pretend every stored page was written long ago"""
+    old = time.time() - 30 * 86400
+    for dirpath, _, filenames in os.walk(os.path.join(archive.root, 'objects')):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (old, old))
+
+
+def test_prune_drops_old_days_and_unreferenced_pages(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    old_sha = archive.store('http://x/old', '<p>old</p>', 'detail', fetched_at=datetime(2026, 1, 1))
+    kept_sha = archive.store('http://x/kept', '<p>kept</p>', 'detail', fetched_at=datetime(2026, 1, 1))
+    # Re-fetched recently: still referenced by a day inside the retention window
+    archive.store('http://x/kept', '<p>kept</p>', 'detail', fetched_at=datetime(2026, 5, 20))
+    age_objects(archive)
+
+    assert archive.prune(30, now=NOW) == {'index_days': 1, 'objects': 1}
+    assert not os.path.exists(archive._object_path(old_sha))
+    assert archive.load(kept_sha) == '<p>kept</p>'
+    assert [entry['url'] for entry in archive.iter_index()] == ['http://x/kept']
+
+
+def test_prune_leaves_pages_written_during_a_scrape(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    archive.store('http://x/old', '<p>old</p>', 'detail', fetched_at=datetime(2026, 1, 1))
+    age_objects(archive)
+    # Object written moments ago, its index line not yet
+    fresh_sha = archive.store('http://x/new', '<p>new</p>', 'detail', fetched_at=datetime(2026, 1, 1))
+
+    assert archive.prune(30, now=datetime.now())['objects'] == 1
+    assert os.path.exists(archive._object_path(fresh_sha))
+
+
+def test_prune_disabled(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    archive.store('http://x/old', '<p>old</p>', 'detail', fetched_at=datetime(2026, 1, 1))
+    assert archive.prune(0, now=NOW) == {'index_days': 0, 'objects': 0}
+    assert len(list(archive.iter_index())) == 1
@@ -0,0 +1,114 @@
+"""
+ML client against ml_stub_server.py, with the recommendation cache in SQLite
+"""
+import json
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from app import db
+from app.models import MLRecommendationCache
+from app.utils.ml_client import MLClient, MLServiceError
+from tests.conftest import BACKEND_DIR
+
+CV_TEXT = 'Experienced Python developer, Docker and SQL.'
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_stub(*args):
+    port = free_port()
+    process = subprocess.Popen([sys.executable, 'ml_stub_server.py', '--port', str(port), *args],
+                               cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(50):
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1)
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    pytest.fail('ml_stub_server.py did not start')
+
+
+def requests_served(port):
+    with urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1) as response:
+        return json.load(response)['requests_served']
+
+
+@pytest.fixture
+def stub():
+    process, port = start_stub()
+    yield port
+    process.kill()
+    process.wait()
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'cache.db'}"
+    db.init_app(app)
+    with app.app_context():
+        MLRecommendationCache.__table__.create(db.engine)
+        yield app
+
+
+def client(port, **options):
+    return MLClient(url=f'http://127.0.0.1:{port}/upload', retries=0, **options)
+
+
+def test_recommend(app, stub):
+    recommendations = client(stub).recommend(CV_TEXT)
+    assert [r['job_title'] for r in recommendations] == ['Python Developer', 'DevOps Engineer', 'Database Administrator']
+
+
+def test_cache_is_shared_between_clients(app, stub):
+    # Two clients stand in for two API / worker processes
+    first = client(stub).recommend(CV_TEXT)
+    second = client(stub).recommend('  experienced python developer,\n docker and SQL. ')
+
+    assert second == first
+    assert requests_served(stub) == 1
+    assert db.session.get(MLRecommendationCache, MLClient.text_key(CV_TEXT)) is not None
+
+
+def test_expired_entries_are_not_served(app, stub):
+    client(stub).recommend(CV_TEXT)
+    entry = db.session.get(MLRecommendationCache, MLClient.text_key(CV_TEXT))
+    entry.expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+    client(stub).recommend(CV_TEXT)
+    assert requests_served(stub) == 2
+    assert MLRecommendationCache.query.count() == 1
+
+
+def test_failures_are_not_cached(app):
+    process, port = start_stub('--fail-rate', '1')
+    try:
+        with pytest.raises(MLServiceError):
+            client(port).recommend(CV_TEXT)
+        assert MLRecommendationCache.query.count() == 0
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_works_without_the_cache_table(stub):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        assert client(stub).recommend(CV_TEXT)
+        assert client(stub).recommend(CV_TEXT)
+    assert requests_served(stub) == 2
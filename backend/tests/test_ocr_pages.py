@@ -0,0 +1,56 @@
+"""
+OCR page pool: failed and hung pages, and the workers left behind by a hang
+"""
+import os
+import time
+
+import pytest
+
+from app.utils import cv_text_extractor
+from app.utils.cv_text_extractor import CVTextExtractor
+
+
+def fake_ocr_page(filepath, page_number, timeout, measure_rss=True):
+    if page_number == 2:
+        with open(filepath, 'w') as f:
+            f.write(str(os.getpid()))
+        time.sleep(600)  # hung Tesseract
+    if page_number == 3:
+        raise RuntimeError('PDFPopplerTimeoutError')
+    return f'text {page_number}', 0, {'ocr': 0.01}
+
+
+@pytest.fixture(autouse=True)
+def fake_pages(monkeypatch):
+    monkeypatch.setattr(cv_text_extractor, '_ocr_pdf_page', fake_ocr_page)
+    yield
+    cv_text_extractor._reset_ocr_pool()
+
+
+def pid_is_running(pid):
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+
+
+def test_failed_and_hung_pages_come_back_empty(tmp_path):
+    hung_pid_file = str(tmp_path / 'hung.pid')
+    extractor = CVTextExtractor(ocr_workers=2, ocr_page_timeout=1)
+
+    texts = extractor._ocr_pages(hung_pid_file, [1, 2, 3, 4, 5])
+
+    assert texts == ['text 1', '', '', 'text 4', 'text 5']
+    with open(hung_pid_file) as f:
+        hung_pid = int(f.read())
+    # terminate() may take a moment to reap the worker
+    deadline = time.monotonic() + 5
+    while pid_is_running(hung_pid) and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert not pid_is_running(hung_pid)
+
+
+def test_serial_path_keeps_other_pages(tmp_path):
+    extractor = CVTextExtractor(ocr_workers=1, ocr_page_timeout=1)
+    assert extractor._ocr_pages(str(tmp_path / 'cv.pdf'), [1, 3, 4]) == ['text 1', '', 'text 4']
@@ -0,0 +1,36 @@
+"""
+reparse_archive.py over an archive holding pages of several sources
+"""
+import os
+from datetime import datetime
+
+from app.utils.html_archive import HtmlArchive
+from reparse_archive import reparse
+from tests.conftest import FIXTURES_DIR
+
+BASE_URL = 'https://www.bongthom.com'
+FETCHED_AT = datetime(2026, 1, 15, 2, 0)
+
+
+def read_fixture(*parts):
+    with open(os.path.join(FIXTURES_DIR, *parts), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_reparse_only_reads_the_requested_source(tmp_path):
+    archive = HtmlArchive(str(tmp_path))
+    archive.store(f'{BASE_URL}/job_list.html?page=1', read_fixture('job_list_1.html'), 'listing',
+                  'bongthom', FETCHED_AT)
+    archive.store(f'{BASE_URL}/job_detail/accountant_1001.html', read_fixture('job_detail', 'accountant_1001.html'),
+                  'detail', 'bongthom', FETCHED_AT)
+    # Another board's pages: must not go through the BongThom parser
+    archive.store('https://jobs.example.com/list?page=1', read_fixture('job_list_2.html'), 'listing',
+                  'otherboard', FETCHED_AT)
+    archive.store('https://jobs.example.com/job/1', read_fixture('job_detail', 'it_support_1002.html'),
+                  'detail', 'otherboard', FETCHED_AT)
+
+    rows, stats = reparse(str(tmp_path), 'bongthom', workers=1)
+
+    assert stats == {'listing_pages': 1, 'detail_pages': 1, 'errors': 0, 'without_listing': 0}
+    assert [row['Job Title'] for row in rows] == ['Senior Accountant']
+    assert rows[0]['Posting Date'] == '2026-01-13'
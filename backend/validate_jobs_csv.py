@@ -5,9 +5,12 @@ Validate jobs.csv before importing to database
 This script checks:
 1. CSV column mapping to database
 2. Missing required fields
-3. Data quality issues
+3. Data quality issues (empty fields, duplicates, unparseable dates)
 4. Recommended cleaning actions
 
+All checks are column-wise masks (app/utils/job_cleaning.py), so large
+files validate in about a second.
+
 Usage:
     python validate_jobs_csv.py jobs.csv
     python validate_jobs_csv.py jobs.xlsx
@@ -16,38 +19,11 @@ Usage:
 import sys
 import os
 import pandas as pd
-from datetime import datetime
 
-# Database required fields
-REQUIRED_DB_FIELDS = {
-    'title': 'Job Title (NOT NULL)',
-    'company': 'Company Name (NOT NULL)',
-    'location': 'Location (NOT NULL)',
-    'job_type': 'Schedule/Job Type (NOT NULL)',
-    'category': 'Career Category (NOT NULL)',
-    'description': 'Description/Summary (NOT NULL)',
-}
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BACKEND_DIR)
 
-# CSV to Database column mapping
-CSV_TO_DB_MAPPING = {
-    'Job Title': 'title',
-    'Announcement Job Title': 'title',  # Fallback
-    'Company Name': 'company',
-    'Location': 'location',
-    'Office Address': 'location',  # Fallback
-    'Salary': 'salary',
-    'Schedule': 'job_type',
-    'Career Category': 'category',
-    'Announcement Description': 'description',
-    'Position Summary': 'description',  # Will be combined
-    'Duties & Responsibilities': 'description',  # Will be combined
-    'Qualifications': 'requirements',
-    'Skills & Knowledge': 'requirements',  # Will be combined
-    'Languages Required': 'requirements',  # Will be combined
-    'Company Logo': 'logo',
-    'Posting Date': 'posted_date',
-    'Deadline': 'deadline',
-}
+from app.utils.job_cleaning import CRITICAL_FIELDS, validate_jobs  # noqa: E402
 
 def validate_csv(file_path):
     """Validate CSV file structure and data"""
@@ -86,21 +62,18 @@ def validate_csv(file_path):
     for i, col in enumerate(df.columns, 1):
         print(f"{i:2}. {col}")
     
+    report = validate_jobs(df)
+    
     # Check column mapping
     print(f"\n{'='*70}")
     print(f"🔄 COLUMN MAPPING (CSV → Database)")
     print(f"{'='*70}")
     
-    mapped_columns = {}
-    unmapped_columns = []
-    
+    unmapped_columns = report['unmapped_columns']
     for csv_col in df.columns:
-        if csv_col in CSV_TO_DB_MAPPING:
-            db_col = CSV_TO_DB_MAPPING[csv_col]
-            mapped_columns[csv_col] = db_col
-            print(f"✅ {csv_col:35} → {db_col}")
+        if csv_col in report['mapped_columns']:
+            print(f"✅ {csv_col:35} → {report['mapped_columns'][csv_col]}")
         else:
-            unmapped_columns.append(csv_col)
             print(f"⚠️  {csv_col:35} → (NOT MAPPED - will be ignored)")
     
     # Check required fields coverage
@@ -108,20 +81,11 @@ def validate_csv(file_path):
     print(f"✅ REQUIRED FIELDS CHECK")
     print(f"{'='*70}")
     
-    covered_required = {}
-    missing_required = {}
-    
-    for db_field, description in REQUIRED_DB_FIELDS.items():
-        # Check if any CSV column maps to this DB field
-        csv_cols = [csv for csv, db in CSV_TO_DB_MAPPING.items() if db == db_field]
-        available_cols = [col for col in csv_cols if col in df.columns]
-        
-        if available_cols:
-            covered_required[db_field] = available_cols
-            print(f"✅ {db_field:20} ← {', '.join(available_cols)}")
-        else:
-            missing_required[db_field] = description
-            print(f"❌ {db_field:20} ← MISSING!")
+    missing_required = report['missing_required']
+    for db_field, available_cols in report['covered_required'].items():
+        print(f"✅ {db_field:20} ← {', '.join(available_cols)}")
+    for db_field in missing_required:
+        print(f"❌ {db_field:20} ← MISSING!")
     
     # Data quality checks
     print(f"\n{'='*70}")
@@ -131,34 +95,35 @@ def validate_csv(file_path):
     issues = []
     warnings = []
     
-    # Check for empty/null values in key fields
-    key_fields = ['Job Title', 'Announcement Job Title', 'Company Name', 'Location', 
-                  'Office Address', 'Career Category', 'Schedule']
-    
-    for field in key_fields:
-        if field in df.columns:
-            null_count = df[field].isna().sum()
-            empty_count = (df[field].astype(str).str.strip() == '').sum()
-            total_empty = null_count + empty_count
-            
-            if total_empty > 0:
-                pct = (total_empty / len(df)) * 100
-                if field in ['Job Title', 'Company Name']:
-                    issues.append(f"❌ {field}: {total_empty} empty ({pct:.1f}%) - CRITICAL!")
-                else:
-                    warnings.append(f"⚠️  {field}: {total_empty} empty ({pct:.1f}%)")
+    # Empty/null values in key fields
+    for field, total_empty in report['empty_counts'].items():
+        if total_empty > 0:
+            pct = (total_empty / len(df)) * 100
+            if field in CRITICAL_FIELDS:
+                issues.append(f"❌ {field}: {total_empty} empty ({pct:.1f}%) - CRITICAL!")
             else:
-                print(f"✅ {field}: No empty values")
+                warnings.append(f"⚠️  {field}: {total_empty} empty ({pct:.1f}%)")
+        else:
+            print(f"✅ {field}: No empty values")
+    
+    if report['unimportable_rows']:
+        print(f"❌ {report['unimportable_rows']} rows have no title or company and cannot be imported")
     
     # Check duplicate jobs
-    if 'Job Title' in df.columns and 'Company Name' in df.columns:
-        duplicates = df.duplicated(subset=['Job Title', 'Company Name'], keep=False)
-        dup_count = duplicates.sum()
-        if dup_count > 0:
-            warnings.append(f"⚠️  Duplicate jobs: {dup_count} rows (same title + company)")
-            print(f"⚠️  Found {dup_count} potential duplicate jobs")
-        else:
-            print(f"✅ No duplicate jobs found")
+    dup_count = report['duplicates']
+    if dup_count > 0:
+        warnings.append(f"⚠️  Duplicate jobs: {dup_count} rows (same title + company)")
+        print(f"⚠️  Found {dup_count} potential duplicate jobs")
+    elif 'Job Title' in df.columns and 'Company Name' in df.columns:
+        print(f"✅ No duplicate jobs found")
+    
+    # Dates the importer will not understand
+    for issue, field in (('bad_deadline', 'Deadline'), ('bad_posting_date', 'Posting Date')):
+        bad = report['issues'].get(issue, 0)
+        if bad > 0:
+            warnings.append(f"⚠️  {field}: {bad} unrecognised dates (imported without them)")
+        elif issue in report['issues']:
+            print(f"✅ {field}: All dates recognised")
     
     # Sample data preview
     print(f"\n{'='*70}")
@@ -77,10 +77,10 @@ export default async function handler(
         }
 
         const data = await backendResponse.json()
-        console.log('✅ CV Analysis Success')
+        console.log('✅ CV Analysis Queued:', data.analysis_id)
 
-        // Return the backend response
-        return res.status(200).json(data)
+        // Return the backend response (202 + analysis id, poll /api/analyze-cv/<id>)
+        return res.status(backendResponse.status).json(data)
 
     } catch (error: any) {
         console.error('❌ Proxy error:', error)
@@ -0,0 +1,33 @@
+import type { NextApiRequest, NextApiResponse } from 'next'
+import fetch from 'node-fetch'
+
+// Proxy CV analysis status polling to the Flask backend
+export default async function handler(
+    req: NextApiRequest,
+    res: NextApiResponse
+) {
+    if (req.method !== 'GET') {
+        return res.status(405).json({ error: 'Method not allowed' })
+    }
+
+    try {
+        const { id } = req.query
+        const backendUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5000'
+
+        const headers: any = {}
+        if (req.headers.authorization) {
+            headers['Authorization'] = req.headers.authorization
+        }
+
+        const backendResponse = await fetch(`${backendUrl}/api/analyze-cv/${encodeURIComponent(String(id))}`, { headers })
+        const data = await backendResponse.json()
+
+        return res.status(backendResponse.status).json(data)
+
+    } catch (error: any) {
+        console.error('❌ Proxy error:', error)
+        return res.status(500).json({
+            error: error.message || 'Failed to get CV analysis status'
+        })
+    }
+}
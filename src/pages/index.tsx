@@ -1815,27 +1815,53 @@ function MyJobsSection() {
 
       // Call our Flask backend with OCR support
       const controller = new AbortController()
-      const timeoutId = setTimeout(() => controller.abort(), 180000) // 3 minute timeout
+      const timeoutId = setTimeout(() => controller.abort(), 600000) // 10 minute timeout (upload + queued analysis)
 
       const token = localStorage.getItem('access_token')
+      const authHeaders: Record<string, string> = token ? { 'Authorization': `Bearer ${token}` } : {}
       const response = await fetch('/api/analyze-cv', {
         method: 'POST',
-        headers: token ? { 'Authorization': `Bearer ${token}` } : {},
+        headers: authHeaders,
         body: formData,
         signal: controller.signal
       })
 
-      clearTimeout(timeoutId)
-
       console.log('📥 API Response Status:', response.status, response.statusText)
 
       if (!response.ok) {
+        clearTimeout(timeoutId)
         const errorData = await response.json()
         console.error('❌ API Error Response:', errorData)
         throw new Error(errorData.error || `API returned ${response.status}`)
       }
 
-      const data = await response.json()
+      let data = await response.json()
+
+      // The backend queues the analysis (202): poll until the worker finishes it
+      if (response.status === 202 && data.analysis_id) {
+        console.log('⏳ CV analysis queued:', data.analysis_id)
+        while (true) {
+          await new Promise(resolve => setTimeout(resolve, 2000))
+          const statusResponse = await fetch(`/api/analyze-cv/${data.analysis_id}`, {
+            headers: authHeaders,
+            signal: controller.signal
+          })
+          const status = await statusResponse.json()
+          if (!statusResponse.ok) {
+            throw new Error(status.error || `API returned ${statusResponse.status}`)
+          }
+          console.log(`⏳ CV analysis ${status.status} (${status.stage})`)
+          if (status.status === 'completed') {
+            data = status.result
+            break
+          }
+          if (status.status === 'failed') {
+            throw new Error(status.error || 'CV analysis failed')
+          }
+        }
+      }
+
+      clearTimeout(timeoutId)
       console.log('✅ API Response Data:', data)
 
       // Extract data from ML response